@@ -0,0 +1,273 @@
+import json
+import os
+import re
+import threading
+import zlib
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from apps.scraper.models import VerificationCategory
+
+# Size of the hashed feature space (one float32 weight per feature: 1 MiB)
+N_FEATURES = 2 ** 18
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Words that state a verdict ("Es falso que...", "bulo") rather than describe the
+# claim. They are dropped so the model cannot learn the label from the wording
+# of a fact-check, which the texts scored by the analyzer do not have.
+VERDICT_WORDS = frozenset({
+    'falso', 'falsa', 'falsos', 'falsas', 'bulo', 'bulos', 'engañoso', 'engañosa',
+    'engañosos', 'engañosas', 'verdadero', 'verdadera', 'verdaderos', 'verdaderas',
+    'verdad', 'medias', 'desinformación', 'desmentido', 'desmiente', 'fake',
+    'factcheck', 'verificación', 'verificamos', 'newtral',
+})
+
+# Odd multiplier that mixes the hash of a word into the hash of the next one
+BIGRAM_MULTIPLIER = np.uint64(1000003)
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split a text into lowercase words, without the verdict words.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        List of words
+    """
+    return [word for word in TOKEN_PATTERN.findall(text.lower()) if word not in VERDICT_WORDS]
+
+@lru_cache(maxsize=2 ** 16)
+def word_hash(word: str) -> int:
+    """
+    Hash a word with CRC32.
+
+    CRC32 is used instead of hash() because it is stable across processes,
+    so a model trained in one process scores the same in any worker.
+
+    Args:
+        word (str): Lowercase word
+
+    Returns:
+        Unsigned 32-bit hash
+    """
+    return zlib.crc32(word.encode('utf-8'))
+
+def hash_features(text: str, n_features: int = N_FEATURES) -> np.ndarray:
+    """
+    Map the words and word pairs of a text to the indices of the hashed feature space.
+
+    Only words are hashed in Python; the hashes of word pairs are combined
+    from them with numpy.
+
+    Args:
+        text (str): Text to vectorize
+        n_features (int): Size of the feature space
+
+    Returns:
+        Sorted array with the distinct feature indices present in the text
+    """
+    words = tokenize(text)
+    if not words:
+        return np.empty(0, dtype=np.int64)
+    unigrams = np.fromiter(map(word_hash, words), dtype=np.uint64, count=len(words))
+    bigrams = (unigrams[:-1] * BIGRAM_MULTIPLIER) ^ unigrams[1:]
+    features = np.concatenate((unigrams, bigrams)) % np.uint64(n_features)
+    return np.unique(features).astype(np.int64)
+
+class CredibilityModel:
+    """
+    Naive Bayes credibility model over hashed word features.
+
+    Stores one log-likelihood ratio per feature (credible vs dubious) and the
+    log prior ratio, so scoring a document is a sum of the weights of its
+    features: a gather and a dot product with numpy, a few microseconds per
+    document. The weights are saved as a plain .npy array and loaded with
+    mmap, so every worker process shares the same pages of memory.
+    """
+
+    def __init__(self, weights: np.ndarray, bias: float, metadata: Optional[Dict] = None):
+        """
+        Initialize the model.
+
+        Args:
+            weights (np.ndarray): Log-likelihood ratio of each hashed feature
+            bias (float): Log prior ratio of the credible class
+            metadata (dict, optional): Training information (documents, accuracy...)
+        """
+        self.weights = weights
+        self.bias = float(bias)
+        self.metadata = metadata or {}
+
+    @property
+    def n_features(self) -> int:
+        return len(self.weights)
+
+    @classmethod
+    def train(cls, texts: Iterable[str], labels: Iterable[int], n_features: int = N_FEATURES,
+              alpha: float = 1.0) -> 'CredibilityModel':
+        """
+        Fit the model with Laplace smoothing.
+
+        Args:
+            texts (iterable): Training documents
+            labels (iterable): 1 for credible documents, 0 for dubious ones
+            n_features (int): Size of the hashed feature space
+            alpha (float): Additive smoothing
+
+        Returns:
+            Trained CredibilityModel
+        """
+        counts = np.zeros((2, n_features), dtype=np.float64)
+        documents = np.zeros(2, dtype=np.int64)
+        for text, label in zip(texts, labels):
+            label = int(label)
+            # Indices are unique per document, so a fancy-index increment is exact
+            counts[label, hash_features(text, n_features)] += 1
+            documents[label] += 1
+
+        if not documents.all():
+            raise ValueError("Training needs documents of both classes")
+
+        # Multinomial naive Bayes over the presence of each feature in a document
+        smoothed = counts + alpha
+        log_probabilities = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+        weights = (log_probabilities[1] - log_probabilities[0]).astype(np.float32)
+        bias = float(np.log(documents[1]) - np.log(documents[0]))
+
+        return cls(weights, bias, {
+            'credible_documents': int(documents[1]),
+            'dubious_documents': int(documents[0]),
+            'n_features': n_features,
+        })
+
+    def decision(self, text: str) -> float:
+        """
+        Get the log-odds of a document being credible.
+
+        Args:
+            text (str): Document
+
+        Returns:
+            Log-odds (positive means credible)
+        """
+        return self.bias + float(self.weights[hash_features(text, self.n_features)].sum(dtype=np.float64))
+
+    def score(self, text: str) -> float:
+        """
+        Get the probability of a document being credible.
+
+        Args:
+            text (str): Document
+
+        Returns:
+            Probability between 0 and 1
+        """
+        return float(1.0 / (1.0 + np.exp(-np.clip(self.decision(text), -30, 30))))
+
+    def score_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Score several documents at once.
+
+        Args:
+            texts (sequence): Documents
+
+        Returns:
+            Array with the probability of each document being credible
+        """
+        features = [hash_features(text, self.n_features) for text in texts]
+        if not features:
+            return np.empty(0, dtype=np.float64)
+        documents = np.repeat(np.arange(len(features)), [len(indices) for indices in features])
+        # Sparse matrix-vector product: gather the weights of every feature and sum them per document
+        decisions = self.bias + np.bincount(
+            documents, weights=self.weights[np.concatenate(features)], minlength=len(features)
+        )
+        return 1.0 / (1.0 + np.exp(-np.clip(decisions, -30, 30)))
+
+    def save(self, path: str) -> None:
+        """
+        Save the weights as an .npy array (bias last) and the metadata next to it.
+
+        Args:
+            path (str): Path of the .npy file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        array = np.append(self.weights, np.float32(self.bias)).astype(np.float32)
+        temporary_path = f"{path}.tmp.npy"
+        np.save(temporary_path, array)
+        os.replace(temporary_path, path)
+
+        metadata = dict(self.metadata, bias=self.bias, saved_at=datetime.now(timezone.utc).isoformat())
+        with open(metadata_path(path), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'CredibilityModel':
+        """
+        Load a saved model, memory-mapping the weights.
+
+        Args:
+            path (str): Path of the .npy file
+
+        Returns:
+            CredibilityModel
+        """
+        array = np.load(path, mmap_mode='r')
+        metadata = {}
+        if os.path.exists(metadata_path(path)):
+            with open(metadata_path(path), encoding='utf-8') as f:
+                metadata = json.load(f)
+        return cls(array[:-1], float(array[-1]), metadata)
+
+def metadata_path(path: str) -> str:
+    """Path of the JSON metadata saved next to a model file."""
+    return os.path.splitext(path)[0] + '.json'
+
+def label_for_category(category: str) -> Optional[int]:
+    """
+    Get the training label of a verification category.
+
+    Args:
+        category (str): Verification category name
+
+    Returns:
+        1 (credible), 0 (dubious) or None if the category is not used for training
+    """
+    if category in VerificationCategory.CREDIBLE_NAMES:
+        return 1
+    if category in VerificationCategory.DUBIOUS_NAMES:
+        return 0
+    return None
+
+# Loaded models by path, reloaded when the file changes
+_models = {}
+_models_lock = threading.Lock()
+
+def get_model(path: str) -> Optional[CredibilityModel]:
+    """
+    Get the model saved at a path, loading it once per process.
+
+    Args:
+        path (str): Path of the .npy file
+
+    Returns:
+        CredibilityModel, or None if no model has been trained yet
+    """
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    with _models_lock:
+        cached = _models.get(path)
+        if cached is None or cached[0] != modified:
+            cached = (modified, CredibilityModel.load(path))
+            _models[path] = cached
+        return cached[1]
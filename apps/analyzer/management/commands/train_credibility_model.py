@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+import logging
+import time
+import zlib
+from apps.analyzer.credibility_model import CredibilityModel, N_FEATURES, label_for_category
+from apps.scraper.models import FactCheckArticle
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Trains the credibility model of the analyzer from the claims and verdicts of the stored articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Path of the model file (defaults to the CREDIBILITY_MODEL_PATH setting)'
+        )
+        parser.add_argument(
+            '--features',
+            type=int,
+            default=N_FEATURES,
+            help='Size of the hashed feature space'
+        )
+        parser.add_argument(
+            '--alpha',
+            type=float,
+            default=1.0,
+            help='Additive smoothing of the feature counts'
+        )
+        parser.add_argument(
+            '--holdout',
+            type=int,
+            default=20,
+            help='Percentage of articles held out to measure the accuracy (0 to skip)'
+        )
+
+    def handle(self, *args, **options):
+        output = options['output'] or settings.CREDIBILITY_MODEL_PATH
+        texts, labels, held_out = [], [], []
+
+        # Only the checked claim: the title and body of a fact-check state its
+        # verdict, which would leak the label into the features
+        rows = FactCheckArticle.objects.exclude(claim='').values_list(
+            'url', 'claim', 'verification_category__name'
+        ).iterator(chunk_size=1000)
+        for url, claim, category in rows:
+            label = label_for_category(category)
+            if label is None:
+                continue
+            texts.append(claim)
+            labels.append(label)
+            # Split by URL hash so the holdout is the same on every run
+            held_out.append(zlib.crc32(url.encode('utf-8')) % 100 < options['holdout'])
+
+        if len(set(labels)) < 2:
+            raise CommandError("Training needs articles with both true and false verdicts")
+
+        metadata = {}
+        if any(held_out) and not all(held_out):
+            train = [i for i, test in enumerate(held_out) if not test]
+            test = [i for i, test in enumerate(held_out) if test]
+            try:
+                model = CredibilityModel.train(
+                    [texts[i] for i in train], [labels[i] for i in train],
+                    n_features=options['features'], alpha=options['alpha']
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+            scores = model.score_many([texts[i] for i in test])
+            correct = sum((score >= 0.5) == bool(labels[i]) for score, i in zip(scores, test))
+            metadata = {'holdout_documents': len(test), 'holdout_accuracy': float(correct) / len(test)}
+
+        # The saved model is trained on every article
+        started = time.perf_counter()
+        model = CredibilityModel.train(texts, labels, n_features=options['features'], alpha=options['alpha'])
+        elapsed = time.perf_counter() - started
+        model.metadata.update(metadata)
+        model.save(output)
+
+        self.stdout.write(self.style.SUCCESS(f"Credibility model saved to {output}"))
+        self.stdout.write(f"  Articles: {len(texts)} ({sum(labels)} credible, {len(labels) - sum(labels)} dubious)")
+        self.stdout.write(f"  Training time: {elapsed:.2f}s")
+        if metadata:
+            self.stdout.write(f"  Holdout accuracy: {metadata['holdout_accuracy']:.1%} ({metadata['holdout_documents']} articles)")
+        self.stdout.write(f"  Model size: {(model.n_features + 1) * 4 / 1024:.0f} KiB")
@@ -1,4 +1,49 @@
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Optional
+from django.conf import settings
+from apps.scraper.reputation import get_source_reputation_index
+from apps.scraper.utils.names import normalize_name
+
+# Potentially credible sources
+CREDIBLE_SOURCES = [
+    # International news agencies
+    'reuters', 'afp', 'associated press', 'ap',
+
+    # Leading Spanish media outlets
+    'el país', 'el mundo', 'la vanguardia', 'abc', 'efe', 'agencia efe',
+    'cadena ser', 'rtve', '20minutos',
+
+    # Leading Internationl media outlets
+    'bbc', 'cnn', 'the guardian', 'the new york times', 'washington post',
+    'le monde', 'der spiegel',
+
+    # Verified digital media outlets
+    'newtral', 'maldita.es', 'verificat.cat', 'fact-checking',
+]
+
+# Sources with low credibility or potential misinformation
+LOW_CREDIBILITY_SOURCES = [
+    # Far-right media or outlets known for misinformation
+    'okdiario', 'libertad digital', 'periodista digital',
+    'caso aislado', 'alerta digital', 'la gaceta',
+
+    # Sources of conspiracies or misinformation
+    'infolibre', 'vozpópuli', 'elmundo.es', 'elconfidencial',
+
+    # Highly polarized foreign media
+    'fox news', 'breitbart', 'infowars', 'zerohedge',
+
+    # Unverified social media and platforms
+    'facebook', 'twitter', 'instagram', 'tiktok', 'telegram',
+    'youtube', 'blog', 'foro', 'reddit'
+]
+
+# Known names found anywhere in the normalized source ("Reuters España",
+# "según El País"), each list compiled into a single pattern
+CREDIBLE_SOURCES_PATTERN = re.compile('|'.join(re.escape(normalize_name(name)) for name in CREDIBLE_SOURCES))
+LOW_CREDIBILITY_SOURCES_PATTERN = re.compile(
+    '|'.join(re.escape(normalize_name(name)) for name in LOW_CREDIBILITY_SOURCES)
+)
 
 class ContentAnalysisService:
     """
@@ -25,7 +70,7 @@ class ContentAnalysisService:
                 'title': self._analyze_title(title),
                 'author': self._analyze_author(author),
                 'source': self._analyze_source(source),
-                'content': self._analyze_content(content)
+                'content': self._analyze_content(content, title)
             }
         }
         
@@ -87,66 +132,60 @@ class ContentAnalysisService:
         """Source analysis."""
         if not source:
             return {'score': 30, 'feedback': 'Fuente no especificada'}
-        
-        # Source credibility checks
-        score = 60  
+
+        # Track record of the source in the stored fact-checks
+        reputation = get_source_reputation_index().lookup(source)
+        if reputation is not None and reputation.credible_articles + reputation.dubious_articles:
+            rated = reputation.credible_articles + reputation.dubious_articles
+            return {
+                'score': round(reputation.credibility * 100),
+                'feedback': (
+                    f'Fuente verificada {rated} veces: '
+                    f'{reputation.dubious_articles / rated:.0%} de afirmaciones falsas o engañosas'
+                )
+            }
+
+        # Sources without fact-checks: known outlets and platforms mentioned in the source
+        score = 60
         feedback = []
-        
-        # Expanded list of potentially credible sources
-        credible_sources = [
-            # International news agencies
-            'reuters', 'afp', 'associated press', 'ap', 
-            
-            # Leading Spanish media outlets
-            'el país', 'el mundo', 'la vanguardia', 'abc', 'efe', 'agencia efe', 
-            'cadena ser', 'rtve', '20minutos', 
-            
-            # Leading Internationl media outlets
-            'bbc', 'cnn', 'the guardian', 'the new york times', 'washington post', 
-            'le monde', 'der spiegel', 'reuters', 'associated press', 
-            
-            # Verified digital media outlets
-            'newtral', 'maldita.es', 'verificat.cat', 'fact-checking', 
-        ]
-        
-        # List of sources with low credibility or potential misinformation
-        low_credibility_sources = [
-            # Far-right media or outlets known for misinformation
-            'okdiario', 'libertad digital', 'periodista digital', 
-            'caso aislado', 'alerta digital', 'la gaceta', 
-            
-            # Sources of conspiracies or misinformation
-            'infolibre', 'vozpópuli', 'elmundo.es', 'elconfidencial', 
-            
-            # Highly polarized foreign media
-            'fox news', 'breitbart', 'infowars', 'zerohedge', 
-            
-            # Unverified social media and platforms
-            'facebook', 'twitter', 'instagram', 'tiktok', 'telegram', 
-            'youtube', 'blog', 'foro', 'reddit'
-        ]
-        
-        source_lower = source.lower()
-        
-        # Check for credible sources
-        if any(credible_word in source_lower for credible_word in credible_sources):
+        name = normalize_name(source)
+
+        if CREDIBLE_SOURCES_PATTERN.search(name):
             score += 20
             feedback.append('Fuente reconocida')
-        
-        # Check for low credibility sources
-        if any(low_source in source_lower for low_source in low_credibility_sources):
+
+        if LOW_CREDIBILITY_SOURCES_PATTERN.search(name):
             score -= 30
             feedback.append('Fuente con historial de desinformación')
-        
+
         return {
             'score': max(0, min(score, 100)),
             'feedback': ' | '.join(feedback) if feedback else 'Fuente con credibilidad moderada'
         }
     
-    def _analyze_content(self, content: str) -> Dict[str, Any]:
+    def _get_credibility_model(self):
+        """
+        Get the credibility model trained from the stored verdicts.
+
+        numpy is only imported here, so the analyzer views stay cheap to import.
+
+        Returns:
+            CredibilityModel, or None if no model has been trained
+        """
+        path = getattr(settings, 'CREDIBILITY_MODEL_PATH', None)
+        if not path:
+            return None
+        from .credibility_model import get_model
+        return get_model(path)
+
+    def _analyze_content(self, content: str, title: Optional[str] = None) -> Dict[str, Any]:
         """Content analysis."""
         if not content:
             return {'score': 0, 'feedback': 'Contenido ausente'}
+
+        model = self._get_credibility_model()
+        if model is not None:
+            return self._score_with_model(model, f"{title or ''}\n{content}")
         
         # Simple content analysis
         score = 50  
@@ -212,7 +251,18 @@ class ContentAnalysisService:
             'feedback': ' | '.join(feedback) if feedback else 'Contenido aceptable'
         }
     
-    
+    def _score_with_model(self, model, text: str) -> Dict[str, Any]:
+        """Content analysis with the learned credibility model."""
+        score = round(model.score(text) * 100)
+
+        if score >= 70:
+            feedback = 'Contenido similar al de afirmaciones verificadas como ciertas'
+        elif score >= 40:
+            feedback = 'Contenido sin rasgos claros de afirmaciones verdaderas ni falsas'
+        else:
+            feedback = 'Contenido similar al de afirmaciones verificadas como falsas o engañosas'
+
+        return {'score': score, 'feedback': feedback}
     
     def _generate_summary(self, results: Dict) -> str:
         """Generate a summary based on analysis results."""
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+from django.core.management import call_command
+from apps.analyzer.credibility_model import CredibilityModel, get_model, tokenize
+from apps.analyzer.services import ContentAnalysisService
+from apps.scraper.models import FactCheckArticle, VerificationCategory
+
+CREDIBLE = [
+    "El paro bajó en marzo según los datos oficiales del Ministerio de Trabajo",
+    "El INE confirma que la inflación se moderó en el último trimestre",
+    "Los datos oficiales de Sanidad muestran que la vacunación superó el 90%",
+    "Según el Banco de España, la deuda pública bajó dos décimas",
+]
+DUBIOUS = [
+    "Un vídeo viral asegura que las vacunas contienen un chip secreto",
+    "Es un bulo que el Gobierno vaya a prohibir el dinero en efectivo",
+    "Circula en redes un mensaje falso que asegura que el agua del grifo es veneno",
+    "El vídeo viral manipulado asegura que el apagón fue un sabotaje secreto",
+]
+
+@pytest.fixture
+def model():
+    return CredibilityModel.train(CREDIBLE + DUBIOUS, [1] * len(CREDIBLE) + [0] * len(DUBIOUS), n_features=2 ** 12)
+
+def test_model_separates_verdicts(model):
+    """
+    Tests that the trained model scores unseen texts like the verdicts they resemble.
+    """
+    assert model.score("Los datos oficiales del INE confirman que el paro bajó") > 0.5
+    assert model.score("Un vídeo viral asegura un complot secreto con las vacunas") < 0.5
+    assert model.weights.dtype == np.float32
+
+def test_score_many_matches_score(model):
+    """
+    Tests that batch scoring gives the same probabilities as scoring one text at a time.
+    """
+    texts = CREDIBLE + DUBIOUS + ["", "texto sin palabras conocidas"]
+
+    expected = [model.score(text) for text in texts]
+
+    assert np.allclose(model.score_many(texts), expected)
+
+def test_saved_model_is_memory_mapped(model, tmp_path):
+    """
+    Tests that a saved model loads as a memory map with the same scores.
+    """
+    path = str(tmp_path / "credibility.npy")
+    model.save(path)
+
+    loaded = get_model(path)
+
+    assert isinstance(loaded.weights, np.memmap)
+    assert loaded is get_model(path)
+    assert loaded.metadata['credible_documents'] == len(CREDIBLE)
+    assert loaded.score(DUBIOUS[0]) == pytest.approx(model.score(DUBIOUS[0]), abs=1e-6)
+    assert get_model(str(tmp_path / "missing.npy")) is None
+
+def test_verdict_words_are_ignored(model):
+    """
+    Tests that the words stating a verdict do not reach the features.
+    """
+    assert tokenize("Es FALSO que sea un bulo engañoso") == ['es', 'que', 'sea', 'un']
+    assert model.score("Es falso que el paro bajó") == pytest.approx(model.score("Es que el paro bajó"))
+
+def test_analyzer_uses_the_model(model, tmp_path, settings):
+    """
+    Tests that the analyzer scores content with the model and falls back to heuristics without it.
+    """
+    settings.CREDIBILITY_MODEL_PATH = str(tmp_path / "credibility.npy")
+    service = ContentAnalysisService()
+    content = DUBIOUS[0] * 3
+
+    heuristic = service._analyze_content(content)
+    model.save(settings.CREDIBILITY_MODEL_PATH)
+    learned = service._analyze_content(content)
+
+    assert heuristic['score'] == 50
+    assert learned['score'] < 40
+    assert 'falsas' in learned['feedback']
+
+@pytest.mark.django_db
+def test_train_command_saves_model(tmp_path, capsys):
+    """
+    Tests that the training command fits the model from the stored verdicts.
+    """
+    categories = {
+        name: VerificationCategory.objects.create(name=name)
+        for name in ('Verdadero', 'Falso', 'Sin categoría')
+    }
+    for i, text in enumerate(CREDIBLE + DUBIOUS + ["Artículo sin veredicto"]):
+        category = 'Verdadero' if text in CREDIBLE else 'Falso' if text in DUBIOUS else 'Sin categoría'
+        FactCheckArticle.objects.create(
+            title=text[:50], url=f"https://www.newtral.es/articulo-{i}/", claim=text,
+            claim_source="Redes sociales", content=text, verification_category=categories[category]
+        )
+    path = str(tmp_path / "credibility.npy")
+
+    call_command('train_credibility_model', output=path, features=2 ** 12, holdout=0)
+
+    model = CredibilityModel.load(path)
+    assert model.n_features == 2 ** 12
+    assert model.metadata['dubious_documents'] == len(DUBIOUS)
+    assert f"Articles: {len(CREDIBLE) + len(DUBIOUS)}" in capsys.readouterr().out
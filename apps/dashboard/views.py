@@ -1,4 +1,7 @@
 from django.shortcuts import render
+from django.views.decorators.cache import cache_page
 
+# The home page is static, so the whole response is cached
+@cache_page(60 * 15)
 def home(request):
     return render(request, 'dashboard/home.html')
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import VerificationCategory, FactCheckArticle
+from .models import (
+    VerificationCategory, FactCheckArticle, ScrapeRun, SourceReputation, ClaimSource, ClaimSourceAlias, Author
+)
+from .pagination import EstimatedCountPaginator
 
 @admin.register(VerificationCategory)
 class VerificationCategoryAdmin(admin.ModelAdmin):
@@ -18,6 +21,12 @@ class FactCheckArticleAdmin(admin.ModelAdmin):
     """
     list_display = ('title', 'verification_text', 'claim_source', 'publish_date')
     list_filter = ('verification_category',)  
+    list_select_related = ('verification_category',)
+    
+    # Avoid counting the whole table on every changelist page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
     search_fields = ('title', 'claim', 'claim_source', 'content', 'tags')
     readonly_fields = ('title', 'url', 'publish_date', 'author', 'verification_category', 
                        'claim', 'claim_source', 'content', 'tags', 'scraped_at')
@@ -38,7 +47,93 @@ class FactCheckArticleAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Skips the large text fields in the changelist, which does not show them"""
+        queryset = super().get_queryset(request)
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            queryset = queryset.defer('content', 'claim')
+        return queryset
+
     def verification_text(self, obj):
         """Displays the verification category name as plain text"""
         return obj.verification_category.name if obj.verification_category else "-"
     verification_text.short_description = 'Verification'
+
+@admin.register(ScrapeRun)
+class ScrapeRunAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the ScrapeRun model.
+    """
+    list_display = ('started_at', 'source', 'duration_text', 'total_articles', 'new_articles',
+                    'failed_articles', 'articles_per_second', 'bytes_fetched', 'retries', 'robots_denials')
+    list_filter = ('source',)
+    date_hierarchy = 'started_at'
+    readonly_fields = ('source', 'started_at', 'finished_at', 'total_articles', 'new_articles',
+                       'updated_articles', 'failed_articles', 'articles_per_second', 'bytes_fetched',
+                       'retries', 'robots_denials', 'browser_fetches', 'http_fetches', 'http_cache_hits',
+                       'http_cache_bytes_saved', 'timings')
+
+    fieldsets = (
+        ('Run', {
+            'fields': ('source', 'started_at', 'finished_at')
+        }),
+        ('Articles', {
+            'fields': ('total_articles', 'new_articles', 'updated_articles', 'failed_articles',
+                       'articles_per_second')
+        }),
+        ('Network', {
+            'fields': ('bytes_fetched', 'retries', 'robots_denials', 'browser_fetches', 'http_fetches',
+                       'http_cache_hits', 'http_cache_bytes_saved')
+        }),
+        ('Timings', {
+            'fields': ('timings',),
+            'classes': ('collapse',)
+        }),
+    )
+
+    def duration_text(self, obj):
+        """Displays the duration of the run in seconds"""
+        return f"{obj.duration:.1f}s" if obj.duration is not None else "-"
+    duration_text.short_description = 'Duration'
+
+    def has_add_permission(self, request):
+        """Runs are only created by the scrapers"""
+        return False
+
+@admin.register(SourceReputation)
+class SourceReputationAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the SourceReputation model.
+    """
+    list_display = ('source', 'total_articles', 'credible_articles', 'dubious_articles', 'updated_at')
+    list_select_related = ('source',)
+    search_fields = ('source__display_name', 'source__name')
+    readonly_fields = ('source', 'total_articles', 'credible_articles', 'dubious_articles', 'updated_at')
+
+    def has_add_permission(self, request):
+        """The table is rebuilt from the articles after each scrape"""
+        return False
+
+class ClaimSourceAliasInline(admin.TabularInline):
+    """
+    Inline admin for the aliases of a claim source.
+    """
+    model = ClaimSourceAlias
+    extra = 1
+
+@admin.register(ClaimSource)
+class ClaimSourceAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the ClaimSource model.
+    """
+    list_display = ('display_name', 'name')
+    search_fields = ('display_name', 'name', 'aliases__alias')
+    inlines = (ClaimSourceAliasInline,)
+
+@admin.register(Author)
+class AuthorAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the Author model.
+    """
+    list_display = ('display_name', 'name')
+    search_fields = ('display_name', 'name')
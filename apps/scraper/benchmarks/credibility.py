@@ -0,0 +1,54 @@
+import time
+from bs4 import BeautifulSoup
+from .utils import load_article_fixtures, summarize
+
+def run_credibility_benchmark(iterations=200):
+    """
+    Measure the scoring time of the credibility model per document.
+
+    A small model is trained on the claims and verdicts of the recorded
+    articles and then scores their text one at a time (score) and as a
+    batch (score_many).
+
+    Args:
+        iterations (int): Times the documents are scored per variant
+
+    Returns:
+        dict: Timing summary in microseconds per document, by variant
+    """
+    # numpy is only loaded when the suite runs
+    from apps.analyzer.credibility_model import CredibilityModel, label_for_category
+
+    fixtures = load_article_fixtures()
+    claims, labels = [], []
+    for fixture in fixtures:
+        label = label_for_category(fixture['expected']['verification_category'])
+        if label is not None:
+            claims.append(fixture['expected']['claim'])
+            labels.append(label)
+    model = CredibilityModel.train(claims, labels)
+    documents = [BeautifulSoup(fixture['html'], 'html.parser').get_text(' ', strip=True) for fixture in fixtures]
+    results = {}
+
+    samples = []
+    for _ in range(iterations):
+        for document in documents:
+            start = time.perf_counter()
+            model.score(document)
+            samples.append(time.perf_counter() - start)
+    results['score'] = {'per_document_us': summarize(samples, scale=1_000_000)}
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        model.score_many(documents)
+        samples.append((time.perf_counter() - start) / len(documents))
+    results['score_many'] = {'per_document_us': summarize(samples, scale=1_000_000)}
+
+    return {
+        'suite': 'credibility',
+        'documents': len(documents),
+        'words': sum(len(document.split()) for document in documents) // len(documents),
+        'iterations': iterations,
+        'results': results,
+    }
@@ -0,0 +1,57 @@
+import time
+from ..utils import dates
+from .utils import load_date_fixtures, summarize
+
+def run_dates_benchmark(iterations=200):
+    """
+    Measure date normalization time per string on the recorded Newtral dates.
+
+    Compares parsing every string from scratch, the memoized normalize_date
+    and the batch normalize_dates over a column with repeated values.
+
+    Args:
+        iterations (int): Times the corpus is normalized per variant
+
+    Returns:
+        dict: Timing summary in microseconds per date string, by variant
+    """
+    corpus = [text for text, _ in load_date_fixtures()]
+    parse_known_formats = dates._parse_known_formats.__wrapped__
+    results = {}
+
+    # Every string parsed from scratch, without the memo cache
+    samples = []
+    for _ in range(iterations):
+        for text in corpus:
+            start = time.perf_counter()
+            text = text.strip()
+            parse_known_formats(text) or dates._parse_with_dateutil(text)
+            samples.append(time.perf_counter() - start)
+    results['uncached'] = {'per_date_us': summarize(samples, scale=1_000_000)}
+
+    # Repeated strings served by the memo cache
+    dates.clear_cache()
+    samples = []
+    for _ in range(iterations):
+        for text in corpus:
+            start = time.perf_counter()
+            dates.normalize_date(text)
+            samples.append(time.perf_counter() - start)
+    results['cached'] = {'per_date_us': summarize(samples, scale=1_000_000)}
+
+    # A whole column at once, as when normalizing a listing or a table
+    dates.clear_cache()
+    column = corpus * iterations
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        dates.normalize_dates(column)
+        samples.append((time.perf_counter() - start) / len(column))
+    results['batch'] = {'per_date_us': summarize(samples, scale=1_000_000)}
+
+    return {
+        'suite': 'dates',
+        'dates': len(corpus),
+        'iterations': iterations,
+        'results': results,
+    }
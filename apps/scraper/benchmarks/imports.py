@@ -0,0 +1,122 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from .utils import summarize
+
+# Project root, where manage.py lives
+BASE_DIR = Path(__file__).resolve().parents[3]
+
+# Import time budget (ms) of the modules loaded at manage.py startup and worker boot,
+# measured after django.setup()
+IMPORT_BUDGETS_MS = {
+    'core.urls': 150,
+    'apps.scraper.services': 500,
+    'apps.scraper.management.commands.scrape_newtral': 600,
+}
+
+# Wall time budget (ms) of a whole `manage.py check` process
+STARTUP_BUDGET_MS = 2000
+
+# Dependencies that must only be imported when a browser or async client is used
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'fake_useragent', 'httpx')
+
+def measure_import(module, python=sys.executable):
+    """
+    Measure the import of a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module (str): Dotted module name
+        python (str): Python executable
+
+    Returns:
+        tuple: (cumulative import time in seconds, heavy packages loaded by the process)
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'core.settings'))
+    # Modules imported by django.setup() are excluded, they are already in sys.modules
+    code = f"import django; django.setup(); import {module}"
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', code],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+    cumulative_us = None
+    heavy = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, _, name = line.split('|', 2)
+        name = name.strip()
+        if name == module:
+            cumulative_us = int(line.split('|')[1])
+        top_level = name.split('.')[0]
+        if top_level in HEAVY_MODULES:
+            heavy.add(top_level)
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No import time reported for {module}")
+    return cumulative_us / 1_000_000, sorted(heavy)
+
+def measure_startup(python=sys.executable):
+    """
+    Measure the wall time of a `manage.py check` process.
+
+    Args:
+        python (str): Python executable
+
+    Returns:
+        float: Seconds from process start to exit
+    """
+    start = time.perf_counter()
+    subprocess.run(
+        [python, 'manage.py', 'check'],
+        cwd=BASE_DIR, capture_output=True, check=True
+    )
+    return time.perf_counter() - start
+
+def run_imports_benchmark(iterations=3, modules=None):
+    """
+    Measure the import time of the startup modules and check their budgets.
+
+    Each measurement runs in a new interpreter, so nothing is cached in memory
+    (bytecode files are, as in production).
+
+    Args:
+        iterations (int): Fresh interpreters started per module
+        modules (dict, optional): Budget in ms by module name. Defaults to IMPORT_BUDGETS_MS.
+
+    Returns:
+        dict: Import time summary in milliseconds by module, and the budget violations
+    """
+    modules = modules or IMPORT_BUDGETS_MS
+    results = {}
+    violations = []
+
+    for module, budget_ms in modules.items():
+        samples = []
+        heavy = set()
+        for _ in range(iterations):
+            seconds, imported = measure_import(module)
+            samples.append(seconds)
+            heavy.update(imported)
+
+        summary = summarize(samples)
+        results[module] = {'import_ms': summary}
+        # The fastest run is the least affected by machine noise
+        if min(samples) * 1000 > budget_ms:
+            violations.append(f"{module} takes {min(samples) * 1000:.0f} ms to import (budget {budget_ms} ms)")
+        if heavy:
+            violations.append(f"{module} imports {', '.join(sorted(heavy))}")
+
+    samples = [measure_startup() for _ in range(iterations)]
+    results['manage.py check'] = {'wall_ms': summarize(samples)}
+    if min(samples) * 1000 > STARTUP_BUDGET_MS:
+        violations.append(f"manage.py check takes {min(samples) * 1000:.0f} ms (budget {STARTUP_BUDGET_MS} ms)")
+
+    return {
+        'suite': 'imports',
+        'iterations': iterations,
+        'results': results,
+        'violations': violations,
+    }
@@ -0,0 +1,54 @@
+import logging
+import time
+from bs4 import FeatureNotFound
+from ..scrapers.newtral import NewtralScraper
+from .utils import load_article_fixtures, summarize
+
+logger = logging.getLogger(__name__)
+
+def run_parsing_benchmark(parsers=('html.parser', 'lxml'), iterations=20):
+    """
+    Measure parse and extraction time per article on the recorded pages.
+
+    Args:
+        parsers (tuple): BeautifulSoup parser backends to compare
+        iterations (int): Times each fixture page is processed per parser
+
+    Returns:
+        dict: Timing summary in milliseconds per article, by parser
+    """
+    fixtures = load_article_fixtures()
+    results = {}
+
+    for parser in parsers:
+        scraper = NewtralScraper(respect_robots=False, parser=parser)
+        parse_times = []
+        extract_times = []
+
+        try:
+            for _ in range(iterations):
+                for fixture in fixtures:
+                    start = time.perf_counter()
+                    soup = scraper.make_soup(fixture['html'])
+                    parsed = time.perf_counter()
+                    scraper.extract_article(soup, fixture['url'])
+                    extracted = time.perf_counter()
+
+                    parse_times.append(parsed - start)
+                    extract_times.append(extracted - parsed)
+        except FeatureNotFound:
+            logger.warning(f"Parser '{parser}' is not installed, skipping it")
+            continue
+
+        results[parser] = {
+            'parse_ms': summarize(parse_times),
+            'extract_ms': summarize(extract_times),
+            'total_ms': summarize([p + e for p, e in zip(parse_times, extract_times)]),
+        }
+
+    return {
+        'suite': 'parsing',
+        'articles': len(fixtures),
+        'iterations': iterations,
+        'results': results,
+    }
@@ -0,0 +1,140 @@
+import logging
+import platform
+import time
+import tracemalloc
+from contextlib import nullcontext
+from django.db import connection, transaction
+from django.utils import timezone
+from ..scrapers.newtral import NewtralScraper
+from ..services import ScraperService
+from ..utils.rate_limiter import RateLimiter
+from .stub_server import FixtureServer, LISTING_PATH
+from .utils import summarize
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('fetch', 'parse', 'extract', 'persist')
+
+def _measure_peak_memory(func, items):
+    """
+    Measure the peak memory allocated while applying a function to some items.
+
+    Args:
+        func (callable): Function applied to each item
+        items (list): Items to process
+
+    Returns:
+        float: Peak allocated memory in KiB
+    """
+    tracemalloc.start()
+    try:
+        for item in items:
+            func(item)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+def _stage_report(samples, peak_memory_kb):
+    """Build the report of a stage from its duration samples."""
+    total = sum(samples)
+    return {
+        'count': len(samples),
+        'throughput_per_s': round(len(samples) / total, 1) if total else None,
+        'latency_ms': summarize(samples),
+        'peak_memory_kb': peak_memory_kb,
+    }
+
+def run_pipeline_benchmark(iterations=5, persist=True, parser=None):
+    """
+    Run the fetch, parse, extract and persist stages on the recorded pages.
+
+    Pages are served by a local stub server, so the benchmark needs neither
+    network access nor a browser. Articles are persisted inside a transaction
+    that is rolled back at the end, leaving the database untouched.
+
+    Args:
+        iterations (int): Times each article of the listing page is processed
+        persist (bool): Whether to measure the persist stage (needs a database)
+        parser (str, optional): BeautifulSoup parser backend
+
+    Returns:
+        dict: Throughput, latency percentiles and peak memory by stage
+    """
+    samples = {stage: [] for stage in STAGES}
+    memory = {}
+    persist_error = None
+
+    if persist:
+        try:
+            connection.ensure_connection()
+        except Exception as e:
+            logger.warning(f"Database not available, skipping persist stage: {e}")
+            persist, persist_error = False, str(e)
+
+    with FixtureServer() as server:
+        scraper = NewtralScraper(
+            respect_robots=False,
+            max_retries=1,
+            parser=parser,
+            rate_limiter=RateLimiter(default_rate=1e9, burst=10 ** 9),
+        )
+        service = ScraperService()
+
+        # Discover the articles from the listing page
+        listing = scraper.get_page(server.url_for(LISTING_PATH))
+        article_urls = scraper.parse_listing(listing.text)
+        logger.info(f"Benchmarking {len(article_urls)} articles x {iterations} iterations")
+
+        with transaction.atomic() if persist else nullcontext():
+            for _ in range(iterations):
+                for url in article_urls:
+                    start = time.perf_counter()
+                    response = scraper.get_page(server.url_for(url))
+                    fetched = time.perf_counter()
+                    soup = scraper.make_soup(response.text)
+                    parsed = time.perf_counter()
+                    article = scraper.extract_article(soup, url)
+                    extracted = time.perf_counter()
+
+                    samples['fetch'].append(fetched - start)
+                    samples['parse'].append(parsed - fetched)
+                    samples['extract'].append(extracted - parsed)
+
+                    if persist:
+                        service.save_article(article)
+                        samples['persist'].append(time.perf_counter() - extracted)
+
+            # Memory is measured in a separate pass, as tracing slows everything down
+            pages = [scraper.get_page(server.url_for(url)).text for url in article_urls]
+            soups = [scraper.make_soup(html) for html in pages]
+            articles = [scraper.extract_article(soup, url) for soup, url in zip(soups, article_urls)]
+
+            memory['fetch'] = _measure_peak_memory(lambda url: scraper.get_page(server.url_for(url)), article_urls)
+            memory['parse'] = _measure_peak_memory(scraper.make_soup, pages)
+            memory['extract'] = _measure_peak_memory(
+                lambda pair: scraper.extract_article(*pair), list(zip(soups, article_urls))
+            )
+            if persist:
+                memory['persist'] = _measure_peak_memory(service.save_article, articles)
+
+            # Leave the database as it was
+            if persist:
+                transaction.set_rollback(True)
+
+    stages = {}
+    for stage in STAGES:
+        if stage == 'persist' and not persist:
+            stages[stage] = {'skipped': persist_error or 'disabled'}
+        else:
+            stages[stage] = _stage_report(samples[stage], memory.get(stage))
+
+    return {
+        'suite': 'pipeline',
+        'created_at': timezone.now().isoformat(),
+        'python': platform.python_version(),
+        'parser': scraper.parser,
+        'articles': len(article_urls),
+        'iterations': iterations,
+        'stages': stages,
+    }
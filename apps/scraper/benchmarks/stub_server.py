@@ -0,0 +1,126 @@
+import logging
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from .utils import load_article_fixtures, load_listing_fixture
+
+logger = logging.getLogger(__name__)
+
+LISTING_PATH = "/zona-verificacion/fact-check/"
+
+class FixtureServer:
+    """
+    Local HTTP server that serves the recorded Newtral pages.
+
+    The listing page is served at its real path. Article paths are served
+    with their recorded page when there is one, and any other article path
+    gets one of the recorded pages, so every link of the listing resolves.
+
+    Usage:
+        with FixtureServer() as server:
+            scraper.get_page(server.url_for("https://www.newtral.es/..."))
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        """
+        Initialize the server.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on (0 picks a free port).
+        """
+        self.host = host
+        self.port = port
+        self.pages = {LISTING_PATH: load_listing_fixture().encode('utf-8')}
+        self.articles = []
+        for fixture in load_article_fixtures():
+            body = fixture['html'].encode('utf-8')
+            self.pages[urlparse(fixture['url']).path] = body
+            self.articles.append(body)
+        self.server = None
+        self.thread = None
+
+    def get_body(self, path):
+        """
+        Get the page served for a path.
+
+        Args:
+            path (str): Requested path
+
+        Returns:
+            bytes: Page body, or None if the path is not a page
+        """
+        path = urlparse(path).path
+        if path in self.pages:
+            return self.pages[path]
+        if path.rstrip('/').count('/') >= 2:
+            return self.articles[zlib.crc32(path.encode('utf-8')) % len(self.articles)]
+        return None
+
+    def _make_handler(self):
+        """Build the request handler class bound to this server."""
+        fixture_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = fixture_server.get_body(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self):
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.server.server_address[1]}"
+
+    def url_for(self, url):
+        """
+        Rewrite a newtral.es URL so it points to this server.
+
+        Args:
+            url (str): Original URL
+
+        Returns:
+            str: Same path on the local server
+        """
+        parsed = urlparse(url)
+        path = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        return f"{self.base_url}{path}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self.server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Fixture server listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,64 @@
+import json
+import statistics
+from pathlib import Path
+from ..utils.metrics import percentile
+
+# Recorded Newtral pages used by the offline tests and benchmarks
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / 'tests' / 'fixtures' / 'newtral'
+
+def load_article_fixtures():
+    """
+    Load the recorded article pages.
+
+    Returns:
+        list: Dictionaries with the 'url', 'html' and 'expected' fields of each article
+    """
+    with open(FIXTURES_DIR / 'articles.json', encoding='utf-8') as f:
+        index = json.load(f)
+
+    fixtures = []
+    for entry in index:
+        html = (FIXTURES_DIR / entry['file']).read_text(encoding='utf-8')
+        fixtures.append({'url': entry['url'], 'html': html, 'expected': entry['expected']})
+    return fixtures
+
+def summarize(samples, scale=1000):
+    """
+    Summarize timing samples measured in seconds.
+
+    Args:
+        samples (list): Durations in seconds
+        scale (int): Multiplier applied to the results (1000 gives milliseconds)
+
+    Returns:
+        dict: Count, mean, p50, p99 and max of the samples
+    """
+    if not samples:
+        return {'count': 0, 'mean': 0, 'p50': 0, 'p99': 0, 'max': 0}
+
+    return {
+        'count': len(samples),
+        'mean': round(statistics.fmean(samples) * scale, 3),
+        'p50': round(percentile(samples, 50) * scale, 3),
+        'p99': round(percentile(samples, 99) * scale, 3),
+        'max': round(max(samples) * scale, 3),
+    }
+
+def load_listing_fixture():
+    """
+    Load the recorded fact-check listing page.
+
+    Returns:
+        str: HTML of the listing page
+    """
+    return (FIXTURES_DIR / 'listing.html').read_text(encoding='utf-8')
+
+def load_date_fixtures():
+    """
+    Load the recorded Newtral date strings.
+
+    Returns:
+        list: (date string, expected ISO date or None) pairs
+    """
+    with open(FIXTURES_DIR / 'dates.json', encoding='utf-8') as f:
+        return [tuple(entry) for entry in json.load(f)]
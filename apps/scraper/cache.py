@@ -0,0 +1,33 @@
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+# Version of the statistics data; changing it makes every cached copy obsolete
+STATISTICS_VERSION_KEY = 'statistics:version'
+
+def get_statistics_version():
+    """
+    Get the current version of the statistics data.
+
+    Cached statistics (query results and template fragments) include this
+    version in their keys, so they are discarded when it changes.
+
+    Returns:
+        int: Version of the statistics data
+    """
+    return cache.get_or_set(STATISTICS_VERSION_KEY, time.time_ns, timeout=None)
+
+def invalidate_statistics():
+    """
+    Make the cached statistics obsolete (e.g. after a scrape saved new articles).
+
+    Returns:
+        int: New version of the statistics data
+    """
+    version = time.time_ns()
+    cache.set(STATISTICS_VERSION_KEY, version, timeout=None)
+    return version
+
+def get_statistics_timeout():
+    """Get the maximum time in seconds that statistics are cached."""
+    return getattr(settings, 'STATISTICS_CACHE_TIMEOUT', 3600)
@@ -0,0 +1,145 @@
+import logging
+from .models import Author, ClaimSource, ClaimSourceAlias
+from .utils.names import SOURCE_ALIASES, normalize_name
+
+logger = logging.getLogger(__name__)
+
+# Canonical names longer than the columns are cut, like the display names
+SOURCE_NAME_LENGTH = ClaimSource._meta.get_field('name').max_length
+AUTHOR_NAME_LENGTH = Author._meta.get_field('name').max_length
+
+class EntityResolver:
+    """
+    Resolve the free-text claim sources and authors of articles to canonical rows.
+
+    Resolved names are kept in memory, so a run that saves many articles with
+    the same sources only queries the database for the names it has not seen.
+    prefetch() resolves a whole batch of articles with a few bulk queries.
+    """
+
+    def __init__(self, aliases=SOURCE_ALIASES):
+        """
+        Initialize the resolver.
+
+        Args:
+            aliases (dict): Canonical name by normalized alias, used for the
+                aliases that are not in the alias table.
+        """
+        self.aliases = aliases
+        # Primary key by canonical name
+        self.sources = {}
+        self.authors = {}
+        # Source primary key by normalized alias, loaded on first use
+        self.source_aliases = None
+
+    def source_name(self, value):
+        """
+        Get the canonical name of a claim source.
+
+        Args:
+            value (str): Claim source as written in the article
+
+        Returns:
+            str: Canonical normalized name ('' for empty values)
+        """
+        name = normalize_name(value)
+        return self.aliases.get(name, name)[:SOURCE_NAME_LENGTH].rstrip()
+
+    def author_name(self, value):
+        """
+        Get the canonical name of an author.
+
+        Args:
+            value (str): Author as written in the article
+
+        Returns:
+            str: Normalized name ('' for empty values)
+        """
+        return normalize_name(value)[:AUTHOR_NAME_LENGTH].rstrip()
+
+    def source_id(self, value):
+        """
+        Get the primary key of the ClaimSource of a claim source, creating it if needed.
+
+        Args:
+            value (str): Claim source as written in the article
+
+        Returns:
+            int or None if the value is empty
+        """
+        alias_id = self._get_source_aliases().get(normalize_name(value))
+        if alias_id is not None:
+            return alias_id
+
+        name = self.source_name(value)
+        if not name:
+            return None
+        if name not in self.sources:
+            self._create(ClaimSource, self.sources, {name: value.strip()})
+        return self.sources[name]
+
+    def author_id(self, value):
+        """
+        Get the primary key of the Author of an article, creating it if needed.
+
+        Args:
+            value (str): Author as written in the article
+
+        Returns:
+            int or None if the value is empty
+        """
+        name = self.author_name(value)
+        if not name:
+            return None
+        if name not in self.authors:
+            self._create(Author, self.authors, {name: value.strip()})
+        return self.authors[name]
+
+    def prefetch(self, articles):
+        """
+        Resolve the sources and authors of a batch of articles at once.
+
+        Args:
+            articles (iterable): Article dictionaries with 'claim_source' and 'author'
+        """
+        source_aliases = self._get_source_aliases()
+        sources, authors = {}, {}
+        for article in articles:
+            claim_source = article.get('claim_source') or ''
+            if normalize_name(claim_source) not in source_aliases:
+                name = self.source_name(claim_source)
+                if name and name not in self.sources:
+                    sources.setdefault(name, claim_source.strip())
+            author = article.get('author') or ''
+            name = self.author_name(author)
+            if name and name not in self.authors:
+                authors.setdefault(name, author.strip())
+
+        if sources:
+            self._create(ClaimSource, self.sources, sources)
+        if authors:
+            self._create(Author, self.authors, authors)
+
+    def _get_source_aliases(self):
+        """Load the alias table the first time it is needed."""
+        if self.source_aliases is None:
+            self.source_aliases = dict(ClaimSourceAlias.objects.values_list('alias', 'source_id'))
+        return self.source_aliases
+
+    def _create(self, model, cache, names):
+        """
+        Get or create the rows of a model for some canonical names and cache their keys.
+
+        Args:
+            model: ClaimSource or Author
+            cache (dict): Primary key by canonical name
+            names (dict): Display name by canonical name
+        """
+        max_length = model._meta.get_field('display_name').max_length
+        model.objects.bulk_create(
+            [model(name=name, display_name=display_name[:max_length]) for name, display_name in names.items()],
+            batch_size=500,
+            # Rows created meanwhile by another process are kept
+            ignore_conflicts=True
+        )
+        cache.update(model.objects.filter(name__in=list(names)).values_list('name', 'id'))
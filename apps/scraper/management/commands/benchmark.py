@@ -0,0 +1,101 @@
+from django.core.management.base import BaseCommand, CommandError
+import json
+import logging
+from apps.scraper.benchmarks.credibility import run_credibility_benchmark
+from apps.scraper.benchmarks.dates import run_dates_benchmark
+from apps.scraper.benchmarks.imports import run_imports_benchmark
+from apps.scraper.benchmarks.parsing import run_parsing_benchmark
+from apps.scraper.benchmarks.pipeline import run_pipeline_benchmark
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Runs offline scraper benchmarks on the recorded fixture pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'suite',
+            choices=['parsing', 'pipeline', 'dates', 'imports', 'credibility'],
+            help='Benchmark suite to run'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=None,
+            help='Number of times each fixture is processed'
+        )
+        parser.add_argument(
+            '--parser',
+            action='append',
+            dest='parsers',
+            help='HTML parser backend to measure (can be repeated)'
+        )
+        parser.add_argument(
+            '--no-persist',
+            action='store_true',
+            help='Skips the database stage of the pipeline benchmark'
+        )
+        parser.add_argument(
+            '--output',
+            help='Path of a JSON file where results are saved'
+        )
+
+    def handle(self, *args, **options):
+        suite = options['suite']
+        self.stdout.write(self.style.NOTICE(f"Running '{suite}' benchmark"))
+
+        try:
+            if suite == 'parsing':
+                results = run_parsing_benchmark(
+                    parsers=options['parsers'] or ('html.parser', 'lxml'),
+                    iterations=options['iterations'] or 20
+                )
+                sections = results['results']
+            elif suite == 'imports':
+                results = run_imports_benchmark(iterations=options['iterations'] or 3)
+                sections = results['results']
+            elif suite == 'dates':
+                results = run_dates_benchmark(iterations=options['iterations'] or 200)
+                sections = results['results']
+            elif suite == 'credibility':
+                results = run_credibility_benchmark(iterations=options['iterations'] or 200)
+                sections = results['results']
+            else:
+                results = run_pipeline_benchmark(
+                    iterations=options['iterations'] or 5,
+                    persist=not options['no_persist'],
+                    parser=(options['parsers'] or [None])[0]
+                )
+                sections = {'stages': results['stages']}
+        except Exception as e:
+            logger.error(f"Error running benchmark: {e}")
+            raise CommandError(f"Error running benchmark: {e}")
+
+        # Show results
+        for section, entries in sections.items():
+            self.stdout.write(self.style.SUCCESS(f"{section}:"))
+            for name, summary in entries.items():
+                unit = 'µs' if name.endswith('_us') else 'ms'
+                self.stdout.write(f"  {name}: {self._format_summary(summary, unit)}")
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Results saved to {options['output']}")
+
+        # Import budgets fail the command, so it can guard startup time in CI
+        if results.get('violations'):
+            for violation in results['violations']:
+                self.stdout.write(self.style.ERROR(f"  {violation}"))
+            raise CommandError(f"{len(results['violations'])} startup budget(s) exceeded")
+
+    def _format_summary(self, summary, unit='ms'):
+        """Formats a timing summary as a single line."""
+        if 'skipped' in summary:
+            return f"skipped ({summary['skipped']})"
+
+        latency = summary.get('latency_ms', summary)
+        line = f"mean {latency['mean']:.3f} {unit}, p50 {latency['p50']:.3f} {unit}, p99 {latency['p99']:.3f} {unit}"
+        if 'throughput_per_s' in summary:
+            line += f", {summary['throughput_per_s']}/s, peak memory {summary['peak_memory_kb']} KiB"
+        return line
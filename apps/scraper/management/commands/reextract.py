@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+import logging
+import os
+import time
+from apps.scraper.cache import invalidate_statistics
+from apps.scraper.reextract import reextract_archive
+from apps.scraper.services import ScraperService
+from apps.scraper.utils.html_archive import HtmlArchive
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Re-extracts the archived article pages with the current extraction code and saves them'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            action='append',
+            dest='urls',
+            help='Only re-extract this URL (can be repeated)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of worker processes (defaults to the number of CPUs)'
+        )
+        parser.add_argument(
+            '--parser',
+            help='HTML parser backend (defaults to lxml when installed)'
+        )
+        parser.add_argument(
+            '--archive-dir',
+            default=None,
+            help='Directory of the HTML archive (defaults to the HTML_ARCHIVE_DIR setting)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Extracts the articles without saving them'
+        )
+
+    def handle(self, *args, **options):
+        archive_dir = options['archive_dir'] or settings.HTML_ARCHIVE_DIR
+        if not os.path.exists(os.path.join(archive_dir, 'index.sqlite3')):
+            raise CommandError(f"No HTML archive found in {archive_dir}")
+
+        archive = HtmlArchive(archive_dir)
+        service = ScraperService()
+        counts = {'extracted': 0, 'new': 0, 'updated': 0, 'failed': 0}
+        started = time.perf_counter()
+
+        try:
+            for page, article, error in reextract_archive(
+                archive,
+                urls=options['urls'],
+                workers=options['workers'],
+                parser=options['parser']
+            ):
+                if error or not article:
+                    counts['failed'] += 1
+                    logger.warning(f"Could not re-extract {page.url}: {error}")
+                    continue
+
+                counts['extracted'] += 1
+                if not options['dry_run']:
+                    counts[service.save_article(article)] += 1
+        except Exception as e:
+            logger.error(f"Error during re-extraction: {e}")
+            raise CommandError(f"Error during re-extraction: {e}")
+        finally:
+            archive.close()
+
+        if counts['new'] or counts['updated']:
+            service.refresh_source_reputation()
+            invalidate_statistics()
+
+        elapsed = time.perf_counter() - started
+        pages = counts['extracted'] + counts['failed']
+        self.stdout.write(self.style.SUCCESS("Re-extraction completed:"))
+        self.stdout.write(f"  Archived pages processed: {pages} in {elapsed:.1f}s ({pages / elapsed if elapsed else 0:.1f} pages/s)")
+        self.stdout.write(f"  Articles extracted: {counts['extracted']}")
+        if not options['dry_run']:
+            self.stdout.write(f"  New articles: {counts['new']}")
+            self.stdout.write(f"  Updated articles: {counts['updated']}")
+        self.stdout.write(f"  Failed pages: {counts['failed']}")
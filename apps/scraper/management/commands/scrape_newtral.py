@@ -19,20 +19,49 @@ class Command(BaseCommand):
             action='store_true',
             help='Ignores robots.txt directives'
         )
+        parser.add_argument(
+            '--discovery',
+            choices=['listing', 'browser', 'sitemap'],
+            default='listing',
+            help=(
+                'How article URLs are found: the listing pages over HTTP (falling back '
+                'to the browser), the listing page in a browser or the XML sitemaps'
+            )
+        )
+        parser.add_argument(
+            '--async-fetch',
+            action='store_true',
+            help=(
+                'Downloads the articles concurrently over HTTP instead of in the browser '
+                '(rate set by SCRAPER_ASYNC_RATE and SCRAPER_ASYNC_BURST)'
+            )
+        )
+        parser.add_argument(
+            '--full-browser',
+            action='store_true',
+            help='Loads every image, font and third-party script in the browser (disables the lean browser)'
+        )
 
     def handle(self, *args, **options):
         limit = options['limit']
         respect_robots = not options['ignore_robots']
+        discovery = options['discovery']
         
         self.stdout.write(
-            self.style.NOTICE(f"Starting extraction of Newtral fact-checks (limit: {limit}, respect_robots: {respect_robots})")
+            self.style.NOTICE(
+                f"Starting extraction of Newtral fact-checks "
+                f"(limit: {limit}, respect_robots: {respect_robots}, discovery: {discovery})"
+            )
         )
         
         try:
             service = ScraperService()
             total, new, updated, failed = service.scrape_newtral(
                 limit=limit,
-                respect_robots=respect_robots
+                respect_robots=respect_robots,
+                discovery=discovery,
+                lean_browser=not options['full_browser'],
+                async_fetch=options['async_fetch']
             )
             
             # Show statistics
@@ -42,8 +71,38 @@ class Command(BaseCommand):
             self.stdout.write(f"  Updated articles: {updated}")
             self.stdout.write(f"  Failed articles: {failed}")
             
+            if service.last_metrics:
+                self._print_timings(service.last_metrics.report())
+            
         except Exception as e:
             logger.error(f"Error during extraction: {e}")
             raise CommandError(f"Error during extraction: {e}")
         
-        self.stdout.write(self.style.SUCCESS('Extraction successfully completed'))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS('Extraction successfully completed'))
+
+    def _print_timings(self, report):
+        """Shows the time spent in each stage and the slowest URLs."""
+        self.stdout.write(self.style.SUCCESS(f"Timings (total: {report['elapsed_s']}s):"))
+        for stage, summary in report['stages'].items():
+            self.stdout.write(
+                f"  {stage}: {summary['total_s']}s in {summary['count']} spans "
+                f"(mean {summary['mean_ms']} ms, p50 {summary['p50_ms']} ms, "
+                f"p99 {summary['p99_ms']} ms, max {summary['max_ms']} ms)"
+            )
+            histogram = ", ".join(f"{bucket}: {count}" for bucket, count in summary['histogram'].items())
+            self.stdout.write(f"    {histogram}")
+        
+        counters = report['counters']
+        if counters:
+            self.stdout.write("  Counters: " + ", ".join(f"{name}: {value}" for name, value in counters.items()))
+        if counters.get('browser_transfer_bytes') and counters.get('browser_fetches'):
+            pages = counters['browser_fetches']
+            self.stdout.write(
+                f"  Browser: {counters['browser_transfer_bytes'] / pages / 1024:.1f} KiB and "
+                f"{counters.get('browser_requests', 0) / pages:.1f} requests per page"
+            )
+        
+        if report['slowest_urls']:
+            self.stdout.write("  Slowest URLs:")
+            for entry in report['slowest_urls']:
+                self.stdout.write(f"    {entry['total_s']}s {entry['url']}")
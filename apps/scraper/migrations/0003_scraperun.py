@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-18 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0002_remove_factcheckarticle_image_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScrapeRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, verbose_name='fuente')),
+                ('started_at', models.DateTimeField(verbose_name='inicio')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='fin')),
+                ('timings', models.JSONField(blank=True, default=dict, verbose_name='tiempos por etapa')),
+            ],
+            options={
+                'verbose_name': 'ejecución del scraper',
+                'verbose_name_plural': 'ejecuciones del scraper',
+                'ordering': ['-started_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.7 on 2026-10-18 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0003_scraperun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scraperun',
+            name='articles_per_second',
+            field=models.FloatField(blank=True, null=True, verbose_name='artículos por segundo'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='browser_fetches',
+            field=models.PositiveIntegerField(default=0, verbose_name='cargas con navegador'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='bytes_fetched',
+            field=models.BigIntegerField(default=0, verbose_name='bytes descargados'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='failed_articles',
+            field=models.PositiveIntegerField(default=0, verbose_name='artículos fallidos'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='http_fetches',
+            field=models.PositiveIntegerField(default=0, verbose_name='peticiones HTTP'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='new_articles',
+            field=models.PositiveIntegerField(default=0, verbose_name='artículos nuevos'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='retries',
+            field=models.PositiveIntegerField(default=0, verbose_name='reintentos'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='robots_denials',
+            field=models.PositiveIntegerField(default=0, verbose_name='bloqueos de robots.txt'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='total_articles',
+            field=models.PositiveIntegerField(default=0, verbose_name='artículos procesados'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='updated_articles',
+            field=models.PositiveIntegerField(default=0, verbose_name='artículos actualizados'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-18 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0004_scraperun_throughput'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='factcheckarticle',
+            index=models.Index(models.OrderBy(models.F('publish_date'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='article_publish_date_id_idx'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0005_article_publish_date_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Author',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='nombre normalizado')),
+                ('display_name', models.CharField(max_length=100, verbose_name='nombre')),
+            ],
+            options={
+                'verbose_name': 'autor',
+                'verbose_name_plural': 'autores',
+                'ordering': ['display_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ClaimSource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='nombre normalizado')),
+                ('display_name', models.CharField(max_length=255, verbose_name='nombre')),
+            ],
+            options={
+                'verbose_name': 'fuente de afirmaciones',
+                'verbose_name_plural': 'fuentes de afirmaciones',
+                'ordering': ['display_name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='factcheckarticle',
+            name='canonical_author',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='articles', to='scraper.author', verbose_name='autor normalizado'),
+        ),
+        migrations.AddField(
+            model_name='factcheckarticle',
+            name='canonical_source',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='articles', to='scraper.claimsource', verbose_name='fuente normalizada'),
+        ),
+        migrations.CreateModel(
+            name='ClaimSourceAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=255, unique=True, verbose_name='alias normalizado')),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='scraper.claimsource', verbose_name='fuente')),
+            ],
+            options={
+                'verbose_name': 'alias de fuente',
+                'verbose_name_plural': 'alias de fuentes',
+            },
+        ),
+        migrations.CreateModel(
+            name='SourceReputation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_articles', models.PositiveIntegerField(default=0, verbose_name='artículos')),
+                ('credible_articles', models.PositiveIntegerField(default=0, verbose_name='afirmaciones verdaderas')),
+                ('dubious_articles', models.PositiveIntegerField(default=0, verbose_name='afirmaciones falsas o engañosas')),
+                ('updated_at', models.DateTimeField(verbose_name='fecha de actualización')),
+                ('source', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='reputation', to='scraper.claimsource', verbose_name='fuente')),
+            ],
+            options={
+                'verbose_name': 'reputación de fuente',
+                'verbose_name_plural': 'reputaciones de fuentes',
+                'ordering': ['-total_articles'],
+            },
+        ),
+    ]
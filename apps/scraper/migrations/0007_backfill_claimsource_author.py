@@ -0,0 +1,100 @@
+import re
+import unicodedata
+
+from django.db import migrations
+
+# Frozen copies of apps/scraper/utils/names.py as of this migration: later
+# changes to the live aliases or normalization must not change its result
+SEPARATOR_PATTERN = re.compile(r'[\W_]+', re.UNICODE)
+
+SOURCE_ALIASES = {
+    'partido popular': 'pp',
+    'partido socialista': 'psoe',
+    'partido socialista obrero espanol': 'psoe',
+    'unidas podemos': 'podemos',
+    'agencia efe': 'efe',
+    'associated press': 'ap',
+    'the associated press': 'ap',
+    'agence france presse': 'afp',
+    'radiotelevision espanola': 'rtve',
+    'x': 'twitter',
+    'x antes twitter': 'twitter',
+    'twitter x': 'twitter',
+}
+
+
+def normalize_name(value):
+    """Lowercase a name and drop its accents, punctuation and repeated spaces."""
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', value.casefold())
+    without_accents = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return SEPARATOR_PATTERN.sub(' ', without_accents).strip()
+
+
+def backfill_entities(apps, schema_editor):
+    """
+    Create the canonical sources and authors of the existing articles and link them.
+
+    Each distinct raw value is resolved once and its articles are updated
+    with a single UPDATE.
+    """
+    FactCheckArticle = apps.get_model('scraper', 'FactCheckArticle')
+    ClaimSource = apps.get_model('scraper', 'ClaimSource')
+    ClaimSourceAlias = apps.get_model('scraper', 'ClaimSourceAlias')
+    Author = apps.get_model('scraper', 'Author')
+
+    # Most used spelling first, so it becomes the display name
+    def distinct_values(field):
+        rows = FactCheckArticle.objects.exclude(**{field: ''}).values_list(field, flat=True)
+        counts = {}
+        for value in rows.iterator(chunk_size=2000):
+            counts[value] = counts.get(value, 0) + 1
+        return sorted(counts, key=counts.get, reverse=True)
+
+    # Names and display names are cut to the length of their columns
+    source_length = ClaimSource._meta.get_field('name').max_length
+    author_length = Author._meta.get_field('name').max_length
+
+    sources = {}
+    for value in distinct_values('claim_source'):
+        normalized = normalize_name(value)
+        name = SOURCE_ALIASES.get(normalized, normalized)[:source_length].rstrip()
+        if not name:
+            continue
+        if name not in sources:
+            sources[name] = ClaimSource.objects.get_or_create(
+                name=name, defaults={'display_name': value.strip()[:source_length]}
+            )[0]
+        FactCheckArticle.objects.filter(claim_source=value).update(canonical_source=sources[name])
+
+    # Keep the built-in aliases of the sources that exist in the alias table
+    ClaimSourceAlias.objects.bulk_create(
+        [
+            ClaimSourceAlias(alias=alias, source=sources[name])
+            for alias, name in SOURCE_ALIASES.items() if name in sources
+        ],
+        ignore_conflicts=True
+    )
+
+    authors = {}
+    for value in distinct_values('author'):
+        name = normalize_name(value)[:author_length].rstrip()
+        if not name:
+            continue
+        if name not in authors:
+            authors[name] = Author.objects.get_or_create(
+                name=name, defaults={'display_name': value.strip()[:author_length]}
+            )[0]
+        FactCheckArticle.objects.filter(author=value).update(canonical_author=authors[name])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0006_claimsource_author'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_entities, migrations.RunPython.noop),
+    ]
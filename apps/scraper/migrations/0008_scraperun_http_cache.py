@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0007_backfill_claimsource_author'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scraperun',
+            name='http_cache_bytes_saved',
+            field=models.BigIntegerField(default=0, verbose_name='bytes ahorrados por la caché HTTP'),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='http_cache_hits',
+            field=models.PositiveIntegerField(default=0, verbose_name='páginas sin cambios (304)'),
+        ),
+    ]
@@ -1,8 +1,8 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-import re
-from datetime import datetime
 from django.utils import timezone
+from .utils.dates import normalize_date
+from .utils.names import normalize_name
 
 class VerificationCategory(models.Model):
     """
@@ -16,6 +16,10 @@ class VerificationCategory(models.Model):
     description = models.TextField(_('descripción'), blank=True)
     color = models.CharField(_('color'), max_length=7, default='#CCCCCC')
 
+    # Verdicts that rate a claim as true or as false
+    CREDIBLE_NAMES = ('Verdadero', 'Verdad a medias')
+    DUBIOUS_NAMES = ('Falso', 'Engañoso')
+
     class Meta:
         verbose_name = _('categoría de verificación')
         verbose_name_plural = _('categorías de verificación')
@@ -23,6 +27,65 @@ class VerificationCategory(models.Model):
     def __str__(self):
         return self.name
 
+class ClaimSource(models.Model):
+    """
+    Canonical source of the claims checked in the articles (a politician, a party, a media outlet...).
+
+    Spelling variants of the same source ("PSOE", "Psoe ", "Partido Socialista")
+    share one row, so articles are grouped by its integer key.
+    """
+    name = models.CharField(_('nombre normalizado'), max_length=255, unique=True)
+    display_name = models.CharField(_('nombre'), max_length=255)
+
+    class Meta:
+        verbose_name = _('fuente de afirmaciones')
+        verbose_name_plural = _('fuentes de afirmaciones')
+        ordering = ['display_name']
+
+    def __str__(self):
+        return self.display_name
+
+class ClaimSourceAlias(models.Model):
+    """
+    Alternative name of a claim source (e.g. "Partido Popular" for "PP").
+
+    The alias is stored normalized, see apps/scraper/utils/names.py.
+    """
+    alias = models.CharField(_('alias normalizado'), max_length=255, unique=True)
+    source = models.ForeignKey(
+        ClaimSource,
+        on_delete=models.CASCADE,
+        related_name='aliases',
+        verbose_name=_('fuente')
+    )
+
+    class Meta:
+        verbose_name = _('alias de fuente')
+        verbose_name_plural = _('alias de fuentes')
+
+    def __str__(self):
+        return self.alias
+
+    def save(self, *args, **kwargs):
+        """Store the alias normalized, as it is looked up."""
+        self.alias = normalize_name(self.alias)
+        super().save(*args, **kwargs)
+
+class Author(models.Model):
+    """
+    Canonical author of the fact-checking articles.
+    """
+    name = models.CharField(_('nombre normalizado'), max_length=100, unique=True)
+    display_name = models.CharField(_('nombre'), max_length=100)
+
+    class Meta:
+        verbose_name = _('autor')
+        verbose_name_plural = _('autores')
+        ordering = ['display_name']
+
+    def __str__(self):
+        return self.display_name
+
 class FactCheckArticle(models.Model):
     """
     Fact checking article scraped from Newtral.
@@ -48,11 +111,27 @@ class FactCheckArticle(models.Model):
     # Main content
     claim = models.TextField(_('afirmación verificada'))
     claim_source = models.CharField(_('fuente de la afirmación'), max_length=255)
+    canonical_source = models.ForeignKey(
+        ClaimSource,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='articles',
+        verbose_name=_('fuente normalizada')
+    )
     content = models.TextField(_('contenido'))
 
     # Media and metadata
     tags = models.CharField(_('etiquetas'), max_length=255, blank=True)
     author = models.CharField(_('autor'), max_length=100, blank=True)
+    canonical_author = models.ForeignKey(
+        Author,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='articles',
+        verbose_name=_('autor normalizado')
+    )
 
     # Internal control
     scraped_at = models.DateTimeField(_('fecha de extracción'), auto_now_add=True)
@@ -62,6 +141,14 @@ class FactCheckArticle(models.Model):
         verbose_name = _('artículo de verificación')
         verbose_name_plural = _('artículos de verificación')
         ordering = ['-publish_date', '-scraped_at']
+        indexes = [
+            # Keyset pagination of the article list (see apps/scraper/pagination.py)
+            models.Index(
+                models.F('publish_date').desc(nulls_last=True),
+                models.F('id').desc(),
+                name='article_publish_date_id_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -77,64 +164,86 @@ class FactCheckArticle(models.Model):
         Returns:
             datetime.date or None if parsing fails
         """
-        if not date_str:
+        return normalize_date(date_str)
+
+class ScrapeRun(models.Model):
+    """
+    Execution of a scraper.
+
+    Stores when the run happened, its article counts and throughput, and
+    the timing report of its stages (browser startup, page loads, parsing,
+    database writes...), so runs can be compared over time.
+    """
+    source = models.CharField(_('fuente'), max_length=50)
+    started_at = models.DateTimeField(_('inicio'))
+    finished_at = models.DateTimeField(_('fin'), null=True, blank=True)
+
+    # Article counts
+    total_articles = models.PositiveIntegerField(_('artículos procesados'), default=0)
+    new_articles = models.PositiveIntegerField(_('artículos nuevos'), default=0)
+    updated_articles = models.PositiveIntegerField(_('artículos actualizados'), default=0)
+    failed_articles = models.PositiveIntegerField(_('artículos fallidos'), default=0)
+    articles_per_second = models.FloatField(_('artículos por segundo'), null=True, blank=True)
+
+    # Network activity
+    bytes_fetched = models.BigIntegerField(_('bytes descargados'), default=0)
+    retries = models.PositiveIntegerField(_('reintentos'), default=0)
+    robots_denials = models.PositiveIntegerField(_('bloqueos de robots.txt'), default=0)
+    browser_fetches = models.PositiveIntegerField(_('cargas con navegador'), default=0)
+    http_fetches = models.PositiveIntegerField(_('peticiones HTTP'), default=0)
+    http_cache_hits = models.PositiveIntegerField(_('páginas sin cambios (304)'), default=0)
+    http_cache_bytes_saved = models.BigIntegerField(_('bytes ahorrados por la caché HTTP'), default=0)
+
+    timings = models.JSONField(_('tiempos por etapa'), default=dict, blank=True)
+
+    class Meta:
+        verbose_name = _('ejecución del scraper')
+        verbose_name_plural = _('ejecuciones del scraper')
+        ordering = ['-started_at']
+
+    def __str__(self):
+        return f"{self.source} ({self.started_at:%Y-%m-%d %H:%M})"
+
+    @property
+    def duration(self):
+        """Duration of the run in seconds, or None if it has not finished."""
+        if not self.finished_at:
             return None
-                
-        # Convert datetime to date
-        if hasattr(date_str, 'date'):
-            return date_str.date()
-                
-        # Convert to string and clean
-        if not isinstance(date_str, str):
-            date_str = str(date_str)
-        
-        date_str = date_str.strip()
-        
-        # Try to extract date from URL (Newtral format: /YYYYMMDD/)
-        url_match = re.search(r'/(\d{8})/', date_str)
-        if url_match:
-            try:
-                year = int(url_match.group(1)[:4])
-                month = int(url_match.group(1)[4:6])
-                day = int(url_match.group(1)[6:8])
-                return datetime(int(year), int(month), int(day)).date()
-            except (ValueError, IndexError):
-                pass
-                    
-        # Try Spanish format with improved regex
-        spanish_months = {
-            "enero": 1, "febrero": 2, "marzo": 3, "abril": 4,
-            "mayo": 5, "junio": 6, "julio": 7, "agosto": 8,
-            "septiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12
-        }
-        
-        spanish_match = re.search(r'(\d{1,2})\s+de\s+(\w+)(?:\s+de\s+|\s+)(\d{4})', date_str.lower())
-        if spanish_match:
-            try:
-                day = int(spanish_match.group(1))
-                month = spanish_months.get(spanish_match.group(2))
-                year = int(spanish_match.group(3))
-                if month:
-                    return datetime(year, month, day).date()
-            except (ValueError, IndexError):
-                pass
-        
-        # Try ISO format (YYYY-MM-DD)
-        iso_match = re.search(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})', date_str)
-        if iso_match:
-            try:
-                year = int(iso_match.group(1))
-                month = int(iso_match.group(2))
-                day = int(iso_match.group(3))
-                return datetime(year, month, day).date()
-            except (ValueError, TypeError):
-                pass
-        
-        # Try direct parsing with dateutil as a last resort
-        try:
-            from dateutil import parser
-            return parser.parse(date_str).date()
-        except:
-            pass
-        
-        return None
\ No newline at end of file
+        return (self.finished_at - self.started_at).total_seconds()
+
+class SourceReputation(models.Model):
+    """
+    Historical reputation of a claim source.
+
+    Aggregates the verdicts of the articles of each canonical ClaimSource
+    (see apps/scraper/reputation.py). The table is rebuilt after each scrape,
+    so the analyzer can score a source with one lookup.
+    """
+    source = models.OneToOneField(
+        ClaimSource,
+        on_delete=models.CASCADE,
+        related_name='reputation',
+        verbose_name=_('fuente')
+    )
+    total_articles = models.PositiveIntegerField(_('artículos'), default=0)
+    credible_articles = models.PositiveIntegerField(_('afirmaciones verdaderas'), default=0)
+    dubious_articles = models.PositiveIntegerField(_('afirmaciones falsas o engañosas'), default=0)
+    updated_at = models.DateTimeField(_('fecha de actualización'))
+
+    class Meta:
+        verbose_name = _('reputación de fuente')
+        verbose_name_plural = _('reputaciones de fuentes')
+        ordering = ['-total_articles']
+
+    def __str__(self):
+        return self.source.display_name
+
+    @property
+    def credibility(self):
+        """
+        Share of rated claims that were true, with Laplace smoothing.
+
+        Returns:
+            float: Between 0 and 1 (0.5 for a source without rated claims)
+        """
+        return (self.credible_articles + 1) / (self.credible_articles + self.dubious_articles + 2)
@@ -0,0 +1,69 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .scrapers.newtral import NewtralScraper
+from .utils.html_archive import load_page
+
+logger = logging.getLogger(__name__)
+
+# State of each worker process, set by _init_worker
+_worker = {}
+
+def _init_worker(root, parser):
+    """Create the scraper used by a worker process to parse archived pages."""
+    _worker['root'] = root
+    _worker['scraper'] = NewtralScraper(respect_robots=False, parser=parser)
+
+def _extract_page(page):
+    """
+    Run the extraction code on an archived page.
+
+    Args:
+        page (ArchivedPage): Entry of the archive index
+
+    Returns:
+        tuple: (page, article data or None, error message or None)
+    """
+    try:
+        html = load_page(_worker['root'], page)
+        return page, _worker['scraper'].parse_article(html, page.url), None
+    except Exception as e:
+        return page, None, f"{type(e).__name__}: {e}"
+
+def reextract_archive(archive, urls=None, workers=None, parser=None, chunksize=8):
+    """
+    Re-extract the articles of the archive with the current extraction code.
+
+    The latest fetch of each URL is decompressed and parsed in a pool of
+    processes, so re-processing the whole corpus is local and uses every CPU
+    instead of going through the network and a browser again.
+
+    Args:
+        archive (HtmlArchive): Archive of fetched pages
+        urls (list, optional): Only re-extract these URLs
+        workers (int, optional): Worker processes. Defaults to the number of CPUs.
+            With 1 the pages are parsed in the current process.
+        parser (str, optional): BeautifulSoup parser backend
+        chunksize (int): Pages sent to a worker at a time
+
+    Yields:
+        tuple: (page, article data or None, error message or None), in URL order
+    """
+    pages = archive.latest_pages()
+    if urls:
+        wanted = set(urls)
+        pages = [page for page in pages if page.url in wanted]
+    logger.info(f"Re-extracting {len(pages)} archived pages")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pages) <= 1:
+        _init_worker(archive.root, parser)
+        yield from map(_extract_page, pages)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(archive.root, parser)
+    ) as executor:
+        yield from executor.map(_extract_page, pages, chunksize=chunksize)
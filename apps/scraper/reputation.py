@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from .models import ClaimSourceAlias, FactCheckArticle, SourceReputation, VerificationCategory
+from .utils.names import SOURCE_ALIASES, canonical_source_name
+
+logger = logging.getLogger(__name__)
+
+def refresh_source_reputation():
+    """
+    Rebuild the source reputation table from the verdicts of the stored articles.
+
+    The verdicts are counted per canonical source with a single aggregate
+    query grouped by its integer key, so "PSOE", "Psoe " and "Partido
+    Socialista" count as one source, and the table is replaced atomically.
+
+    Returns:
+        int: Number of sources in the table
+    """
+    rows = FactCheckArticle.objects.filter(canonical_source__isnull=False).values('canonical_source').annotate(
+        total=Count('id'),
+        credible=Count('id', filter=Q(verification_category__name__in=VerificationCategory.CREDIBLE_NAMES)),
+        dubious=Count('id', filter=Q(verification_category__name__in=VerificationCategory.DUBIOUS_NAMES)),
+    ).order_by()
+
+    now = timezone.now()
+    reputations = [
+        SourceReputation(
+            source_id=row['canonical_source'],
+            total_articles=row['total'],
+            credible_articles=row['credible'],
+            dubious_articles=row['dubious'],
+            updated_at=now
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        SourceReputation.objects.all().delete()
+        SourceReputation.objects.bulk_create(reputations, batch_size=500)
+
+    logger.info(f"Reputation table refreshed: {len(reputations)} sources")
+    return len(reputations)
+
+class SourceReputationIndex:
+    """
+    In-memory index of the source reputation table by canonical name.
+
+    A source is looked up with one dictionary access after normalizing its
+    name and folding its aliases, instead of scanning lists of names.
+    """
+
+    def __init__(self, reputations, aliases=SOURCE_ALIASES):
+        """
+        Initialize the index.
+
+        Args:
+            reputations (iterable): SourceReputation rows with their source
+            aliases (dict): Canonical name by normalized alias
+        """
+        self.aliases = aliases
+        self.entries = {reputation.source.name: reputation for reputation in reputations}
+
+    @classmethod
+    def load(cls):
+        """Build the index from the reputation and alias tables."""
+        aliases = dict(SOURCE_ALIASES)
+        aliases.update(ClaimSourceAlias.objects.values_list('alias', 'source__name'))
+        return cls(SourceReputation.objects.select_related('source'), aliases)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, source):
+        """
+        Get the reputation of a source.
+
+        Args:
+            source (str): Source as written by the user or in an article
+
+        Returns:
+            SourceReputation or None if the source has never been fact-checked
+        """
+        return self.entries.get(canonical_source_name(source, self.aliases))
+
+# Seconds between checks of the table for a newer refresh
+RELOAD_CHECK_INTERVAL = 30
+
+# Index loaded in this process, the refresh it was loaded at and when that was last checked
+_index = None
+_index_version = None
+_index_checked_at = None
+_index_lock = threading.Lock()
+
+def get_source_reputation_index():
+    """
+    Get the reputation index, reloading it when the table is rebuilt.
+
+    Scrapes run in other processes (management commands), so the freshness
+    of the index is read from the table itself: every refresh stamps its
+    rows with a new updated_at. The table is checked at most once every
+    RELOAD_CHECK_INTERVAL seconds and reloaded only when it changed.
+
+    Returns:
+        SourceReputationIndex
+    """
+    global _index, _index_version, _index_checked_at
+    now = time.monotonic()
+    with _index_lock:
+        if _index is not None and now - _index_checked_at < RELOAD_CHECK_INTERVAL:
+            return _index
+        version = SourceReputation.objects.aggregate(refreshed_at=Max('updated_at'))['refreshed_at']
+        if _index is None or _index_version != version:
+            _index = SourceReputationIndex.load()
+            _index_version = version
+        _index_checked_at = now
+        return _index
@@ -1,4 +1,22 @@
-from .base import BaseScraper
-from .newtral import NewtralScraper
+from importlib import import_module
 
-__all__ = ['BaseScraper', 'NewtralScraper']
\ No newline at end of file
+# Scrapers are imported on first access: NewtralScraper and AsyncBaseScraper
+# bring in the browser and async HTTP stacks, which most callers never use.
+_SCRAPERS = {
+    'BaseScraper': '.base',
+    'AsyncBaseScraper': '.async_base',
+    'NewtralScraper': '.newtral',
+    'AsyncNewtralScraper': '.newtral_async',
+}
+
+__all__ = ['BaseScraper', 'AsyncBaseScraper', 'NewtralScraper', 'AsyncNewtralScraper']
+
+def __getattr__(name):
+    if name in _SCRAPERS:
+        value = getattr(import_module(_SCRAPERS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import httpx
+from .base import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+class AsyncBaseScraper(BaseScraper):
+    """
+    Base class for scrapers that fetch pages concurrently with asyncio.
+
+    It keeps the `get_page`/`scrape_page` contract of BaseScraper, but as
+    coroutines backed by a connection-pooled `httpx.AsyncClient`. Robots.txt
+    checks, retries with back-off, the shared rate limiter and the HTTP cache
+    work the same way as in the blocking scraper. The HTTP cache and HTML
+    archive do blocking SQLite and file I/O, so they are called in worker
+    threads to keep the event loop free for the other requests.
+    """
+
+    def __init__(self, base_url, name="AsyncBaseScraper", max_concurrency=50, **kwargs):
+        """
+        Initialize the async scraper.
+
+        Args:
+            base_url (str): The base URL of the website to scrape.
+            name (str): A name for this scraper for logging purposes.
+            max_concurrency (int): Maximum number of requests in flight at once.
+            **kwargs: Other BaseScraper options (max_retries, retry_delay,
+                      respect_robots, rate_limiter, http_cache,
+                      parser, metrics, pin_user_agent, html_archive).
+        """
+        super().__init__(base_url, name=name, **kwargs)
+        self.max_concurrency = max_concurrency
+        self.client = None
+        self.semaphore = None
+
+    def _get_client(self):
+        """Return the async HTTP client, creating it on first use."""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.client
+
+    async def close(self):
+        """Close the async HTTP client and its pooled connections."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            self.semaphore = None
+
+    async def __aenter__(self):
+        self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def throttle_async(self, url):
+        """
+        Wait without blocking the event loop until a request to the URL's host is allowed.
+
+        Args:
+            url (str): The URL that is about to be requested.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        if not self.rate_limiter.has_bucket(url):
+            # May download robots.txt, so it runs outside the event loop
+            await asyncio.to_thread(self.configure_rate_limit, url)
+        waited = await self.rate_limiter.acquire_async(url)
+        self.metrics.record('throttle', waited, url)
+        return waited
+
+    async def get_page(self, url, timeout=30):
+        """
+        Get a web page.
+
+        Args:
+            url (str): The URL to fetch.
+            timeout (int): Request timeout in seconds.
+
+        Returns:
+            httpx.Response: The response object if successful. Pages served from the
+                HTTP cache are requests.Response objects with `from_cache` set to True.
+
+        Raises:
+            PermissionError: If robots.txt disallows access to the URL.
+            httpx.HTTPError: If there's an error fetching the page.
+        """
+        full_url = self.build_url(url)
+        client = self._get_client()
+
+        # Check robots.txt if enabled (the first check per domain downloads robots.txt)
+        if self.respect_robots:
+            await asyncio.to_thread(self.check_robots, full_url)
+
+        for attempt in range(self.max_retries):
+            try:
+                # Per request: the session and client headers are shared by every task of the gather
+                headers = {'User-Agent': self.user_agent_manager.get_random_user_agent()}
+
+                # Add a delay for retries
+                if attempt > 0:
+                    self.metrics.incr('retries')
+                    delay = self.get_retry_delay(attempt)
+                    logger.debug(f"Retry attempt {attempt+1}/{self.max_retries}. Waiting {delay:.2f}s before retry.")
+                    await asyncio.sleep(delay)
+
+                # Wait for our turn on this host
+                await self.throttle_async(full_url)
+
+                # Make the request, conditional if we already have a copy
+                if self.http_cache:
+                    headers.update(await asyncio.to_thread(self.http_cache.conditional_headers, full_url))
+
+                async with self.semaphore:
+                    logger.info(f"Fetching URL: {full_url}")
+                    with self.metrics.span('fetch', full_url):
+                        response = await client.get(full_url, headers=headers, timeout=timeout)
+                    self.metrics.incr('http_fetches')
+
+                    # Reuse the cached body if the page has not changed
+                    if response.status_code == 304 and self.http_cache:
+                        cached_response = await asyncio.to_thread(
+                            self.http_cache.get_response, full_url, not_modified=response
+                        )
+                        if cached_response is not None:
+                            logger.info(f"Not modified, using cached copy of {full_url}")
+                            self.record_cache_hit(cached_response)
+                            return cached_response
+                        # The copy was evicted in the meantime, fetch the full page
+                        await self.throttle_async(full_url)
+                        with self.metrics.span('fetch', full_url):
+                            response = await client.get(full_url, headers={'User-Agent': headers['User-Agent']},
+                                                        timeout=timeout)
+                        self.metrics.incr('http_fetches')
+
+                # Check if the request was successful
+                response.raise_for_status()
+                self.metrics.incr('bytes_fetched', len(response.content))
+                if self.http_cache:
+                    await asyncio.to_thread(self.http_cache.store, full_url, response)
+                return response
+
+            except httpx.HTTPError as e:
+                logger.warning(f"Error fetching URL: {full_url}. Error: {e}")
+                if attempt == self.max_retries - 1:
+                    logger.error(f"Failed to fetch {full_url} after {self.max_retries} attempts")
+                    raise
+
+        raise Exception(f"Failed to fetch {full_url} after {self.max_retries} attempts")
+
+    async def scrape_page(self, url):
+        """
+        Scrape a page: fetch and parse it.
+
+        Args:
+            url (str): URL to scrape
+
+        Returns:
+            BeautifulSoup: Parsed HTML page
+        """
+        response = await self.get_page(url)
+        return self.parse_html(response)
+
+    async def scrape_pages(self, urls):
+        """
+        Scrape several pages concurrently.
+
+        Failures do not cancel the other pages; they are logged and returned
+        in place of the parsed page.
+
+        Args:
+            urls (list): URLs to scrape
+
+        Returns:
+            list: Parsed pages (or the exception raised for each failed URL), in
+                  the same order as `urls`
+        """
+        results = await asyncio.gather(*[self.scrape_page(url) for url in urls], return_exceptions=True)
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping {url}: {result}")
+        return results
+
+    async def scrape(self, **kwargs):
+        """
+        Main scraping coroutine to be implemented by subclasses.
+
+        Allows optional keyword arguments to support different scraper implementations.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement the scrape() method")
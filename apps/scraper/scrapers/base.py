@@ -1,4 +1,5 @@
 import logging
+import sqlite3
 import requests
 from bs4 import BeautifulSoup
 import time
@@ -6,9 +7,18 @@ import random
 from requests.exceptions import RequestException
 from ..utils.user_agents import UserAgentManager
 from ..utils.robots_parser import RobotsParser
+from ..utils.rate_limiter import RateLimiter
+from ..utils.metrics import ScrapeMetrics
 
 logger = logging.getLogger(__name__)
 
+# lxml is several times faster than Python's html.parser; use it when available
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
 class BaseScraper:
     """
     Base class for all scrapers that implements common scraping functionality.
@@ -16,7 +26,9 @@ class BaseScraper:
     This class provides basic methods for making HTTP requests and parsing HTML.
     """
 
-    def __init__(self, base_url, name="BaseScraper", max_retries=3, retry_delay=2, respect_robots=True):
+    def __init__(self, base_url, name="BaseScraper", max_retries=3, retry_delay=2, respect_robots=True,
+                 rate_limiter=None, http_cache=None, parser=None, metrics=None, pin_user_agent=False,
+                 html_archive=None):
         """
         Initialize the base scraper with configuration.
 
@@ -26,18 +38,35 @@ class BaseScraper:
             max_retries (int): Number of retry attempts in case of request failure.
             retry_delay (int): Base delay in seconds between retries.
             respect_robots (bool): Whether to respect robots.txt instructions.
+            rate_limiter (RateLimiter, optional): Per-host rate limiter. Defaults to
+                the limiter shared by every scraper in the process.
+            http_cache (HttpCache, optional): Cache used to make conditional requests
+                and reuse unchanged pages. Disabled if None.
+            parser (str, optional): BeautifulSoup parser backend ('lxml', 'html.parser',
+                'html5lib'). Defaults to lxml when it is installed.
+            metrics (ScrapeMetrics, optional): Collector of the timing spans of each
+                stage. A new one is created if None.
+            pin_user_agent (bool): Whether to keep a single user agent for the whole
+                session instead of rotating it on every request.
+            html_archive (HtmlArchive, optional): Archive where the raw HTML of the
+                fetched articles is kept for offline re-extraction. Disabled if None.
         """
         self.base_url = base_url
         self.name = name
         self.session = requests.Session()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.user_agent_manager = UserAgentManager()
+        self.user_agent_manager = UserAgentManager(pin=pin_user_agent)
         self.respect_robots = respect_robots
+        self.rate_limiter = rate_limiter or RateLimiter.shared()
+        self.http_cache = http_cache
+        self.parser = parser or DEFAULT_PARSER
+        self.metrics = metrics or ScrapeMetrics()
+        self.html_archive = html_archive
         
         # Initialize robots.txt parser if needed
         if self.respect_robots:
-            self.robots_parser = RobotsParser()
+            self.robots_parser = RobotsParser(session=self.session)
         
         # Configure default headers with a random user agent
         self.rotate_user_agent()
@@ -48,54 +77,176 @@ class BaseScraper:
 
         logger.info(f"Initialized {self.name} scraper for {base_url} with user agent: {self.session.headers['User-Agent']}")
 
-    def rotate_user_agent(self):
-        """Rotate the User-Agent header to avoid detection."""
+    def rotate_user_agent(self, session=None):
+        """
+        Rotate the User-Agent header to avoid detection.
+
+        Args:
+            session (requests.Session, optional): Session to update. Defaults to
+                the scraper's session.
+
+        Returns:
+            str: The new user agent.
+        """
+        session = session or self.session
         user_agent = self.user_agent_manager.get_random_user_agent()
-        self.session.headers.update({'User-Agent': user_agent})
+        session.headers.update({'User-Agent': user_agent})
         logger.debug(f"Rotated user agent: {user_agent}")
         return user_agent
 
-    def get_page(self, url, timeout=30):
+    def new_session(self):
+        """
+        Create a session with the same default headers as the scraper's session.
+
+        requests sessions are not safe to share between threads (and
+        rotate_user_agent() changes their headers), so each worker thread
+        should make its requests with its own session.
+
+        Returns:
+            requests.Session: The new session.
+        """
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        return session
+
+    def build_url(self, url):
+        """
+        Build the absolute URL for a path relative to the base URL.
+
+        Args:
+            url (str): Absolute URL or path relative to base_url.
+
+        Returns:
+            str: Absolute URL.
+        """
+        return url if url.startswith('http') else f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
+
+    def check_robots(self, url):
+        """
+        Check robots.txt for a URL if robots.txt is respected.
+
+        Args:
+            url (str): Absolute URL that is about to be requested.
+
+        Raises:
+            PermissionError: If robots.txt disallows access to the URL.
+        """
+        if not self.respect_robots:
+            return
+
+        current_user_agent = self.session.headers.get('User-Agent')
+        with self.metrics.span('robots', url):
+            allowed = self.robots_parser.can_fetch(url, current_user_agent)
+        if not allowed:
+            self.metrics.incr('robots_denials')
+            logger.warning(f"Access to {url} disallowed by robots.txt")
+            raise PermissionError(f"Access to {url} disallowed by robots.txt")
+
+    def configure_rate_limit(self, url):
+        """
+        Set the rate for the URL's host the first time it is seen.
+
+        The rate is taken from the robots.txt `Crawl-delay` directive when
+        robots.txt is respected.
+
+        Args:
+            url (str): The URL that is about to be requested.
+        """
+        if self.respect_robots and not self.rate_limiter.has_bucket(url):
+            crawl_delay = self.robots_parser.crawl_delay(url, self.session.headers.get('User-Agent'))
+            self.rate_limiter.configure_host(url, crawl_delay=crawl_delay)
+
+    def get_retry_delay(self, attempt):
+        """
+        Get the exponential back-off delay with jitter before a retry.
+
+        Args:
+            attempt (int): Zero-based attempt number (must be greater than 0).
+
+        Returns:
+            float: Seconds to wait before the attempt.
+        """
+        return self.retry_delay * (1 + random.random()) * (2 ** (attempt - 1))
+
+    def throttle(self, url):
+        """
+        Wait until the rate limiter allows a new request to the URL's host.
+
+        Args:
+            url (str): The URL that is about to be requested.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        self.configure_rate_limit(url)
+        waited = self.rate_limiter.acquire(url)
+        self.metrics.record('throttle', waited, url)
+        return waited
+
+    def get_page(self, url, timeout=30, session=None):
         """
         Get a web page.
 
         Args:
             url (str): The URL to fetch.
             timeout (int): Request timeout in seconds.
+            session (requests.Session, optional): Session used for the request,
+                e.g. one per worker thread. Defaults to the scraper's session.
 
         Returns:
-            requests.Response: The response object if successful.
+            requests.Response: The response object if successful. Pages served from
+                the HTTP cache have the `from_cache` attribute set to True.
             
         Raises:
             PermissionError: If robots.txt disallows access to the URL.
             RequestException: If there's an error fetching the page.
         """
-        full_url = url if url.startswith('http') else f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
+        full_url = self.build_url(url)
+        session = session or self.session
         
         # Check robots.txt if enabled
-        if self.respect_robots:
-            current_user_agent = self.session.headers.get('User-Agent')
-            if not self.robots_parser.can_fetch(full_url, current_user_agent):
-                logger.warning(f"Access to {full_url} disallowed by robots.txt")
-                raise PermissionError(f"Access to {full_url} disallowed by robots.txt")
+        self.check_robots(full_url)
 
         for attempt in range(self.max_retries):
             try:
                 # Rotate user agent before each attempt
-                self.rotate_user_agent()
+                self.rotate_user_agent(session)
                 
                 # Add a delay for retries
                 if attempt > 0:
-                    delay = self.retry_delay * (1 + random.random()) * (2 ** (attempt - 1))
+                    self.metrics.incr('retries')
+                    delay = self.get_retry_delay(attempt)
                     logger.debug(f"Retry attempt {attempt+1}/{self.max_retries}. Waiting {delay:.2f}s before retry.")
                     time.sleep(delay)
                 
-                # Make the request
+                # Wait for our turn on this host
+                self.throttle(full_url)
+                
+                # Make the request, conditional if we already have a copy
+                headers = self.http_cache.conditional_headers(full_url) if self.http_cache else {}
                 logger.info(f"Fetching URL: {full_url}")
-                response = self.session.get(full_url, timeout=timeout)
+                with self.metrics.span('fetch', full_url):
+                    response = session.get(full_url, headers=headers, timeout=timeout)
+                self.metrics.incr('http_fetches')
+
+                # Reuse the cached body if the page has not changed
+                if response.status_code == 304 and self.http_cache:
+                    cached_response = self.http_cache.get_response(full_url, not_modified=response)
+                    if cached_response is not None:
+                        logger.info(f"Not modified, using cached copy of {full_url}")
+                        self.record_cache_hit(cached_response)
+                        return cached_response
+                    # The copy was evicted in the meantime, fetch the full page
+                    self.throttle(full_url)
+                    with self.metrics.span('fetch', full_url):
+                        response = session.get(full_url, timeout=timeout)
+                    self.metrics.incr('http_fetches')
 
                 # Check if the request was successful
                 response.raise_for_status()
+                self.metrics.incr('bytes_fetched', len(response.content))
+                if self.http_cache:
+                    self.http_cache.store(full_url, response)
                 return response
 
             except RequestException as e:
@@ -106,17 +257,59 @@ class BaseScraper:
         
         raise Exception(f"Failed to fetch {full_url} after {self.max_retries} attempts")
 
+    def record_cache_hit(self, response):
+        """
+        Count a page served from the HTTP cache after a 304 Not Modified.
+
+        Args:
+            response: Response rebuilt from the cached copy.
+        """
+        self.metrics.incr('http_cache_hits')
+        self.metrics.incr('http_cache_bytes_saved', len(response.content))
+
+    def archive_page(self, url, html):
+        """
+        Keep the raw HTML of a fetched page in the archive, if there is one.
+
+        Archive errors are logged and never interrupt the scrape.
+
+        Args:
+            url (str): URL of the page.
+            html (str): Page source.
+        """
+        if not self.html_archive:
+            return
+        try:
+            with self.metrics.span('archive', url):
+                self.html_archive.store(url, html)
+            self.metrics.incr('pages_archived')
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not archive {url}: {e}")
+
+    def make_soup(self, markup):
+        """
+        Parse an HTML document with the configured parser backend.
+
+        Args:
+            markup (str): HTML document.
+
+        Returns:
+            BeautifulSoup: The parsed HTML.
+        """
+        with self.metrics.span('parse'):
+            return BeautifulSoup(markup, self.parser)
+
     def parse_html(self, response):
         """
         Parse HTML response with BeautifulSoup.
 
         Args:
-            response (requests.Response): The response object.
+            response: The response object (anything with a `text` attribute).
 
         Returns:
             BeautifulSoup: The parsed HTML.
         """
-        return BeautifulSoup(response.text, 'html.parser')
+        return self.make_soup(response.text)
         
     def scrape_page(self, url):
         """
@@ -1,26 +1,114 @@
+import asyncio
 import logging
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from xml.etree.ElementTree import ParseError
 from django.utils import timezone
+from requests.exceptions import HTTPError, RequestException
 from .base import BaseScraper
+from .schema import ExtractionSchema, Field
+from ..utils.dates import normalize_date
+from ..utils.sitemaps import iter_sitemap, is_newer
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+# selenium and webdriver_manager are imported by the methods that drive the
+# browser, and httpx by the async article fetch, so importing the scraper
+# (services, commands, workers, tests) does not pay for them when unused.
 
 logger = logging.getLogger(__name__)
 
+def _clean_claim(text):
+    """Removes the quotes around a claim."""
+    return re.sub(r'^["""]|["""]$', '', text)
+
+def _drop_empty(texts):
+    """Removes empty texts from a list."""
+    return [text for text in texts if text]
+
+# Fields of a fact-check article page, compiled once at import time
+ARTICLE_SCHEMA = ExtractionSchema([
+    Field('title', [".post-title-1", "h1"]),
+    Field('publish_date', [".post-date"], post=normalize_date),
+    Field('author', [".post-author .author-link"]),
+    Field('content', [".section-post-content p"], many=True, post=" ".join, default=""),
+    Field('claim', ["mark"], post=_clean_claim),
+    Field('claim_source', [".card-author-text-link"]),
+    Field(
+        'verification_category',
+        [
+            (".card-text-marked-red", "Falso"),
+            (".card-text-marked-orange", "Engañoso"),
+            (".card-text-marked-pistachio", "Verdad a medias"),
+            (".card-text-marked-green", "Verdadero"),
+        ],
+        # Fallback method: look for the category names in the page text
+        text_search=("Verdad a medias", "Falso", "Engañoso", "Verdadero"),
+    ),
+    Field('tags', [".section-post-tags .pill-outline"], many=True, post=_drop_empty, default=list),
+])
+
+# Article links of the fact-check listing page
+LISTING_SCHEMA = ExtractionSchema([
+    Field('urls', [".card-title-link"], attr='href', many=True,
+          post=lambda urls: list(dict.fromkeys(_drop_empty(urls))), default=list),
+])
+
+# Fact-check article URLs listed in the sitemaps: /<slug>/YYYYMMDD/
+FACT_CHECK_URL_PATTERN = re.compile(r'^https://www\.newtral\.es/[^/?#]*(?:factcheck|fact-check|bulo)[^/?#]*/\d{8}/?$')
+
+# URL discovery backends of scrape()
+DISCOVERY_BACKENDS = ('listing', 'browser', 'sitemap')
+
+# Article fetch backends of scrape(): one browser page at a time, or concurrent HTTP requests
+FETCH_BACKENDS = ('browser', 'async')
+
+# Upper bound of listing pages requested, like the 30 "Load more" clicks of the browser
+MAX_LISTING_PAGES = 30
+
+# Requests blocked by the lean browser: images, media, fonts and ad/analytics hosts.
+# Stylesheets and the site's own scripts are kept, the listing needs them.
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.mp3', '*.m3u8',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*adservice.google.*', '*amazon-adsystem.com*',
+    '*facebook.net*', '*connect.facebook.*', '*scorecardresearch.com*', '*chartbeat.*',
+    '*taboola.com*', '*outbrain.com*', '*hotjar.com*', '*cookiebot.com*', '*youtube.com/embed*',
+]
+
+# Bytes transferred by the current page: the document plus every resource it loaded
+PAGE_TRANSFER_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return [entries.reduce((total, entry) => total + (entry.transferSize || 0), 0), entries.length];
+"""
+
+class ListingFormatError(Exception):
+    """Raised when a listing page no longer has the expected article cards."""
+
 class NewtralScraper(BaseScraper):
     """
     Scraper to extract fact-checks from the Newtral website.
     """
-    def __init__(self, respect_robots=True, **kwargs):
+    def __init__(self, respect_robots=True, extract_in_browser=False, lean_browser=True,
+                 page_load_timeout=20, max_concurrency=8, **kwargs):
+        """
+        Initialize the Newtral scraper.
+
+        Args:
+            respect_robots (bool): Whether to respect robots.txt instructions.
+            extract_in_browser (bool): Whether to evaluate the extraction schema in the
+                browser instead of parsing the page source.
+            lean_browser (bool): Whether the browser skips images, media, fonts and
+                ad/analytics requests and stops waiting once the DOM is ready.
+            page_load_timeout (int): Seconds a page may keep loading in the lean
+                browser before it is stopped and read as it is.
+            max_concurrency (int): Article requests in flight at once with the
+                async fetch.
+            **kwargs: Other BaseScraper options.
+        """
         super().__init__(
             base_url="https://www.newtral.es",
             name="NewtralScraper",
@@ -28,40 +116,123 @@ class NewtralScraper(BaseScraper):
             **kwargs
         )
         self.fact_check_url = "https://www.newtral.es/zona-verificacion/fact-check/"
+        # Page N of the listing, the same cards that "Load more" appends
+        self.listing_page_url = "https://www.newtral.es/zona-verificacion/fact-check/page/{page}/"
+        # Used when robots.txt declares no sitemaps
+        self.sitemap_url = "https://www.newtral.es/sitemap_index.xml"
+        self.extract_in_browser = extract_in_browser
+        self.lean_browser = lean_browser
+        self.page_load_timeout = page_load_timeout
+        self.max_concurrency = max_concurrency
+
+    def _get_browser_options(self):
+        """Builds the Chrome options, lighter when the lean browser is enabled."""
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--remote-debugging-port=9222")
+        
+        # Use the same user agent as the base scraper
+        chrome_options.add_argument(f"user-agent={self.session.headers['User-Agent']}")
+        
+        if self.lean_browser:
+            # Return from driver.get() once the DOM is ready, without waiting for subresources
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
+        
+        return chrome_options
+
+    def _configure_browser(self, driver):
+        """Blocks heavy requests through CDP and caps the page load time of the lean browser."""
+        from selenium.common.exceptions import WebDriverException
+
+        if not self.lean_browser:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.warning(f"Could not block resources in the browser: {e}")
+        driver.set_page_load_timeout(self.page_load_timeout)
 
     @contextmanager
     def _get_browser(self):
         """Sets up and returns a Chrome browser for scraping."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
         driver = None
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--remote-debugging-port=9222")
-            
-            # Use the same user agent as the base scraper
-            chrome_options.add_argument(f"user-agent={self.session.headers['User-Agent']}")
+            chrome_options = self._get_browser_options()
             
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            with self.metrics.span('browser_startup'):
+                service = Service(ChromeDriverManager().install())
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+                self._configure_browser(driver)
             yield driver
         finally:
             if driver:
-                driver.quit()
+                with self.metrics.span('browser_quit'):
+                    driver.quit()
+
+    def _load_page(self, driver, url):
+        """
+        Loads a page in the browser and records its time and transferred bytes.
+
+        In the lean browser a page that is still loading after the timeout is
+        stopped and used as it is, since the article content is in the DOM
+        long before the last third-party resource arrives.
+
+        Args:
+            driver (WebDriver): Browser
+            url (str): URL of the page
+        """
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        self.throttle(url)
+        with self.metrics.span('page_load', url):
+            try:
+                driver.get(url)
+            except TimeoutException:
+                if not self.lean_browser:
+                    raise
+                logger.warning(f"Page load timeout ({self.page_load_timeout}s), stopping {url}")
+                self.metrics.incr('page_load_timeouts')
+                driver.execute_script("window.stop();")
+        self.metrics.incr('browser_fetches')
+        
+        try:
+            transfer_bytes, requests_count = driver.execute_script(PAGE_TRANSFER_SCRIPT)
+        except WebDriverException as e:
+            logger.debug(f"Could not read the transfer size of {url}: {e}")
+            return
+        self.metrics.incr('browser_transfer_bytes', int(transfer_bytes))
+        self.metrics.incr('browser_requests', int(requests_count))
+        logger.debug(f"Loaded {url}: {requests_count} requests, {transfer_bytes} bytes")
 
     def _get_fact_check_urls(self, limit):
         """Gets fact-check URLs from the main page."""
+        from selenium.webdriver.common.by import By
+
         # Use the base class to check robots.txt
         if self.respect_robots and not self._can_access(self.fact_check_url):
             return []
             
         with self._get_browser() as driver:
             try:
-                driver.get(self.fact_check_url)
-                time.sleep(3)
+                self._load_page(driver, self.fact_check_url)
+                with self.metrics.span('listing_wait', self.fact_check_url):
+                    time.sleep(3)
                 
                 urls = []
                 click_attempts = 0
@@ -82,9 +253,10 @@ class NewtralScraper(BaseScraper):
                             break
                         
                         driver.execute_script("arguments[0].scrollIntoView();", load_more)
-                        driver.execute_script("arguments[0].click();", load_more)
-                        
-                        time.sleep(3)
+                        self.throttle(self.fact_check_url)
+                        with self.metrics.span('load_more', self.fact_check_url):
+                            driver.execute_script("arguments[0].click();", load_more)
+                            time.sleep(3)
                         
                         links = driver.find_elements(By.CSS_SELECTOR, ".card-title-link")
                         for link in links:
@@ -108,121 +280,360 @@ class NewtralScraper(BaseScraper):
                 logger.error(f"Error al extraer URLs: {e}")
                 return []
 
+    def _get_listing_page(self, page, session=None):
+        """
+        Gets the article URLs of a page of the fact-check listing over HTTP.
+
+        Args:
+            page (int): Page number, starting at 1
+            session (requests.Session, optional): Session of the worker thread
+
+        Returns:
+            list: Article URLs of the page, empty after the last page
+        """
+        url = self.fact_check_url if page == 1 else self.listing_page_url.format(page=page)
+        try:
+            response = self.get_page(url, session=session)
+        except HTTPError as e:
+            # Past the last page the listing answers 404
+            if e.response is not None and e.response.status_code == 404:
+                return []
+            raise
+        return self.parse_listing(response.text)
+
+    def _get_listing_urls(self, limit, workers=4):
+        """
+        Gets fact-check URLs by requesting the listing pages directly.
+
+        Fetches the same pages of cards that the "Load more" button loads,
+        without a browser. The first page tells how many articles a page has;
+        the rest are requested in batches of up to `workers` pages at a time,
+        each worker thread with its own session.
+
+        The paginated URL is not a documented endpoint: if page 2 does not
+        exist or repeats the cards of page 1 (e.g. it redirects to it), the
+        listing format is taken as unsupported rather than as a one-page listing.
+
+        Args:
+            limit (int): Maximum number of URLs
+            workers (int): Pages fetched in parallel
+
+        Returns:
+            list: Article URLs
+
+        Raises:
+            ListingFormatError: If the first page has no article cards, or page 2
+                has no new ones.
+            RequestException: If a listing page cannot be fetched.
+        """
+        urls = list(self._get_listing_page(1))
+        if not urls:
+            raise ListingFormatError(f"No article cards found in {self.fact_check_url}")
+        per_page = len(urls)
+
+        # One session per worker thread, closed with the pool
+        local = threading.local()
+        sessions = []
+        sessions_lock = threading.Lock()
+
+        def fetch_page(page):
+            if not hasattr(local, 'session'):
+                local.session = self.new_session()
+                with sessions_lock:
+                    sessions.append(local.session)
+            return self._get_listing_page(page, session=local.session)
+
+        next_page = 2
+        exhausted = False
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while len(urls) < limit and not exhausted and next_page <= MAX_LISTING_PAGES:
+                    # Only as many pages as are still needed
+                    needed = -(-(limit - len(urls)) // per_page)
+                    pages = range(next_page, min(next_page + min(needed, workers), MAX_LISTING_PAGES + 1))
+                    for page, page_urls in zip(pages, executor.map(fetch_page, pages)):
+                        new_urls = [url for url in page_urls if url not in urls]
+                        if not new_urls:
+                            # Without a working page 2 the pagination endpoint is not the expected one
+                            if page == 2:
+                                raise ListingFormatError(
+                                    f"Page 2 of the listing ({self.listing_page_url.format(page=2)}) has no new cards"
+                                )
+                            # A later empty page, or one repeating known cards, is the end of the listing
+                            exhausted = True
+                            break
+                        urls.extend(new_urls)
+                    next_page = pages.stop
+        finally:
+            for session in sessions:
+                session.close()
+
+        # Filter URLs based on robots.txt
+        if self.respect_robots:
+            urls = [url for url in urls if self._can_access(url)]
+
+        logger.info(f"Listado: {next_page - 1} páginas consultadas, {len(urls)} URLs")
+        return urls[:limit]
+
+    def _get_sitemap_urls(self, limit, known=None, since=None):
+        """
+        Gets fact-check URLs from the site's XML sitemaps, without a browser.
+
+        The sitemaps declared in robots.txt (or the default sitemap index) are
+        fetched and parsed incrementally, following sitemap indexes. Only
+        fact-check pages that are new or changed since they were last scraped
+        are kept, most recently modified first.
+
+        Args:
+            limit (int): Maximum number of URLs
+            known (dict, optional): Datetime of the last scrape by URL. Known URLs
+                are kept only if their <lastmod> is later.
+            since (datetime, optional): Skip pages and child sitemaps last modified
+                before this moment.
+
+        Returns:
+            list: Article URLs
+        """
+        known = known or {}
+        pending = self.robots_parser.site_maps(self.base_url) if self.respect_robots else []
+        pending = pending or [self.sitemap_url]
+        visited = set()
+        candidates = {}
+
+        while pending:
+            sitemap_url = pending.pop(0)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+
+            try:
+                response = self.get_page(sitemap_url)
+            except (PermissionError, RequestException) as e:
+                logger.warning(f"No se pudo descargar el sitemap {sitemap_url}: {e}")
+                continue
+            self.metrics.incr('sitemaps_fetched')
+
+            try:
+                with self.metrics.span('sitemap_parse', sitemap_url):
+                    for entry in iter_sitemap(response.content):
+                        if since and entry.lastmod and entry.lastmod < since:
+                            continue
+                        if entry.kind == 'sitemap':
+                            pending.append(entry.loc)
+                        elif FACT_CHECK_URL_PATTERN.match(entry.loc) and is_newer(entry, known):
+                            candidates[entry.loc] = entry
+            except ParseError as e:
+                logger.warning(f"Sitemap no válido {sitemap_url}: {e}")
+
+        # Most recently modified first; pages without <lastmod> go last
+        entries = sorted(
+            candidates.values(),
+            key=lambda entry: (entry.lastmod is not None, entry.lastmod and entry.lastmod.timestamp()),
+            reverse=True
+        )
+
+        urls = []
+        for position, entry in enumerate(entries):
+            if len(urls) >= limit:
+                # Left for the next run, which must not skip them by `since`
+                self.metrics.incr('sitemap_urls_pending', len(entries) - position)
+                break
+            if self._can_access(entry.loc):
+                urls.append(entry.loc)
+
+        logger.info(f"Sitemaps: {len(visited)} leídos, {len(candidates)} fact-checks nuevos o modificados")
+        return urls
+
+    def parse_listing(self, html):
+        """
+        Parses the article URLs from the HTML of a fact-check listing page.
+
+        Args:
+            html (str): HTML of the listing page (or a fragment with article cards)
+
+        Returns:
+            list: Article URLs without duplicates, in page order
+        """
+        return LISTING_SCHEMA.extract(self.make_soup(html))['urls']
+
     def _extract_article_data(self, url):
         """Extracts data from an individual fact-check article."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         with self._get_browser() as driver:
             try:
-                driver.get(url)
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".post-title-1, h1"))
-                )
-                
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-                
-                # Extract basic article data
-                title_element = soup.select_one(".post-title-1") or soup.select_one("h1")
-                title = title_element.get_text(strip=True) if title_element else None
-                
-                date_element = soup.select_one(".post-date")
-                from apps.scraper.models import FactCheckArticle
-                publish_date = FactCheckArticle.parse_date(date_element.get_text(strip=True)) if date_element else None
-                
-                author_element = soup.select_one(".post-author .author-link")
-                author = author_element.get_text(strip=True) if author_element else None
+                self._load_page(driver, url)
+                with self.metrics.span('wait', url):
+                    WebDriverWait(driver, 30).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ".post-title-1, h1"))
+                    )
                 
-                # Extract content
-                content_element = soup.select_one(".section-post-content")
-                content = ""
-                if content_element:
-                    paragraphs = content_element.find_all('p')
-                    content = " ".join([p.get_text(strip=True) for p in paragraphs])
-                
-                # Extract claim
-                mark_element = soup.select_one("mark")
-                claim = None
-                if mark_element:
-                    claim = mark_element.get_text(strip=True)
-                    claim = re.sub(r'^["""]|["""]$', '', claim)
-                
-                # Extract claim source
-                claim_source_element = soup.select_one(".card-author-text-link")
-                claim_source = claim_source_element.get_text(strip=True) if claim_source_element else None
-                
-                # Find verification category
-                verification_category = None
-                verification_selectors = {
-                    ".card-text-marked-red": "Falso",
-                    ".card-text-marked-orange": "Engañoso",
-                    ".card-text-marked-pistachio": "Verdad a medias",
-                    ".card-text-marked-green": "Verdadero"
-                }
-                
-                for selector, category in verification_selectors.items():
-                    if soup.select_one(selector):
-                        verification_category = category
-                        break
-                
-                # Fallback method for category
-                if not verification_category:
-                    possible_categories = ["Verdad a medias", "Falso", "Engañoso", "Verdadero"]
-                    for category in possible_categories:
-                        elements = soup.find_all(string=lambda text: category in text if text else False)
-                        if elements:
-                            verification_category = category
-                            break
-                
-                # Extract tags
-                tags = []
-                tag_elements = soup.select(".section-post-tags .pill-outline")
-                for tag_element in tag_elements:
-                    tag_text = tag_element.get_text(strip=True)
-                    if tag_text:
-                        tags.append(tag_text)
-                
-                # Return article data
-                return {
-                    "title": title,
-                    "url": url,
-                    "verification_category": verification_category,
-                    "publish_date": publish_date,
-                    "claim": claim,
-                    "claim_source": claim_source,
-                    "content": content,
-                    "tags": tags,
-                    "author": author,
-                    "scraped_at": timezone.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
+                if self.extract_in_browser:
+                    if self.html_archive:
+                        self.archive_page(url, driver.page_source)
+                    with self.metrics.span('extract', url):
+                        fields = ARTICLE_SCHEMA.extract_from_driver(driver)
+                    return self._build_article(fields, url)
+                with self.metrics.span('page_source', url):
+                    html = driver.page_source
+                self.metrics.incr('bytes_fetched', len(html.encode('utf-8')))
+                self.archive_page(url, html)
+                return self.parse_article(html, url)
                 
             except Exception as e:
                 logger.error(f"Error al extraer artículo {url}: {e}")
                 return None
 
+    def _extract_articles_async(self, urls):
+        """
+        Downloads the articles concurrently over HTTP and extracts them.
+
+        The pages are fetched by an AsyncNewtralScraper that shares this
+        scraper's rate limiter, HTTP cache, HTML archive and metrics, and are
+        parsed here once they have all arrived.
+
+        Args:
+            urls (list): Article URLs
+
+        Returns:
+            list: Extracted article data of the pages that could be fetched
+        """
+        from .newtral_async import AsyncNewtralScraper
+
+        async def fetch_all():
+            fetcher = AsyncNewtralScraper(
+                respect_robots=self.respect_robots,
+                max_retries=self.max_retries,
+                retry_delay=self.retry_delay,
+                rate_limiter=self.rate_limiter,
+                http_cache=self.http_cache,
+                parser=self.parser,
+                metrics=self.metrics,
+                html_archive=self.html_archive,
+                max_concurrency=self.max_concurrency,
+            )
+            async with fetcher:
+                return await fetcher.scrape(urls=urls)
+
+        articles = []
+        for url, html in zip(urls, asyncio.run(fetch_all())):
+            if isinstance(html, Exception):
+                continue
+            try:
+                articles.append(self.parse_article(html, url))
+            except Exception as e:
+                logger.error(f"Error al extraer artículo {url}: {e}")
+        return articles
+
+    def parse_article(self, html, url):
+        """
+        Parses the HTML of a fact-check article into a dictionary of fields.
+
+        Args:
+            html (str): HTML of the article page
+            url (str): URL of the article
+
+        Returns:
+            dict: Extracted article data
+        """
+        return self.extract_article(self.make_soup(html), url)
+
+    def extract_article(self, soup, url):
+        """
+        Extracts the article fields from an already parsed page.
+
+        Args:
+            soup (BeautifulSoup): Parsed article page
+            url (str): URL of the article
+
+        Returns:
+            dict: Extracted article data
+        """
+        with self.metrics.span('extract', url):
+            fields = ARTICLE_SCHEMA.extract(soup)
+        return self._build_article(fields, url)
+
+    def _build_article(self, fields, url):
+        """Completes the extracted fields with the article metadata."""
+        return {
+            "title": fields['title'],
+            "url": url,
+            "verification_category": fields['verification_category'],
+            "publish_date": fields['publish_date'],
+            "claim": fields['claim'],
+            "claim_source": fields['claim_source'],
+            "content": fields['content'],
+            "tags": fields['tags'],
+            "author": fields['author'],
+            "scraped_at": timezone.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
     def _can_access(self, url):
         """Check if we can access a URL based on robots.txt"""
         if not self.respect_robots:
             return True
-        return self.robots_parser.can_fetch(url, self.session.headers.get('User-Agent'))
+        with self.metrics.span('robots', url):
+            allowed = self.robots_parser.can_fetch(url, self.session.headers.get('User-Agent'))
+        if not allowed:
+            self.metrics.incr('robots_denials')
+        return allowed
 
-    def scrape(self, limit=10, **kwargs):
+    def scrape(self, limit=10, discovery='listing', known=None, since=None, fetch='browser', **kwargs):
         """
         Main method to extract fact-checks from Newtral.
+
+        Args:
+            limit (int): Maximum number of articles
+            discovery (str): How article URLs are found: 'listing' (listing pages
+                over HTTP, falling back to the browser), 'browser' (clicking
+                "Load more" on the listing) or 'sitemap' (XML sitemaps, no browser)
+            known (dict, optional): Datetime of the last scrape by URL, used by the
+                sitemap discovery to skip unchanged articles
+            since (datetime, optional): Last successful sitemap scrape; the sitemap
+                discovery skips the pages and child sitemaps not modified after it
+            fetch (str): How articles are downloaded: 'browser' (one page at a time
+                in Selenium) or 'async' (concurrent HTTP requests, no browser)
+
+        Returns:
+            list: Extracted article data
         """
-        logger.info(f"Iniciando extracción con límite: {limit}")
+        if discovery not in DISCOVERY_BACKENDS:
+            raise ValueError(f"Unknown discovery backend: {discovery}")
+        if fetch not in FETCH_BACKENDS:
+            raise ValueError(f"Unknown fetch backend: {fetch}")
+        logger.info(f"Iniciando extracción con límite: {limit} (descubrimiento: {discovery})")
         
-        # Rotate user agent
+        # Rotate user agent (a pinned one is kept for the whole run)
+        self.user_agent_manager.reset_pin()
         self.rotate_user_agent()
         
         # Get article URLs
-        article_urls = self._get_fact_check_urls(limit)
+        if discovery == 'sitemap':
+            article_urls = self._get_sitemap_urls(limit, known=known, since=since)
+        elif discovery == 'listing':
+            try:
+                article_urls = self._get_listing_urls(limit)
+            except (ListingFormatError, RequestException, PermissionError) as e:
+                logger.warning(f"No se pudo leer el listado sin navegador ({e}), usando el navegador")
+                article_urls = self._get_fact_check_urls(limit)
+        else:
+            article_urls = self._get_fact_check_urls(limit)
         logger.info(f"URLs a procesar: {len(article_urls)}")
         
         # Extract articles
-        articles = []
-        for url in article_urls:
-            article = self._extract_article_data(url)
-            if article:
-                articles.append(article)
-                logger.info(f"Artículo extraído: {article.get('title', 'Sin título')}")
+        if fetch == 'async':
+            articles = self._extract_articles_async(article_urls)
+        else:
+            articles = []
+            for url in article_urls:
+                article = self._extract_article_data(url)
+                if article:
+                    articles.append(article)
+                    logger.info(f"Artículo extraído: {article.get('title', 'Sin título')}")
+        if len(articles) < len(article_urls):
+            self.metrics.incr('articles_skipped', len(article_urls) - len(articles))
         
         logger.info(f"Extracción completada. {len(articles)} artículos extraídos")
         return articles
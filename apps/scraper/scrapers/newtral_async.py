@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from .async_base import AsyncBaseScraper
+
+logger = logging.getLogger(__name__)
+
+class AsyncNewtralScraper(AsyncBaseScraper):
+    """
+    Async scraper that downloads Newtral article pages concurrently over HTTP.
+
+    It only fetches (and archives) the pages; NewtralScraper extracts the
+    articles from them, see NewtralScraper.scrape(fetch='async').
+    """
+
+    def __init__(self, respect_robots=True, **kwargs):
+        """
+        Initialize the async Newtral scraper.
+
+        Args:
+            respect_robots (bool): Whether to respect robots.txt instructions.
+            **kwargs: Other AsyncBaseScraper options (max_concurrency, rate_limiter, ...).
+        """
+        super().__init__(
+            base_url="https://www.newtral.es",
+            name="AsyncNewtralScraper",
+            respect_robots=respect_robots,
+            **kwargs
+        )
+
+    async def fetch_article(self, url):
+        """
+        Download an article page and keep its HTML in the archive.
+
+        Args:
+            url (str): URL of the article
+
+        Returns:
+            str: HTML of the page
+        """
+        response = await self.get_page(url)
+        html = response.text
+        if self.html_archive:
+            # Compression and SQLite writes would block the event loop
+            await asyncio.to_thread(self.archive_page, url, html)
+        return html
+
+    async def scrape(self, urls=(), **kwargs):
+        """
+        Download several article pages concurrently.
+
+        Failures do not cancel the other pages; they are logged and returned
+        in place of the HTML.
+
+        Args:
+            urls (list): Article URLs
+
+        Returns:
+            list: HTML of each page (or the exception raised for it), in the
+                  same order as `urls`
+        """
+        results = await asyncio.gather(*[self.fetch_article(url) for url in urls], return_exceptions=True)
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error downloading {url}: {result}")
+        return results
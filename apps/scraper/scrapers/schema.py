@@ -0,0 +1,275 @@
+import json
+import logging
+import re
+import soupsieve
+from bs4 import Tag
+
+logger = logging.getLogger(__name__)
+
+# Rightmost simple selector (".class", "#id" or "tag") of a CSS selector
+_KEY_PATTERN = re.compile(r'(?:^|[\s>+~])([.#]?[A-Za-z][\w-]*)(?:[.#:\[][^\s>+~]*)?\s*$')
+
+class Field:
+    """
+    Declarative description of a field extracted from a page.
+
+    A field is a chain of CSS selectors in order of precedence: the first
+    selector that matches anything in the document provides the value.
+    """
+
+    def __init__(self, name, selectors, post=None, many=False, default=None, text_search=(), attr=None):
+        """
+        Initialize the field.
+
+        Args:
+            name (str): Key of the field in the extracted data.
+            selectors (list): CSS selectors in order of precedence. An item can also be
+                a (selector, value) pair, in which case a match yields `value` instead
+                of the element text.
+            post (callable, optional): Post-processor applied to the extracted value.
+            many (bool): Whether to return the texts of all matching elements
+                instead of only the first one.
+            default: Value used when nothing matches. Callables (e.g. `list`) are
+                called to build a fresh default for each page.
+            text_search (tuple): Strings searched in the text of the page when no
+                selector matches, in order of precedence. The first one found is
+                the value of the field.
+            attr (str, optional): Attribute to read from the matched elements instead
+                of their text (e.g. 'href').
+        """
+        self.name = name
+        self.selectors = [item if isinstance(item, tuple) else (item, None) for item in selectors]
+        self.post = post
+        self.many = many
+        self.default = default
+        self.text_search = tuple(text_search)
+        self.attr = attr
+
+    def read(self, element):
+        """Read the value of a matched element (its text or the configured attribute)."""
+        if self.attr:
+            return element.get(self.attr)
+        return element.get_text(strip=True)
+
+
+class ExtractionSchema:
+    """
+    Set of fields compiled once and evaluated together.
+
+    Selectors are compiled when the schema is created and indexed by the tag
+    name or class of their rightmost element, so extracting a page visits the
+    document tree a single time and only runs the full CSS match for the few
+    selectors that can apply to each element. The same schema can also run in
+    a Selenium browser, evaluating every field in one script round-trip.
+    """
+
+    def __init__(self, fields):
+        """
+        Compile the schema.
+
+        Args:
+            fields (list): Field instances
+        """
+        self.fields = list(fields)
+        self.by_class = {}   # Selectors indexed by the class of their rightmost element
+        self.by_tag = {}     # Selectors indexed by the tag of their rightmost element
+        self.unindexed = []  # Selectors that must be tested against every element
+        self.needles = tuple(dict.fromkeys(
+            needle for field in self.fields for needle in field.text_search
+        ))
+
+        for field_index, field in enumerate(self.fields):
+            for selector_index, (selector, _) in enumerate(field.selectors):
+                entry = (field_index, selector_index, soupsieve.compile(selector))
+                key = self._get_selector_key(selector)
+                if key is None:
+                    self.unindexed.append(entry)
+                elif key.startswith('.'):
+                    self.by_class.setdefault(key[1:], []).append(entry)
+                elif key.startswith('#'):
+                    self.unindexed.append(entry)
+                else:
+                    self.by_tag.setdefault(key.lower(), []).append(entry)
+
+        self.browser_script = self._build_browser_script()
+
+    def _get_selector_key(self, selector):
+        """
+        Get the index key of a selector from its rightmost simple selector.
+
+        Args:
+            selector (str): CSS selector
+
+        Returns:
+            str: '.class', '#id' or tag name, or None if the selector cannot be indexed
+        """
+        if ',' in selector:
+            return None
+        match = _KEY_PATTERN.search(selector.strip())
+        return match.group(1) if match else None
+
+    def extract(self, soup):
+        """
+        Extract every field from a parsed page in a single traversal.
+
+        Args:
+            soup (BeautifulSoup): Parsed page
+
+        Returns:
+            dict: Extracted values by field name
+        """
+        # matches[field][selector] holds the matching elements in document order
+        matches = [[[] for _ in field.selectors] for field in self.fields]
+        found_text = set()
+        by_tag, by_class, unindexed, needles = self.by_tag, self.by_class, self.unindexed, self.needles
+        many = [field.many for field in self.fields]
+
+        def match(node, entries):
+            for field_index, selector_index, compiled in entries:
+                found = matches[field_index][selector_index]
+                if (not found or many[field_index]) and compiled.match(node):
+                    found.append(node)
+
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                entries = by_tag.get(node.name)
+                if entries:
+                    match(node, entries)
+                classes = node.attrs.get('class')
+                if classes:
+                    for css_class in classes:
+                        entries = by_class.get(css_class)
+                        if entries:
+                            match(node, entries)
+                if unindexed:
+                    match(node, unindexed)
+
+            elif needles:
+                # Remaining nodes are text (NavigableString and its subclasses)
+                for needle in needles:
+                    if needle in node:
+                        found_text.add(needle)
+
+        results = {}
+        for field, field_matches in zip(self.fields, matches):
+            raw = None
+            for (_, value), elements in zip(field.selectors, field_matches):
+                if elements:
+                    raw = {'value': value, 'texts': [field.read(element) for element in elements]}
+                    break
+            results[field.name] = self._finalize(field, raw, found_text)
+
+        return results
+
+    def extract_from_driver(self, driver):
+        """
+        Extract every field from the page loaded in a Selenium browser.
+
+        All selectors are evaluated by one script in the browser, so only the
+        matched texts travel back instead of the whole page source.
+
+        Args:
+            driver (selenium.webdriver.Remote): Browser with the page loaded
+
+        Returns:
+            dict: Extracted values by field name
+        """
+        raw_results = driver.execute_script(self.browser_script)
+        found_text = set(raw_results.get('text', []))
+
+        results = {}
+        for field_index, field in enumerate(self.fields):
+            raw = None
+            selector_index = raw_results['fields'][field_index]
+            if selector_index is not None:
+                raw = {
+                    'value': field.selectors[selector_index][1],
+                    'texts': raw_results['texts'][field_index],
+                }
+            results[field.name] = self._finalize(field, raw, found_text)
+
+        return results
+
+    def _finalize(self, field, raw, found_text):
+        """
+        Turn the raw match of a field into its final value.
+
+        Args:
+            field (Field): Field being extracted
+            raw (dict): Matched texts and selector value, or None if nothing matched
+            found_text (set): Search strings found in the page text
+
+        Returns:
+            Extracted value of the field
+        """
+        if raw is None:
+            needle = next((needle for needle in field.text_search if needle in found_text), None)
+            if needle is None:
+                return field.default() if callable(field.default) else field.default
+            value = needle
+        elif raw['value'] is not None:
+            value = raw['value']
+        elif field.many:
+            value = raw['texts']
+        else:
+            value = raw['texts'][0]
+
+        if field.post:
+            try:
+                value = field.post(value)
+            except Exception as e:
+                logger.warning(f"Error post-processing field '{field.name}': {e}")
+                return field.default() if callable(field.default) else field.default
+        return value
+
+    def _build_browser_script(self):
+        """
+        Build the JavaScript that evaluates the schema in a browser.
+
+        Returns:
+            str: Script returning the winning selector and texts for each field
+        """
+        spec = {
+            'fields': [
+                {
+                    'selectors': [selector for selector, _ in field.selectors],
+                    'many': field.many,
+                    'attr': field.attr,
+                }
+                for field in self.fields
+            ],
+            'needles': list(self.needles),
+        }
+        # text() mirrors BeautifulSoup's get_text(strip=True)
+        return """
+            const spec = %s;
+            const text = (element) => {
+                const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+                const parts = [];
+                while (walker.nextNode()) {
+                    const part = walker.currentNode.nodeValue.trim();
+                    if (part) parts.push(part);
+                }
+                return parts.join('');
+            };
+            const result = {fields: [], texts: [], text: []};
+            for (const field of spec.fields) {
+                let winner = null;
+                let texts = [];
+                for (let i = 0; i < field.selectors.length; i++) {
+                    const elements = field.many
+                        ? Array.from(document.querySelectorAll(field.selectors[i]))
+                        : [document.querySelector(field.selectors[i])].filter(Boolean);
+                    if (elements.length) {
+                        winner = i;
+                        texts = elements.map((element) => field.attr ? element.getAttribute(field.attr) : text(element));
+                        break;
+                    }
+                }
+                result.fields.push(winner);
+                result.texts.push(texts);
+            }
+            const pageText = document.documentElement.textContent;
+            result.text = spec.needles.filter((needle) => pageText.includes(needle));
+            return result;
+        """ % json.dumps(spec)
@@ -1,11 +1,18 @@
 import logging
+import sqlite3
 from datetime import datetime
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
-from .models import FactCheckArticle, VerificationCategory
+from .models import FactCheckArticle, VerificationCategory, ScrapeRun
 from .scrapers.newtral import NewtralScraper
-logger = logging.getLogger(__name__)
-
+from .utils.metrics import ScrapeMetrics
+from .utils.html_archive import HtmlArchive
+from .utils.http_cache import HttpCache
+from .utils.rate_limiter import RateLimiter
+from .cache import invalidate_statistics
+from .reputation import refresh_source_reputation
+from .entities import EntityResolver
 logger = logging.getLogger(__name__)
 
 class ScraperService:
@@ -16,33 +23,80 @@ class ScraperService:
     y almacena los resultados en la base de datos de manera transaccional.
     """
     
-    def scrape_newtral(self, limit=10, respect_robots=True):
+    def __init__(self):
+        # Métricas y registro de la última ejecución, para mostrarlos al terminar
+        self.last_metrics = None
+        self.last_run = None
+        # Fuentes y autores ya resueltos, compartidos por los artículos de una ejecución
+        self.resolver = EntityResolver()
+    
+    def scrape_newtral(self, limit=10, respect_robots=True, discovery='listing', lean_browser=True,
+                       async_fetch=False):
         """
         Extrae fact-checks de Newtral y los almacena en la base de datos.
         
         Args:
             limit (int): Número máximo de artículos a extraer.
             respect_robots (bool): Si se deben respetar las directivas de robots.txt.
+            discovery (str): Cómo se descubren las URLs: 'listing' (páginas del listado
+                por HTTP, con el navegador como respaldo), 'browser' (listado con
+                Selenium) o 'sitemap' (sitemaps XML, solo artículos nuevos o modificados).
+            lean_browser (bool): Si el navegador bloquea imágenes, fuentes, vídeos y
+                dominios de publicidad/analítica y lee la página en cuanto el DOM está listo.
+            async_fetch (bool): Si los artículos se descargan por HTTP de forma concurrente,
+                sin navegador, con el límite de SCRAPER_ASYNC_RATE / SCRAPER_ASYNC_BURST.
             
         Returns:
             tuple: (total_articles, new_articles, updated_articles, failed_articles)
         """
-        from apps.scraper.utils.logging_config import configure_logging
-        logger = configure_logging()
-
         logger.info(f"Iniciando extracción de fact-checks de Newtral (limit={limit})")
         
+        # Medir cada etapa de la ejecución
+        started_at = timezone.now()
+        metrics = ScrapeMetrics()
+        self.last_metrics = metrics
+        
+        # Las claves resueltas en ejecuciones anteriores pueden ser de filas borradas o fusionadas
+        self.resolver = EntityResolver()
+        
         # Inicializar scraper de Newtral
-        scraper = NewtralScraper(respect_robots=respect_robots)
+        html_archive = self._get_html_archive()
+        http_cache = self._get_http_cache()
+        scraper = NewtralScraper(
+            respect_robots=respect_robots,
+            metrics=metrics,
+            lean_browser=lean_browser,
+            html_archive=html_archive,
+            http_cache=http_cache,
+            rate_limiter=self._get_async_rate_limiter() if async_fetch else None,
+            max_concurrency=settings.SCRAPER_ASYNC_CONCURRENCY
+        )
+        
+        # Con sitemaps se descartan los artículos que no han cambiado desde su extracción,
+        # y los sitemaps y páginas sin cambios desde la última ejecución correcta
+        known = None
+        since = None
+        if discovery == 'sitemap':
+            known = dict(FactCheckArticle.objects.values_list('url', 'scraped_at'))
+            since = self._get_sitemap_since()
         
         # Extraer artículos
         extracted_articles = []
         try:
-            extracted_articles = scraper.scrape(limit=limit)
+            extracted_articles = scraper.scrape(
+                limit=limit, discovery=discovery, known=known, since=since,
+                fetch='async' if async_fetch else 'browser'
+            )
             logger.info(f"Extracción completada: {len(extracted_articles)} artículos obtenidos")
         except Exception as e:
             logger.error(f"Error durante la extracción: {e}")
+            self.last_run = self._save_run('newtral', started_at, metrics, (0, 0, 0, 0))
             return 0, 0, 0, 0
+        finally:
+            if html_archive:
+                html_archive.close()
+            if http_cache:
+                http_cache.close()
         
         # Estadísticas para devolver
         total_articles = len(extracted_articles)
@@ -50,71 +104,237 @@ class ScraperService:
         updated_articles = 0
         failed_articles = 0
         
+        # Resolver de una vez las fuentes y autores nuevos del lote
+        try:
+            with metrics.span('resolve_entities'):
+                self.resolver.prefetch(extracted_articles)
+        except Exception as e:
+            logger.error(f"Error resolviendo fuentes y autores: {e}")
+        
         # Procesar y guardar cada artículo
         for article_data in extracted_articles:
-            try:
-                with transaction.atomic():
-                    # Extraer datos
-                    url = article_data.get('url')
-                    title = article_data.get('title')
-                    publish_date = article_data.get('publish_date')
-                    
-                    if not url or not title:
-                        logger.warning(f"Artículo descartado por falta de datos esenciales: {article_data}")
-                        failed_articles += 1
-                        continue
-                    
-                    # Parsear fecha usando el método del modelo
-                    parsed_date = FactCheckArticle.parse_date(publish_date)
-                    
-                    # Encontrar o crear categoría de verificación
-                    verification_category = None
-                    category_name = article_data.get('verification_category')
-                    if category_name:
-                        verification_category, _ = VerificationCategory.objects.get_or_create(
-                            name=category_name,
-                            defaults={'description': f'Categoría de verificación: {category_name}'}
-                        )
-                    
-                    # Comprobar si el artículo ya existe (por URL)
-                    article, created = FactCheckArticle.objects.get_or_create(
-                        url=url,
-                        defaults={
-                            'title': title,
-                            'publish_date': parsed_date,
-                            'claim': article_data.get('claim', ''),
-                            'claim_source': article_data.get('claim_source', ''),
-                            'content': article_data.get('content', ''),
-                            'tags': article_data.get('tags', []),
-                            'author': article_data.get('author', ''),
-                            'verification_category': verification_category,
-                            'scraped_at': timezone.now(),
-                            'is_processed': False
-                        }
+            with metrics.span('db_write', article_data.get('url')):
+                status = self.save_article(article_data)
+            if status == 'new':
+                new_articles += 1
+            elif status == 'updated':
+                updated_articles += 1
+            else:
+                failed_articles += 1
+        
+        # Las estadísticas cacheadas y la reputación de las fuentes ya no reflejan los datos guardados
+        if new_articles or updated_articles:
+            with metrics.span('reputation_refresh'):
+                self.refresh_source_reputation()
+            invalidate_statistics()
+        
+        counts = (total_articles, new_articles, updated_articles, failed_articles)
+        self.last_run = self._save_run('newtral', started_at, metrics, counts)
+        return counts
+    
+    def save_article(self, article_data):
+        """
+        Guarda un artículo extraído, creándolo o actualizándolo según su URL.
+        
+        Args:
+            article_data (dict): Datos del artículo devueltos por el scraper.
+            
+        Returns:
+            str: 'new', 'updated' o 'failed'
+        """
+        try:
+            # Fuera de la transacción, para no guardar en caché claves de filas revertidas
+            canonical_source_id = self.resolver.source_id(article_data.get('claim_source'))
+            canonical_author_id = self.resolver.author_id(article_data.get('author'))
+            
+            with transaction.atomic():
+                # Extraer datos
+                url = article_data.get('url')
+                title = article_data.get('title')
+                publish_date = article_data.get('publish_date')
+                
+                if not url or not title:
+                    logger.warning(f"Artículo descartado por falta de datos esenciales: {article_data}")
+                    return 'failed'
+                
+                # Parsear fecha usando el método del modelo
+                parsed_date = FactCheckArticle.parse_date(publish_date)
+                
+                # Encontrar o crear categoría de verificación
+                verification_category = None
+                category_name = article_data.get('verification_category')
+                if category_name:
+                    verification_category, _ = VerificationCategory.objects.get_or_create(
+                        name=category_name,
+                        defaults={'description': f'Categoría de verificación: {category_name}'}
                     )
-                    
-                    if created:
-                        new_articles += 1
-                        logger.info(f"Nuevo artículo creado: {title}")
-                    else:
-                        # Actualizar artículo existente
-                        article.title = title
-                        if parsed_date:
-                            article.publish_date = parsed_date
-                        article.claim = article_data.get('claim', article.claim)
-                        article.claim_source = article_data.get('claim_source', article.claim_source)
-                        article.content = article_data.get('content', article.content)
-                        article.tags = article_data.get('tags', article.tags)
-                        article.author = article_data.get('author', article.author)
-                        article.verification_category = verification_category or article.verification_category
-                        article.scraped_at = timezone.now()
-                        article.save()
-                        
-                        updated_articles += 1
-                        logger.info(f"Artículo actualizado: {title}")
+                
+                # Comprobar si el artículo ya existe (por URL)
+                article, created = FactCheckArticle.objects.get_or_create(
+                    url=url,
+                    defaults={
+                        'title': title,
+                        'publish_date': parsed_date,
+                        'claim': article_data.get('claim', ''),
+                        'claim_source': article_data.get('claim_source', ''),
+                        'content': article_data.get('content', ''),
+                        'tags': article_data.get('tags', []),
+                        'author': article_data.get('author', ''),
+                        'canonical_source_id': canonical_source_id,
+                        'canonical_author_id': canonical_author_id,
+                        'verification_category': verification_category,
+                        'scraped_at': timezone.now(),
+                        'is_processed': False
+                    }
+                )
+                
+                if created:
+                    logger.info(f"Nuevo artículo creado: {title}")
+                    return 'new'
+                
+                # Actualizar artículo existente
+                article.title = title
+                if parsed_date:
+                    article.publish_date = parsed_date
+                article.claim = article_data.get('claim', article.claim)
+                article.claim_source = article_data.get('claim_source', article.claim_source)
+                article.content = article_data.get('content', article.content)
+                article.tags = article_data.get('tags', article.tags)
+                article.author = article_data.get('author', article.author)
+                article.canonical_source_id = canonical_source_id or article.canonical_source_id
+                article.canonical_author_id = canonical_author_id or article.canonical_author_id
+                article.verification_category = verification_category or article.verification_category
+                article.scraped_at = timezone.now()
+                article.save()
+                
+                logger.info(f"Artículo actualizado: {title}")
+                return 'updated'
+        
+        except Exception as e:
+            logger.error(f"Error procesando artículo: {e}")
+            return 'failed'
+    
+    def refresh_source_reputation(self):
+        """
+        Recalcula la tabla de reputación de las fuentes con los veredictos guardados.
+        """
+        try:
+            refresh_source_reputation()
+        except Exception as e:
+            logger.error(f"Error recalculando la reputación de las fuentes: {e}")
+    
+    def _get_sitemap_since(self, source='newtral', runs=20):
+        """
+        Obtiene desde cuándo buscar cambios en los sitemaps: el inicio de la última
+        ejecución correcta que los leyó.
+        
+        Solo sirve una ejecución que extrajo y guardó todos los fact-checks que
+        encontró; si dejó alguno pendiente por el límite o por un error, hay que
+        volver a leer los sitemaps completos para no saltárselo.
+        
+        Args:
+            source (str): Fuente de las ejecuciones.
+            runs (int): Número de ejecuciones recientes que se consultan.
             
-            except Exception as e:
-                failed_articles += 1
-                logger.error(f"Error procesando artículo: {e}")
+        Returns:
+            datetime: Inicio de esa ejecución, o None si hay que leerlos completos.
+        """
+        recent_runs = ScrapeRun.objects.filter(source=source, finished_at__isnull=False).order_by(
+            '-started_at'
+        ).values_list('started_at', 'total_articles', 'failed_articles', 'timings')[:runs]
+        for started_at, total_articles, failed_articles, timings in recent_runs:
+            counters = (timings or {}).get('counters', {})
+            # Ejecuciones con otro método de descubrimiento
+            if not counters.get('sitemaps_fetched'):
+                continue
+            if failed_articles or counters.get('sitemap_urls_pending') or counters.get('articles_skipped'):
+                return None
+            # Sin artículos nuevos (o sin conexión): sigue valiendo la ejecución anterior
+            if not total_articles:
+                continue
+            return started_at
+        return None
+    
+    def _get_async_rate_limiter(self):
+        """
+        Crea el limitador de la descarga asíncrona con la tasa y ráfaga configuradas.
+        
+        El limitador compartido permite 1 petición/s sin ráfagas, con lo que las
+        peticiones concurrentes esperarían igualmente su turno una a una.
+        
+        Returns:
+            RateLimiter: Limitador por host de esta ejecución.
+        """
+        return RateLimiter(default_rate=settings.SCRAPER_ASYNC_RATE, burst=settings.SCRAPER_ASYNC_BURST)
+    
+    def _get_http_cache(self):
+        """
+        Abre la caché HTTP con la que se hacen peticiones condicionales.
+        
+        Returns:
+            HttpCache: Caché configurada, o None si está desactivada o no se puede abrir.
+        """
+        if not settings.SCRAPER_HTTP_CACHE_ENABLED:
+            return None
+        try:
+            return HttpCache(settings.SCRAPER_HTTP_CACHE_PATH, max_bytes=settings.SCRAPER_HTTP_CACHE_MAX_BYTES)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"No se pudo abrir la caché HTTP en {settings.SCRAPER_HTTP_CACHE_PATH}: {e}")
+            return None
+    
+    def _get_html_archive(self):
+        """
+        Abre el archivo de HTML donde se guardan las páginas descargadas.
+        
+        Returns:
+            HtmlArchive: Archivo configurado, o None si está desactivado o no se puede abrir.
+        """
+        if not settings.HTML_ARCHIVE_ENABLED:
+            return None
+        try:
+            return HtmlArchive(settings.HTML_ARCHIVE_DIR)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"No se pudo abrir el archivo de HTML en {settings.HTML_ARCHIVE_DIR}: {e}")
+            return None
+    
+    def _save_run(self, source, started_at, metrics, counts):
+        """
+        Guarda el registro de una ejecución con sus contadores e informe de tiempos.
+        
+        Args:
+            source (str): Nombre de la fuente extraída.
+            started_at (datetime): Momento de inicio de la ejecución.
+            metrics (ScrapeMetrics): Tiempos y contadores medidos durante la ejecución.
+            counts (tuple): (total_articles, new_articles, updated_articles, failed_articles)
+            
+        Returns:
+            ScrapeRun: Registro creado, o None si no se pudo guardar.
+        """
+        total_articles, new_articles, updated_articles, failed_articles = counts
+        finished_at = timezone.now()
+        duration = (finished_at - started_at).total_seconds()
+        report = metrics.report()
         
-        return total_articles, new_articles, updated_articles, failed_articles
\ No newline at end of file
+        logger.info(f"Tiempo total de la ejecución: {duration:.1f}s")
+        try:
+            return ScrapeRun.objects.create(
+                source=source,
+                started_at=started_at,
+                finished_at=finished_at,
+                total_articles=total_articles,
+                new_articles=new_articles,
+                updated_articles=updated_articles,
+                failed_articles=failed_articles,
+                articles_per_second=round(total_articles / duration, 3) if duration > 0 else None,
+                bytes_fetched=metrics.count('bytes_fetched'),
+                retries=metrics.count('retries'),
+                robots_denials=metrics.count('robots_denials'),
+                browser_fetches=metrics.count('browser_fetches'),
+                http_fetches=metrics.count('http_fetches'),
+                http_cache_hits=metrics.count('http_cache_hits'),
+                http_cache_bytes_saved=metrics.count('http_cache_bytes_saved'),
+                timings=report
+            )
+        except Exception as e:
+            logger.error(f"Error guardando el registro de la ejecución: {e}")
+            return None
@@ -0,0 +1,56 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apps.scraper.models import FactCheckArticle, VerificationCategory
+from apps.scraper.pagination import EstimatedCountPaginator
+
+@pytest.fixture
+def articles():
+    """Creates articles spread over several verification categories."""
+    categories = [VerificationCategory.objects.create(name=name) for name in ("Falso", "Engañoso", "Verdadero")]
+    return FactCheckArticle.objects.bulk_create([
+        FactCheckArticle(
+            title=f"Artículo {i}", url=f"https://www.newtral.es/articulo-{i}/", claim="Afirmación",
+            claim_source="Redes", content="x" * 5000, verification_category=categories[i % 3]
+        )
+        for i in range(60)
+    ])
+
+@pytest.mark.django_db
+def test_changelist_query_count_does_not_grow_with_rows(admin_client, articles, django_assert_max_num_queries):
+    """
+    Tests that categories are joined instead of queried once per row.
+    """
+    url = reverse('admin:scraper_factcheckarticle_changelist')
+
+    # Session, user, count, page of rows and filter choices
+    with django_assert_max_num_queries(6):
+        response = admin_client.get(url)
+    assert response.status_code == 200
+    assert "Engañoso" in response.content.decode()
+
+    with django_assert_max_num_queries(6):
+        assert admin_client.get(url, {'verification_category__id__exact': articles[0].verification_category_id}).status_code == 200
+
+@pytest.mark.django_db
+def test_changelist_does_not_load_the_content(admin_client, articles):
+    """
+    Tests that the large text fields are left out of the changelist query.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        admin_client.get(reverse('admin:scraper_factcheckarticle_changelist'))
+
+    article_queries = [q['sql'] for q in queries if '"scraper_factcheckarticle"."title"' in q['sql']]
+    assert article_queries
+    assert all('"content"' not in sql for sql in article_queries)
+
+@pytest.mark.django_db
+def test_estimated_paginator_counts_small_tables_exactly(articles):
+    """
+    Tests that small tables (or databases without estimates) get an exact count.
+    """
+    paginator = EstimatedCountPaginator(FactCheckArticle.objects.all(), 20)
+
+    assert paginator.count == 60
+    assert paginator.num_pages == 3
@@ -0,0 +1,121 @@
+import re
+from datetime import date, timedelta
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apps.scraper.models import FactCheckArticle, VerificationCategory
+from apps.scraper.pagination import KeysetPaginator, InvalidCursor
+
+@pytest.fixture
+def articles():
+    """Creates articles sharing publication dates, plus some without a date."""
+    category = VerificationCategory.objects.create(name="Falso")
+    created = []
+    for i in range(11):
+        publish_date = date(2025, 3, 1) - timedelta(days=i // 3) if i < 9 else None
+        created.append(FactCheckArticle.objects.create(
+            title=f"Artículo {i}", url=f"https://www.newtral.es/articulo-{i}/", publish_date=publish_date,
+            claim="", claim_source="Redes", content="x" * 1000, verification_category=category
+        ))
+    return created
+
+def test_cursor_round_trip():
+    """
+    Tests that cursors encode the position and reject malformed input.
+    """
+    cursor = KeysetPaginator.encode_cursor(date(2025, 3, 1), 42)
+
+    assert KeysetPaginator.decode_cursor(cursor) == (date(2025, 3, 1), 42)
+    assert KeysetPaginator.decode_cursor(KeysetPaginator.encode_cursor(None, 7)) == (None, 7)
+    with pytest.raises(InvalidCursor):
+        KeysetPaginator.decode_cursor("not-a-cursor")
+
+@pytest.mark.django_db
+def test_pages_cover_every_article_once_in_order(articles):
+    """
+    Tests that walking the cursors returns every article once, newest first and undated last.
+    """
+    paginator = KeysetPaginator(FactCheckArticle.objects.all(), per_page=4)
+
+    seen, cursor = [], None
+    while True:
+        page = paginator.get_page(cursor)
+        seen.extend(page['articles'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+    expected = sorted(articles, key=lambda a: (a.publish_date is not None, a.publish_date or date.min, a.id),
+                      reverse=True)
+    assert [a.id for a in seen] == [a.id for a in expected]
+
+@pytest.mark.django_db
+def test_cursor_condition_has_a_range_bound():
+    """
+    Tests that the condition after a dated cursor bounds publish_date, not only ORs the cases.
+    """
+    paginator = KeysetPaginator(FactCheckArticle.objects.all())
+    queryset = paginator.queryset.filter(paginator._after(date(2025, 3, 1), 42))
+
+    where = str(queryset.query).split(' WHERE ', 1)[1].split(' ORDER BY ')[0]
+
+    assert re.match(r'^\(\(.*"publish_date" <= .* AND \(.*"publish_date" < .* OR .*"id" < 42\)\) OR .*"publish_date" IS NULL\)$', where)
+
+@pytest.mark.django_db
+def test_deep_page_scans_the_index_from_the_cursor():
+    """
+    Tests on PostgreSQL that a page after a cursor starts the index scan at the cursor's date.
+    """
+    if connection.vendor != 'postgresql':
+        pytest.skip("The plan check needs PostgreSQL")
+
+    FactCheckArticle.objects.bulk_create([
+        FactCheckArticle(
+            title=f"Artículo {i}", url=f"https://www.newtral.es/articulo-{i}/",
+            publish_date=date(2025, 3, 1) - timedelta(days=i // 5), claim="", claim_source="Redes", content=""
+        )
+        for i in range(2000)
+    ])
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE scraper_factcheckarticle")
+        # Small test tables would otherwise be read sequentially whatever the condition
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    paginator = KeysetPaginator(FactCheckArticle.objects.all(), per_page=20)
+    queryset = paginator.queryset.filter(paginator._after(date(2025, 1, 1), 1000))[:21]
+    plan = queryset.explain()
+
+    assert 'article_publish_date_id_idx' in plan
+    assert re.search(r'Index Cond: .*publish_date <=', plan)
+
+@pytest.mark.django_db
+def test_articles_api_skips_large_columns(client, articles):
+    """
+    Tests the JSON API pages and that the article content is not loaded.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse('articles_api'), {'per_page': 5})
+
+    data = response.json()
+    assert response.status_code == 200
+    assert len(data['results']) == 5
+    assert data['results'][0]['verification_category'] == "Falso"
+    assert len(queries) == 1
+    assert '"content"' not in queries[0]['sql']
+
+    second = client.get(reverse('articles_api'), {'per_page': 5, 'cursor': data['next_cursor']}).json()
+    assert not {a['id'] for a in data['results']} & {a['id'] for a in second['results']}
+
+    assert client.get(reverse('articles_api'), {'cursor': 'bad'}).status_code == 400
+
+@pytest.mark.django_db
+def test_articles_page(client, articles):
+    """
+    Tests that the HTML list renders the articles and the link to the next page.
+    """
+    response = client.get(reverse('articles'), {'per_page': 10})
+
+    assert response.status_code == 200
+    assert "Artículo 0" in response.content.decode()
+    assert response.context['next_cursor'] is not None
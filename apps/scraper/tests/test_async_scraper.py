@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from apps.scraper.benchmarks.stub_server import FixtureServer
+from apps.scraper.benchmarks.utils import load_article_fixtures
+from apps.scraper.models import FactCheckArticle
+from apps.scraper.scrapers import AsyncBaseScraper
+from apps.scraper.scrapers.newtral import NewtralScraper
+from apps.scraper.services import ScraperService
+from apps.scraper.utils.rate_limiter import RateLimiter
+
+RESPONSE_DELAY = 0.2
+
+class SlowPageHandler(BaseHTTPRequestHandler):
+    """Serves a small page named after the path, after a fixed delay"""
+
+    def do_GET(self):
+        time.sleep(RESPONSE_DELAY)
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = f"<html><head><title>{self.path}</title></head><body></body></html>".encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server_url():
+    """Runs a local HTTP server for the duration of a test"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowPageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+class AsyncScraperForTest(AsyncBaseScraper):
+    """Test scraper that collects the titles of several pages."""
+
+    async def scrape(self, paths=()):
+        pages = await self.scrape_pages(list(paths))
+        return [page.title.text if not isinstance(page, Exception) else None for page in pages]
+
+@pytest.fixture
+def scraper(server_url):
+    """Fixture to provide an AsyncScraperForTest instance."""
+    return AsyncScraperForTest(
+        server_url,
+        name="AsyncTestScraper",
+        respect_robots=False,
+        max_retries=1,
+        rate_limiter=RateLimiter(default_rate=1000, burst=100),
+    )
+
+def test_pages_are_fetched_concurrently(scraper):
+    """
+    Tests that many pages are in flight at once and results keep their order.
+    """
+    paths = [f"/page-{i}" for i in range(20)]
+
+    async def run():
+        async with scraper:
+            return await scraper.scrape(paths=paths)
+
+    start = time.perf_counter()
+    titles = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert titles == paths
+    # Sequential fetching would take 20 * RESPONSE_DELAY seconds
+    assert elapsed < 10 * RESPONSE_DELAY
+
+def test_failed_pages_do_not_cancel_the_others(scraper):
+    """
+    Tests that a failing URL is reported without affecting the rest.
+    """
+    async def run():
+        async with scraper:
+            return await scraper.scrape(paths=["/page-1", "/missing", "/page-2"])
+
+    assert asyncio.run(run()) == ["/page-1", None, "/page-2"]
+
+class SlowCache:
+    """HTTP cache stand-in whose lookups block like a busy SQLite file."""
+
+    def conditional_headers(self, url):
+        time.sleep(RESPONSE_DELAY)
+        return {}
+
+    def store(self, url, response):
+        time.sleep(RESPONSE_DELAY)
+        return False
+
+def test_cache_io_does_not_block_the_event_loop(server_url):
+    """
+    Tests that blocking cache calls run off the event loop and the shared headers are left alone.
+    """
+    scraper = AsyncScraperForTest(
+        server_url, respect_robots=False, max_retries=1, http_cache=SlowCache(),
+        rate_limiter=RateLimiter(default_rate=1000, burst=100),
+    )
+    user_agent = scraper.session.headers['User-Agent']
+    paths = [f"/page-{i}" for i in range(10)]
+
+    async def run():
+        async with scraper:
+            return await scraper.scrape(paths=paths)
+
+    start = time.perf_counter()
+    titles = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert titles == paths
+    # On the event loop each page would wait for 2 cache calls of every other page: 20 * RESPONSE_DELAY
+    assert elapsed < 10 * RESPONSE_DELAY
+    assert scraper.session.headers['User-Agent'] == user_agent
+
+def test_newtral_articles_are_fetched_async():
+    """
+    Tests that the async fetch extracts the articles without a browser and skips failed pages.
+    """
+    fixtures = load_article_fixtures()
+    scraper = NewtralScraper(respect_robots=False, max_retries=1, rate_limiter=RateLimiter(default_rate=1000, burst=100))
+
+    with FixtureServer() as server:
+        urls = [server.url_for(fixture['url']) for fixture in fixtures] + [server.url_for("/missing")]
+        articles = scraper._extract_articles_async(urls)
+
+    assert [article['title'] for article in articles] == [fixture['expected']['title'] for fixture in fixtures]
+    assert scraper.metrics.count('http_fetches') == len(urls)
+
+@pytest.mark.django_db
+def test_service_fetches_articles_async(settings, monkeypatch):
+    """
+    Tests that the service downloads the articles over HTTP with the configured rate limit when asked to.
+    """
+    settings.SCRAPER_HTTP_CACHE_ENABLED = False
+    settings.HTML_ARCHIVE_ENABLED = False
+    settings.SCRAPER_ASYNC_RATE = 1000
+    settings.SCRAPER_ASYNC_BURST = 100
+    fixtures = load_article_fixtures()
+    limiters = []
+
+    def fail_browser(self, url):
+        raise AssertionError("The browser must not be used")
+
+    def extract_async(self, urls):
+        limiters.append(self.rate_limiter)
+        return original(self, [server.url_for(url) for url in urls])
+
+    original = NewtralScraper._extract_articles_async
+    monkeypatch.setattr(NewtralScraper, '_get_listing_urls', lambda self, limit: [f['url'] for f in fixtures])
+    monkeypatch.setattr(NewtralScraper, '_extract_article_data', fail_browser)
+    monkeypatch.setattr(NewtralScraper, '_extract_articles_async', extract_async)
+
+    with FixtureServer() as server:
+        counts = ScraperService().scrape_newtral(limit=len(fixtures), respect_robots=False, async_fetch=True)
+
+    assert counts == (len(fixtures), len(fixtures), 0, 0)
+    assert FactCheckArticle.objects.count() == len(fixtures)
+    assert (limiters[0].default_rate, limiters[0].burst) == (1000, 100)
+    assert limiters[0] is not RateLimiter.shared()
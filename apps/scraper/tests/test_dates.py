@@ -0,0 +1,82 @@
+from datetime import date, datetime
+import pytest
+from apps.scraper.benchmarks.dates import run_dates_benchmark
+from apps.scraper.benchmarks.utils import load_date_fixtures
+from apps.scraper.models import FactCheckArticle
+from apps.scraper.utils import dates
+from apps.scraper.utils.dates import normalize_date, normalize_dates
+
+@pytest.mark.parametrize("text, expected", load_date_fixtures())
+def test_recorded_newtral_dates_are_normalized(text, expected):
+    """
+    Tests every date string of the corpus against its expected date.
+    """
+    result = normalize_date(text)
+    assert (result.isoformat() if result else None) == expected
+
+def test_date_objects_are_returned_as_dates():
+    """
+    Tests that dates and datetimes skip the string parsing.
+    """
+    assert normalize_date(date(2025, 3, 20)) == date(2025, 3, 20)
+    assert normalize_date(datetime(2025, 3, 20, 9, 15)) == date(2025, 3, 20)
+    assert normalize_date(None) is None
+
+def test_repeated_strings_are_parsed_once():
+    """
+    Tests that the memo cache serves repeated strings, ignoring surrounding whitespace.
+    """
+    dates.clear_cache()
+    normalize_date("20 de marzo de 2025")
+    normalize_date("  20 de marzo de 2025 ")
+
+    info = dates._parse_known_formats.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+@pytest.mark.skipif(dates.dateutil_parser is None, reason="python-dateutil is not installed")
+def test_dateutil_fallback_is_not_memoized(monkeypatch):
+    """
+    Tests that strings parsed by dateutil are parsed again on each call, since the
+    parts it fills in depend on the current date.
+    """
+    dates.clear_cache()
+    calls = []
+
+    def parse(text):
+        calls.append(text)
+        return datetime(2025 + len(calls), 3, 20)
+
+    monkeypatch.setattr(dates.dateutil_parser, 'parse', parse)
+
+    assert normalize_date("March 20") == date(2026, 3, 20)
+    assert normalize_date("March 20") == date(2027, 3, 20)
+    assert len(calls) == 2
+
+def test_batch_keeps_order_and_parses_each_value_once():
+    """
+    Tests the batch API over a column with repeated values.
+    """
+    dates.clear_cache()
+    column = ["12 de febrero de 2025", "Sin fecha", "12 de febrero de 2025", None]
+
+    assert normalize_dates(column) == [date(2025, 2, 12), None, date(2025, 2, 12), None]
+    assert dates._parse_known_formats.cache_info().misses == 2
+
+def test_model_parse_date_uses_the_normalizer():
+    """
+    Tests that FactCheckArticle.parse_date keeps its behaviour.
+    """
+    assert FactCheckArticle.parse_date("https://www.newtral.es/bulo/20241107/") == date(2024, 11, 7)
+    assert FactCheckArticle.parse_date("texto sin fecha") is None
+
+def test_dates_benchmark_reports_each_variant():
+    """
+    Tests the structure of the dates benchmark results.
+    """
+    results = run_dates_benchmark(iterations=2)
+
+    assert results['suite'] == 'dates'
+    assert results['dates'] == len(load_date_fixtures())
+    assert set(results['results']) == {'uncached', 'cached', 'batch'}
+    assert results['results']['cached']['per_date_us']['count'] == 2 * results['dates']
@@ -0,0 +1,133 @@
+import importlib
+import pytest
+from django.apps import apps
+from apps.scraper.entities import EntityResolver
+from apps.scraper.models import Author, ClaimSource, ClaimSourceAlias, FactCheckArticle
+from apps.scraper.scrapers.newtral import NewtralScraper
+from apps.scraper.services import ScraperService
+from apps.scraper.views import get_source_stats
+
+backfill = importlib.import_module('apps.scraper.migrations.0007_backfill_claimsource_author')
+
+def article(i, claim_source, author=''):
+    return {
+        'url': f"https://www.newtral.es/articulo-{i}/", 'title': f"Artículo {i}", 'claim': "Afirmación",
+        'claim_source': claim_source, 'author': author, 'content': "Contenido", 'tags': [],
+    }
+
+@pytest.mark.django_db
+def test_resolver_folds_variants_and_caches_keys(django_assert_num_queries):
+    """
+    Tests that spelling variants resolve to one row and resolved names are not queried again.
+    """
+    resolver = EntityResolver()
+
+    psoe = resolver.source_id("PSOE")
+    assert resolver.source_id(" Psoe ") == resolver.source_id("Partido Socialista") == psoe
+    assert resolver.source_id("") is None
+    assert resolver.author_id("Ana García") == resolver.author_id("ana garcia")
+
+    with django_assert_num_queries(0):
+        resolver.source_id("psoe")
+        resolver.author_id("ANA GARCÍA")
+
+    assert ClaimSource.objects.get(pk=psoe).display_name == "PSOE"
+    assert Author.objects.count() == 1
+
+@pytest.mark.django_db
+def test_prefetch_resolves_a_batch_with_bulk_queries(django_assert_num_queries, django_assert_max_num_queries):
+    """
+    Tests that a batch of articles is resolved with a fixed number of queries.
+    """
+    articles = [article(i, f"Fuente {i % 20}", f"Autor {i % 5}") for i in range(200)]
+    resolver = EntityResolver()
+
+    # Alias table, then one insert and one select per model
+    with django_assert_max_num_queries(5):
+        resolver.prefetch(articles)
+    with django_assert_num_queries(0):
+        for data in articles:
+            resolver.source_id(data['claim_source'])
+            resolver.author_id(data['author'])
+
+    assert ClaimSource.objects.count() == 20
+    assert Author.objects.count() == 5
+
+@pytest.mark.django_db
+def test_long_names_are_cut_to_the_columns():
+    """
+    Tests that names longer than their columns resolve to one truncated row.
+    """
+    resolver = EntityResolver()
+    long_author = "Redacción " + "muy " * 40 + "larga"
+
+    author = resolver.author_id(long_author)
+
+    assert resolver.author_id(long_author.upper()) == author
+    assert len(Author.objects.get(pk=author).name) <= Author._meta.get_field('name').max_length
+    assert len(ClaimSource.objects.get(pk=resolver.source_id("x" * 300)).name) == 255
+
+@pytest.mark.django_db
+def test_alias_table_is_used():
+    """
+    Tests that aliases stored in the database resolve to their source.
+    """
+    podemos = ClaimSource.objects.create(name="podemos", display_name="Podemos")
+    ClaimSourceAlias.objects.create(alias="Pablo Iglesias (Podemos)", source=podemos)
+
+    assert ClaimSourceAlias.objects.get().alias == "pablo iglesias podemos"
+    assert EntityResolver().source_id("Pablo Iglesias, Podemos") == podemos.pk
+
+@pytest.mark.django_db
+def test_saved_articles_are_linked_and_grouped():
+    """
+    Tests that saved articles point to their canonical rows and the source stats group the variants.
+    """
+    service = ScraperService()
+    for i, source in enumerate(["PSOE", "Psoe", "psoe ", "Vox"]):
+        assert service.save_article(article(i, source, "Ana García")) == 'new'
+
+    stored = FactCheckArticle.objects.select_related('canonical_source', 'canonical_author')
+    assert {a.canonical_source.display_name for a in stored} == {"PSOE", "Vox"}
+    assert {a.canonical_author.name for a in stored} == {"ana garcia"}
+
+    stats = get_source_stats(4)
+    assert stats[0] == {'claim_source': "PSOE", 'count': 3, 'percentage': 75.0}
+    assert stats[1]['claim_source'] == "Vox"
+
+@pytest.mark.django_db
+def test_backfill_links_existing_articles():
+    """
+    Tests that the backfill migration creates the canonical rows of the existing articles.
+    """
+    for i, (source, author) in enumerate([("Partido Popular", "Ana"), ("PP", "ana"), ("PP", ""), ("", "Luis")]):
+        FactCheckArticle.objects.create(
+            title=f"Artículo {i}", url=f"https://www.newtral.es/articulo-{i}/", claim="Afirmación",
+            claim_source=source, author=author, content="Contenido"
+        )
+
+    backfill.backfill_entities(apps, None)
+
+    pp = ClaimSource.objects.get()
+    assert (pp.name, pp.display_name) == ("pp", "PP")
+    assert FactCheckArticle.objects.filter(canonical_source=pp).count() == 3
+    assert ClaimSourceAlias.objects.filter(source=pp, alias="partido popular").exists()
+    assert sorted(Author.objects.values_list('name', flat=True)) == ["ana", "luis"]
+    assert FactCheckArticle.objects.filter(canonical_author__isnull=True).count() == 1
+
+@pytest.mark.django_db
+def test_each_run_resolves_with_a_fresh_cache(settings, monkeypatch):
+    """
+    Tests that keys cached by a previous run are not reused after their rows are deleted.
+    """
+    settings.SCRAPER_HTTP_CACHE_ENABLED = False
+    settings.HTML_ARCHIVE_ENABLED = False
+    monkeypatch.setattr(NewtralScraper, 'scrape', lambda self, **kwargs: [article(1, "Vox")])
+    service = ScraperService()
+    service.save_article(article(0, "Vox"))
+    ClaimSource.objects.all().delete()
+
+    assert service.scrape_newtral(limit=1) == (1, 1, 0, 0)
+
+    vox = ClaimSource.objects.get()
+    assert FactCheckArticle.objects.get(url=article(1, "")['url']).canonical_source == vox
@@ -0,0 +1,48 @@
+from bs4 import BeautifulSoup
+from apps.scraper.scrapers.schema import ExtractionSchema, Field
+
+HTML = """
+<html><body>
+    <h1>Generic heading</h1>
+    <div class="card"><h2 class="title main">Main title</h2></div>
+    <ul class="list"><li>one</li><li> </li><li>two</li></ul>
+    <li>outside the list</li>
+    <span class="label-green">ok</span>
+    <p>Este texto menciona la palabra Bulo.</p>
+</body></html>
+"""
+
+SCHEMA = ExtractionSchema([
+    Field('title', [".card .title", "h1"]),
+    Field('heading', ["h3", "h1"]),
+    Field('items', [".list li"], many=True, post=lambda texts: [t for t in texts if t]),
+    Field('label', [(".label-red", "Rojo"), (".label-green", "Verde")]),
+    Field('missing', [".does-not-exist"], default=list),
+    Field('keyword', [".keyword"], text_search=("Verdad", "Bulo")),
+])
+
+def test_schema_extracts_all_fields():
+    """
+    Tests selector precedence, multiple matches, selector values, defaults and text search.
+    """
+    soup = BeautifulSoup(HTML, 'html.parser')
+
+    result = SCHEMA.extract(soup)
+
+    assert result == {
+        'title': "Main title",
+        'heading': "Generic heading",
+        'items': ["one", "two"],
+        'label': "Verde",
+        'missing': [],
+        'keyword': "Bulo",
+    }
+
+def test_selectors_are_indexed_by_rightmost_element():
+    """
+    Tests that selectors are indexed by the class or tag of their last element.
+    """
+    assert SCHEMA._get_selector_key(".card .title") == ".title"
+    assert SCHEMA._get_selector_key(".list li") == "li"
+    assert SCHEMA._get_selector_key("div > a.link[href]") == "a"
+    assert SCHEMA._get_selector_key("h1, h2") is None
@@ -0,0 +1,115 @@
+import os
+import pytest
+from django.core.management import call_command
+from apps.scraper.benchmarks.utils import load_article_fixtures
+from apps.scraper.models import FactCheckArticle
+from apps.scraper.reextract import reextract_archive
+from apps.scraper.scrapers import NewtralScraper
+from apps.scraper.utils.html_archive import HtmlArchive
+
+FIXTURES = load_article_fixtures()
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive with the recorded article pages, one of them fetched twice"""
+    archive = HtmlArchive(str(tmp_path / "archive"), codec='gz')
+    for fixture in FIXTURES:
+        archive.store(fixture['url'], fixture['html'], fetched_at=1000)
+    archive.store(FIXTURES[0]['url'], FIXTURES[0]['html'], fetched_at=2000)
+    yield archive
+    archive.close()
+
+def count_objects(root):
+    """Count the compressed page files of an archive."""
+    return sum(len(files) for _, _, files in os.walk(os.path.join(root, 'objects')))
+
+def test_pages_are_compressed_and_deduplicated(archive):
+    """
+    Tests that identical pages share one compressed object and every fetch is indexed.
+    """
+    page = archive.latest(FIXTURES[0]['url'])
+
+    assert page.fetched_at == 2000
+    assert archive.load(page) == FIXTURES[0]['html']
+    assert count_objects(archive.root) == len(FIXTURES)
+    assert len(archive.latest_pages()) == len(FIXTURES)
+
+    compressed = sum(
+        os.path.getsize(os.path.join(directory, name))
+        for directory, _, files in os.walk(os.path.join(archive.root, 'objects'))
+        for name in files
+    )
+    assert compressed < sum(len(fixture['html'].encode('utf-8')) for fixture in FIXTURES) / 2
+
+def test_latest_pages_returns_the_newest_fetch_of_each_url(tmp_path):
+    """
+    Tests that every field of a latest page comes from its most recent fetch.
+    """
+    archive = HtmlArchive(str(tmp_path / "archive"), codec='gz')
+    archive.store("https://example.com/a", "<p>v1</p>", fetched_at=1000)
+    archive.store("https://example.com/a", "<p>v2</p>", fetched_at=2000)
+    archive.store("https://example.com/a", "<p>v0</p>", fetched_at=500)
+    archive.store("https://example.com/b", "<p>b</p>", fetched_at=1500)
+
+    pages = archive.latest_pages()
+
+    assert [(page.url, page.fetched_at) for page in pages] == [
+        ("https://example.com/a", 2000), ("https://example.com/b", 1500),
+    ]
+    assert archive.load(pages[0]) == "<p>v2</p>"
+    archive.close()
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_archive_is_reextracted_with_the_extraction_code(archive, workers):
+    """
+    Tests that the archived pages give the same fields as the live extraction.
+    """
+    results = list(reextract_archive(archive, workers=workers))
+    expected = {fixture['url']: fixture['expected'] for fixture in FIXTURES}
+
+    assert len(results) == len(FIXTURES)
+    for page, article, error in results:
+        assert error is None
+        assert article['title'] == expected[page.url]['title']
+        assert str(article['publish_date']) == expected[page.url]['publish_date']
+
+def test_reextraction_can_be_limited_to_some_urls(archive):
+    """
+    Tests the URL filter of the re-extraction.
+    """
+    results = list(reextract_archive(archive, urls=[FIXTURES[1]['url']], workers=1))
+
+    assert [page.url for page, _, _ in results] == [FIXTURES[1]['url']]
+
+def test_scraper_archives_fetched_pages(tmp_path):
+    """
+    Tests that the scraper stores pages in its archive and counts them.
+    """
+    archive = HtmlArchive(str(tmp_path / "archive"), codec='gz')
+    scraper = NewtralScraper(respect_robots=False, html_archive=archive)
+
+    scraper.archive_page(FIXTURES[0]['url'], FIXTURES[0]['html'])
+
+    assert archive.latest(FIXTURES[0]['url']) is not None
+    assert scraper.metrics.count('pages_archived') == 1
+    archive.close()
+
+def test_reextract_command_dry_run(archive, capsys):
+    """
+    Tests the reextract command without saving the articles.
+    """
+    call_command('reextract', archive_dir=archive.root, dry_run=True, workers=1)
+
+    output = capsys.readouterr().out
+    assert f"Articles extracted: {len(FIXTURES)}" in output
+    assert "Failed pages: 0" in output
+
+@pytest.mark.django_db
+def test_reextract_command_saves_articles(archive, capsys):
+    """
+    Tests that re-extracted articles are saved to the database.
+    """
+    call_command('reextract', archive_dir=archive.root, workers=1)
+
+    assert FactCheckArticle.objects.count() == len(FIXTURES)
+    assert f"New articles: {len(FIXTURES)}" in capsys.readouterr().out
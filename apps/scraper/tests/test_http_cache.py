@@ -0,0 +1,156 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from requests import Response
+from apps.scraper.scrapers.base import BaseScraper
+from apps.scraper.services import ScraperService
+from apps.scraper.utils.http_cache import HttpCache
+from apps.scraper.utils.rate_limiter import RateLimiter
+
+PAGE = b"<html><head><title>Cached page</title></head><body><p>Hola</p></body></html>"
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a single page with an ETag and honors If-None-Match"""
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"page-v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"page-v1"')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.send_header('ETag', '"page-v1"')
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server_url():
+    """Runs a local HTTP server for the duration of a test"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def http_cache(tmp_path):
+    """Provides an HTTP cache stored in a temporary directory"""
+    cache = HttpCache(path=str(tmp_path / "http_cache.sqlite3"))
+    yield cache
+    cache.close()
+
+def make_response(body, etag):
+    """Builds a response object without making a request"""
+    response = Response()
+    response.status_code = 200
+    response.headers['ETag'] = etag
+    response._content = body
+    return response
+
+def test_not_modified_page_served_from_cache(server_url, http_cache):
+    """
+    Tests that the second fetch of an unchanged page uses the stored body.
+    """
+    scraper = BaseScraper(server_url, name="CacheTestScraper", respect_robots=False,
+                          rate_limiter=RateLimiter(default_rate=1000, burst=10), http_cache=http_cache)
+
+    first = scraper.get_page("/article/")
+    second = scraper.get_page("/article/")
+
+    assert not getattr(first, 'from_cache', False)
+    assert second.from_cache is True
+    assert second.content == PAGE
+    assert scraper.parse_html(second).title.text == "Cached page"
+    assert http_cache.stats['hits'] == 1
+    assert http_cache.stats['bytes_saved'] == len(PAGE)
+    assert scraper.metrics.count('http_cache_hits') == 1
+    assert scraper.metrics.count('http_cache_bytes_saved') == len(PAGE)
+
+def test_evicted_page_is_refetched_with_throttling(server_url, http_cache, monkeypatch):
+    """
+    Tests that the full fetch after a 304 for an evicted copy waits for the rate limiter too.
+    """
+    scraper = BaseScraper(server_url, name="CacheTestScraper", respect_robots=False,
+                          rate_limiter=RateLimiter(default_rate=1000, burst=10), http_cache=http_cache)
+    scraper.get_page("/article/")
+    # The validators are kept but the body is gone
+    monkeypatch.setattr(http_cache, 'get_response', lambda url, not_modified=None: None)
+    throttled = []
+    original_throttle = scraper.throttle
+    monkeypatch.setattr(scraper, 'throttle', lambda url: throttled.append(url) or original_throttle(url))
+
+    response = scraper.get_page("/article/")
+
+    assert response.content == PAGE
+    assert len(throttled) == 2
+    assert scraper.metrics.count('http_fetches') == 3
+
+def test_service_opens_the_configured_cache(tmp_path, settings):
+    """
+    Tests that the scraper service uses the cache configured in the settings.
+    """
+    settings.SCRAPER_HTTP_CACHE_PATH = str(tmp_path / "cache" / "http.sqlite3")
+    cache = ScraperService()._get_http_cache()
+    cache.close()
+    settings.SCRAPER_HTTP_CACHE_ENABLED = False
+
+    assert cache.path == settings.SCRAPER_HTTP_CACHE_PATH
+    assert (tmp_path / "cache" / "http.sqlite3").exists()
+    assert ScraperService()._get_http_cache() is None
+
+def test_least_recently_used_pages_are_evicted(http_cache):
+    """
+    Tests that the cache stays under its size cap by evicting the oldest accessed pages.
+    """
+    http_cache.max_bytes = 250
+
+    http_cache.store("https://example.com/a", make_response(b"a" * 100, '"a"'))
+    http_cache.store("https://example.com/b", make_response(b"b" * 100, '"b"'))
+    # Reading "a" makes "b" the least recently used page
+    http_cache.get_response("https://example.com/a")
+    http_cache.store("https://example.com/c", make_response(b"c" * 100, '"c"'))
+
+    assert http_cache.conditional_headers("https://example.com/a") == {'If-None-Match': '"a"'}
+    assert http_cache.conditional_headers("https://example.com/b") == {}
+    assert http_cache.conditional_headers("https://example.com/c") == {'If-None-Match': '"c"'}
+    assert http_cache.size() == 200
+    assert http_cache.stats['evictions'] == 1
+
+def test_responses_without_validators_are_not_stored(http_cache):
+    """
+    Tests that pages that cannot be revalidated are not kept.
+    """
+    response = make_response(b"no validators", None)
+    del response.headers['ETag']
+
+    assert http_cache.store("https://example.com/plain", response) is False
+    assert http_cache.size() == 0
+
+def test_size_is_tracked_without_scanning_the_store(http_cache):
+    """
+    Tests that storing pages keeps the running total right without summing every row.
+    """
+    http_cache.max_bytes = 200
+    statements = []
+    http_cache.connection.set_trace_callback(statements.append)
+
+    http_cache.store("https://example.com/a", make_response(b"a" * 100, '"a"'))
+    http_cache.store("https://example.com/a", make_response(b"a" * 50, '"a2"'))
+    http_cache.store("https://example.com/b", make_response(b"b" * 100, '"b"'))
+    http_cache.store("https://example.com/c", make_response(b"c" * 100, '"c"'))
+
+    assert not any('SUM(' in statement for statement in statements)
+    assert http_cache.size() == 200
+    assert http_cache.stats['evictions'] == 1
+
+    http_cache.connection.set_trace_callback(None)
+    reopened = HttpCache(path=http_cache.path)
+    assert reopened.size() == 200
+    reopened.close()
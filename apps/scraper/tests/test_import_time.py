@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from apps.scraper.benchmarks.imports import BASE_DIR, HEAVY_MODULES, measure_import, run_imports_benchmark
+
+def loaded_heavy_modules(code):
+    """Run code in a fresh interpreter and return the heavy packages it loaded."""
+    script = (
+        "import os, sys, django\n"
+        "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')\n"
+        "django.setup()\n"
+        f"{code}\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(',') if name]
+
+def test_service_and_scraper_imports_do_not_load_browser_stack():
+    """
+    Tests that selenium, webdriver_manager, fake_useragent and httpx are not imported eagerly.
+    """
+    assert loaded_heavy_modules(
+        "import apps.scraper.services\n"
+        "import apps.scraper.reextract\n"
+        "from apps.scraper.scrapers import BaseScraper, NewtralScraper"
+    ) == []
+
+def test_lazy_scrapers_are_importable():
+    """
+    Tests that the lazily imported scrapers resolve on first access.
+    """
+    assert loaded_heavy_modules("from apps.scraper.scrapers import AsyncBaseScraper") == ['httpx']
+    assert 'selenium' in loaded_heavy_modules(
+        "from apps.scraper.scrapers import NewtralScraper\n"
+        "NewtralScraper(respect_robots=False)._get_browser_options()"
+    )
+
+def test_import_benchmark_reports_heavy_imports():
+    """
+    Tests that the import benchmark measures the modules and finds no eager heavy import.
+    """
+    seconds, heavy = measure_import('apps.scraper.services')
+    assert seconds > 0
+    assert heavy == []
+
+    results = run_imports_benchmark(iterations=1, modules={'apps.scraper.services': 10_000})
+    assert set(results['results']) == {'apps.scraper.services', 'manage.py check'}
+    assert not [violation for violation in results['violations'] if 'imports' in violation]
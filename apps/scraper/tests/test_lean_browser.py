@@ -0,0 +1,83 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from apps.scraper.scrapers import NewtralScraper
+from apps.scraper.scrapers.newtral import BLOCKED_URL_PATTERNS, PAGE_TRANSFER_SCRIPT
+
+class FakeDriver:
+    """WebDriver stand-in that records the commands it receives"""
+
+    def __init__(self, timeout_on_get=False):
+        self.commands = []
+        self.timeout_on_get = timeout_on_get
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+    def set_page_load_timeout(self, seconds):
+        self.commands.append(('timeout', seconds))
+
+    def get(self, url):
+        self.commands.append(('get', url))
+        if self.timeout_on_get:
+            raise TimeoutException("page load timeout")
+
+    def execute_script(self, script):
+        self.commands.append(('script', script))
+        if script == PAGE_TRANSFER_SCRIPT:
+            return [150_000, 12]
+        return None
+
+def test_lean_browser_options():
+    """
+    Tests the eager page load strategy and the disabled images of the lean browser.
+    """
+    lean = NewtralScraper(respect_robots=False)._get_browser_options()
+    full = NewtralScraper(respect_robots=False, lean_browser=False)._get_browser_options()
+
+    assert lean.page_load_strategy == 'eager'
+    assert lean.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+    assert full.page_load_strategy == 'normal'
+    assert 'prefs' not in full.experimental_options
+
+def test_lean_browser_blocks_resources_and_caps_page_load():
+    """
+    Tests that heavy requests are blocked through CDP and the page load time is capped.
+    """
+    driver = FakeDriver()
+    NewtralScraper(respect_robots=False, page_load_timeout=15)._configure_browser(driver)
+
+    assert ('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS}) in driver.commands
+    assert ('timeout', 15) in driver.commands
+    assert '*.woff2' in BLOCKED_URL_PATTERNS
+
+    full_driver = FakeDriver()
+    NewtralScraper(respect_robots=False, lean_browser=False)._configure_browser(full_driver)
+    assert full_driver.commands == []
+
+def test_page_load_records_transfer_and_stops_slow_pages():
+    """
+    Tests that a slow page is stopped instead of failing and its bytes are counted.
+    """
+    scraper = NewtralScraper(respect_robots=False)
+    scraper.throttle = lambda url: 0
+    driver = FakeDriver(timeout_on_get=True)
+    url = "https://www.newtral.es/ejemplo-factcheck/20250101/"
+
+    scraper._load_page(driver, url)
+
+    assert ('script', "window.stop();") in driver.commands
+    assert scraper.metrics.count('page_load_timeouts') == 1
+    assert scraper.metrics.count('browser_fetches') == 1
+    assert scraper.metrics.count('browser_transfer_bytes') == 150_000
+    assert scraper.metrics.count('browser_requests') == 12
+    assert scraper.metrics.report()['stages']['page_load']['count'] == 1
+
+def test_full_browser_does_not_hide_timeouts():
+    """
+    Tests that the full browser still reports page load timeouts as errors.
+    """
+    scraper = NewtralScraper(respect_robots=False, lean_browser=False)
+    scraper.throttle = lambda url: 0
+
+    with pytest.raises(TimeoutException):
+        scraper._load_page(FakeDriver(timeout_on_get=True), "https://www.newtral.es/")
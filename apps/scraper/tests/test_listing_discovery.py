@@ -0,0 +1,112 @@
+import threading
+import pytest
+import requests
+from apps.scraper.benchmarks.utils import load_listing_fixture
+from apps.scraper.scrapers import NewtralScraper
+from apps.scraper.scrapers.newtral import ListingFormatError
+
+LISTING = load_listing_fixture()
+CARD = '<h2 class="card-title"><a class="card-title-link" href="https://www.newtral.es/bulo-{n}-factcheck/20250101/">{n}</a></h2>'
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, text):
+        self.text = text
+
+def make_scraper(last_page, first_page=LISTING, paginated=True):
+    """
+    Creates a scraper whose listing has `last_page` pages of ten cards after the first one.
+
+    Without pagination every page URL answers with the first page, like a redirect to it.
+    """
+    scraper = NewtralScraper(respect_robots=False)
+    scraper.requested = []
+    scraper.sessions = []
+    lock = threading.Lock()
+
+    def get_page(url, timeout=30, session=None):
+        with lock:
+            scraper.requested.append(url)
+            scraper.sessions.append(session)
+        if url == scraper.fact_check_url or not paginated:
+            return FakeResponse(first_page)
+        page = int(url.rstrip('/').rsplit('/', 1)[1])
+        if page > last_page:
+            response = requests.Response()
+            response.status_code = 404
+            raise requests.HTTPError("404 Not Found", response=response)
+        return FakeResponse("".join(CARD.format(n=page * 100 + i) for i in range(10)))
+
+    scraper.get_page = get_page
+    return scraper
+
+def test_listing_pages_are_fetched_until_the_limit():
+    """
+    Tests that only the pages needed for the limit are requested, in order.
+    """
+    scraper = make_scraper(last_page=10)
+
+    urls = scraper._get_listing_urls(limit=30)
+
+    assert len(urls) == 30
+    assert urls[:12] == scraper.parse_listing(LISTING)
+    assert urls[12] == "https://www.newtral.es/bulo-200-factcheck/20250101/"
+    assert len(scraper.requested) == 3
+
+def test_listing_stops_at_the_last_page():
+    """
+    Tests that the 404 after the last page ends the listing.
+    """
+    scraper = make_scraper(last_page=3)
+
+    urls = scraper._get_listing_urls(limit=100, workers=4)
+
+    assert len(urls) == 12 + 2 * 10
+    assert len(set(urls)) == len(urls)
+
+def test_listing_pages_use_a_session_per_worker():
+    """
+    Tests that the worker threads do not share the scraper's session.
+    """
+    scraper = make_scraper(last_page=10)
+
+    scraper._get_listing_urls(limit=100, workers=4)
+
+    worker_sessions = scraper.sessions[1:]
+    assert all(session is not None and session is not scraper.session for session in worker_sessions)
+    assert len(set(map(id, worker_sessions))) <= 4
+
+@pytest.mark.parametrize('last_page, paginated', [(1, True), (10, False)])
+def test_listing_without_page_two_is_a_format_error(last_page, paginated):
+    """
+    Tests that a missing page 2, or one repeating the first page, is not taken as a one-page listing.
+    """
+    scraper = make_scraper(last_page=last_page, paginated=paginated)
+
+    with pytest.raises(ListingFormatError):
+        scraper._get_listing_urls(limit=30)
+
+def test_listing_falls_back_to_the_browser_without_page_two(monkeypatch):
+    """
+    Tests that the browser path is used when the listing cannot be paginated over HTTP.
+    """
+    scraper = make_scraper(last_page=1)
+    monkeypatch.setattr(scraper, '_get_fact_check_urls', lambda limit: ["https://www.newtral.es/browser/20250101/"])
+    monkeypatch.setattr(scraper, '_extract_article_data', lambda url: {'title': "Artículo", 'url': url})
+
+    articles = scraper.scrape(limit=30)
+
+    assert [article['url'] for article in articles] == ["https://www.newtral.es/browser/20250101/"]
+
+def test_listing_falls_back_to_the_browser(monkeypatch):
+    """
+    Tests that the browser path is used when the listing has no article cards.
+    """
+    scraper = make_scraper(last_page=3, first_page="<html><body><p>Nuevo diseño</p></body></html>")
+    monkeypatch.setattr(scraper, '_get_fact_check_urls', lambda limit: ["https://www.newtral.es/browser/20250101/"])
+    monkeypatch.setattr(scraper, '_extract_article_data', lambda url: {'title': "Artículo", 'url': url})
+
+    articles = scraper.scrape(limit=5)
+
+    assert articles == [{'title': "Artículo", 'url': "https://www.newtral.es/browser/20250101/"}]
@@ -0,0 +1,69 @@
+import json
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler
+from apps.scraper.utils.logging_config import JsonFormatter, SamplingFilter, configure_logging
+
+def make_record(level=logging.DEBUG, msg="Fetching URL", lineno=10):
+    """Builds a log record as if it was logged from a given line."""
+    return logging.LogRecord('apps.scraper', level, '/app/scraper.py', lineno, msg, None, None)
+
+def test_sampling_filter_keeps_one_of_every_n_debug_records():
+    """
+    Tests that noisy debug lines are sampled while other lines and levels pass.
+    """
+    sampling = SamplingFilter(every=10)
+
+    kept = sum(sampling.filter(make_record()) for _ in range(100))
+
+    assert kept == 10
+    assert sampling.filter(make_record(lineno=20))
+    assert all(sampling.filter(make_record(level=logging.INFO)) for _ in range(5))
+
+def test_sampling_filter_counts_records_from_many_threads():
+    """
+    Tests that records filtered concurrently from several threads are all counted.
+    """
+    # Switch threads as often as possible to expose lost updates
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    sampling = SamplingFilter(every=10)
+    record = make_record()
+
+    def log_many(_):
+        return sum(sampling.filter(record) for _ in range(2000))
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            kept = sum(executor.map(log_many, range(8)))
+    finally:
+        sys.setswitchinterval(previous)
+
+    assert sampling.counts[(record.pathname, record.lineno)] == 8 * 2000
+    assert kept == 8 * 2000 // 10
+
+def test_json_formatter_outputs_one_object_per_record():
+    """
+    Tests that records are formatted as JSON with their metadata.
+    """
+    record = make_record(level=logging.WARNING, msg="Artículo %s descartado")
+    record.args = ("https://www.newtral.es/a/",)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['level'] == "WARNING"
+    assert entry['logger'] == "apps.scraper"
+    assert entry['message'] == "Artículo https://www.newtral.es/a/ descartado"
+
+def test_configure_logging_is_idempotent():
+    """
+    Tests that configuring logging again does not add handlers to the root logger.
+    """
+    configure_logging()
+    handlers = list(logging.getLogger().handlers)
+
+    configure_logging()
+
+    assert logging.getLogger().handlers == handlers
+    assert sum(isinstance(handler, QueueHandler) for handler in handlers) == 1
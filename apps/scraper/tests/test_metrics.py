@@ -0,0 +1,81 @@
+import threading
+import pytest
+from apps.scraper.scrapers import NewtralScraper
+from apps.scraper.benchmarks.utils import load_article_fixtures
+from apps.scraper.utils.metrics import ScrapeMetrics
+
+class FakeClock:
+    """Clock that only moves forward when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_spans_are_aggregated_by_stage_and_url():
+    """
+    Tests totals, percentiles, histograms and the slowest URLs of the report.
+    """
+    clock = FakeClock()
+    metrics = ScrapeMetrics(clock=clock)
+
+    for url, seconds in [("/a", 0.005), ("/b", 0.2), ("/c", 2.0)]:
+        with metrics.span('page_load', url):
+            clock.now += seconds
+    metrics.record('db_write', 0.03, "/a")
+
+    report = metrics.report(slowest=2)
+
+    page_load = report['stages']['page_load']
+    assert page_load['count'] == 3
+    assert page_load['total_s'] == pytest.approx(2.205)
+    assert page_load['p50_ms'] == pytest.approx(200)
+    assert page_load['max_ms'] == pytest.approx(2000)
+    assert page_load['histogram'] == {"<=10ms": 1, "<=250ms": 1, "<=2500ms": 1}
+    assert list(report['stages']) == ['page_load', 'db_write']
+    assert [entry['url'] for entry in report['slowest_urls']] == ["/c", "/b"]
+    assert report['elapsed_s'] == pytest.approx(2.205)
+
+def test_span_is_recorded_when_the_block_fails():
+    """
+    Tests that failing stages still count towards the report.
+    """
+    metrics = ScrapeMetrics()
+
+    with pytest.raises(ValueError):
+        with metrics.span('wait', "/timeout"):
+            raise ValueError("timeout")
+
+    assert metrics.report()['stages']['wait']['count'] == 1
+
+def test_spans_can_be_recorded_from_several_threads():
+    """
+    Tests that concurrent recording does not lose spans.
+    """
+    metrics = ScrapeMetrics()
+
+    def work():
+        for i in range(1000):
+            metrics.record('fetch', 0.001, f"/page-{i % 10}")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.report()['stages']['fetch']['count'] == 8000
+
+def test_scraper_records_parse_and_extract_spans():
+    """
+    Tests that parsing an article page is measured by the scraper.
+    """
+    fixture = load_article_fixtures()[0]
+    scraper = NewtralScraper(respect_robots=False)
+
+    scraper.parse_article(fixture['html'], fixture['url'])
+
+    stages = scraper.metrics.report()['stages']
+    assert stages['parse']['count'] == 1
+    assert stages['extract']['count'] == 1
@@ -0,0 +1,42 @@
+import pytest
+from apps.scraper.benchmarks.utils import load_article_fixtures
+from apps.scraper.scrapers import NewtralScraper
+
+FIXTURES = load_article_fixtures()
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+@pytest.mark.parametrize("fixture", FIXTURES, ids=[fixture['url'] for fixture in FIXTURES])
+def test_article_extraction_from_fixture(fixture, parser):
+    """
+    Tests that every field is extracted from a recorded article page with each parser backend.
+    """
+    scraper = NewtralScraper(respect_robots=False, parser=parser)
+    article = scraper.parse_article(fixture['html'], fixture['url'])
+    expected = fixture['expected']
+
+    assert article['url'] == fixture['url']
+    assert article['title'] == expected['title']
+    assert str(article['publish_date']) == expected['publish_date']
+    assert article['verification_category'] == expected['verification_category']
+    assert article['claim'] == expected['claim']
+    assert article['claim_source'] == expected['claim_source']
+    assert article['author'] == expected['author']
+    assert article['tags'] == expected['tags']
+    assert article['content'].startswith(("Según", "Los expertos", "El informe", "Hemos", "La serie", "Además", "Fuentes", "En cualquier"))
+
+def test_category_fallback_uses_page_text():
+    """
+    Tests that the category is found in the text when the label classes are missing.
+    """
+    scraper = NewtralScraper(respect_robots=False)
+    html = """
+    <html><body>
+        <h1>Titular</h1>
+        <p>Calificamos esta afirmación como Engañoso, aunque contiene algo de Verdad a medias.</p>
+    </body></html>
+    """
+
+    article = scraper.parse_article(html, "https://www.newtral.es/ejemplo/20250101/")
+
+    assert article['title'] == "Titular"
+    assert article['verification_category'] == "Verdad a medias"
@@ -0,0 +1,57 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from apps.scraper.cache import invalidate_statistics
+from apps.scraper.models import FactCheckArticle, VerificationCategory
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Starts every test with an empty cache."""
+    cache.clear()
+    yield
+    cache.clear()
+
+def test_home_is_cached_and_supports_conditional_requests(client):
+    """
+    Tests that the home page is cached and answers 304 when the ETag matches.
+    """
+    response = client.get(reverse('home'))
+
+    assert response.status_code == 200
+    assert 'max-age=900' in response['Cache-Control']
+    assert response.has_header('ETag')
+
+    not_modified = client.get(reverse('home'), HTTP_IF_NONE_MATCH=response['ETag'])
+    assert not_modified.status_code == 304
+
+def test_analyzer_form_keeps_a_fresh_csrf_token(client):
+    """
+    Tests that the analyzer form includes the CSRF token of each request.
+    """
+    first = client.get(reverse('analyzer'))
+    second = client.get(reverse('analyzer'))
+
+    for response in (first, second):
+        assert response.status_code == 200
+        assert b'csrfmiddlewaretoken' in response.content
+        assert b'Formulario de an' in response.content
+
+@pytest.mark.django_db
+def test_statistics_are_cached_until_invalidated(client, django_assert_num_queries):
+    """
+    Tests that statistics queries only run again after the data version changes.
+    """
+    category = VerificationCategory.objects.create(name="Falso")
+    FactCheckArticle.objects.create(
+        title="Bulo", url="https://www.newtral.es/bulo/20250101/", claim="", claim_source="Redes",
+        content="", tags="['Salud']", verification_category=category
+    )
+
+    client.get(reverse('statistics'))
+    with django_assert_num_queries(0):
+        response = client.get(reverse('statistics'))
+    assert b'Salud' in response.content
+
+    invalidate_statistics()
+    with django_assert_num_queries(4):
+        client.get(reverse('statistics'))
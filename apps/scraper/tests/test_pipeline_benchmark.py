@@ -0,0 +1,28 @@
+from apps.scraper.benchmarks.pipeline import run_pipeline_benchmark
+from apps.scraper.benchmarks.utils import load_article_fixtures, load_listing_fixture
+from apps.scraper.scrapers import NewtralScraper
+
+def test_listing_links_are_extracted():
+    """
+    Tests that the article links of a recorded listing page are extracted without duplicates.
+    """
+    scraper = NewtralScraper(respect_robots=False)
+
+    urls = scraper.parse_listing(load_listing_fixture())
+
+    assert len(urls) == 12
+    assert len(set(urls)) == len(urls)
+    for fixture in load_article_fixtures():
+        assert fixture['url'] in urls
+
+def test_pipeline_benchmark_runs_offline():
+    """
+    Tests that the pipeline benchmark measures every stage against the stub server.
+    """
+    results = run_pipeline_benchmark(iterations=1, persist=False)
+
+    assert results['articles'] == 12
+    for stage in ('fetch', 'parse', 'extract'):
+        assert results['stages'][stage]['count'] == 12
+        assert results['stages'][stage]['peak_memory_kb'] > 0
+    assert results['stages']['persist'] == {'skipped': 'disabled'}
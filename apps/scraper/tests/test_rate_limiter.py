@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import urllib.robotparser
+import pytest
+from apps.scraper.utils.rate_limiter import RateLimiter, TokenBucket
+from apps.scraper.utils.robots_parser import RobotsParser
+
+class FakeClock:
+    """Manually advanced clock to make token bucket tests deterministic."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    """Provides a fake monotonic clock"""
+    return FakeClock()
+
+def test_token_bucket_allows_burst_then_spaces_requests(clock):
+    """
+    Tests that the bucket lets `capacity` requests through and then
+    asks callers to wait 1/rate seconds per extra request.
+    """
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    # After enough time the debt is paid back
+    clock.now = 2.0
+    assert bucket.reserve() == 0.0
+
+def test_rate_limiter_uses_one_bucket_per_host():
+    """
+    Tests that URLs of the same host share a bucket and other hosts do not.
+    """
+    limiter = RateLimiter(default_rate=1.0)
+
+    first = limiter.get_bucket("https://www.example.com/a")
+    second = limiter.get_bucket("https://www.example.com/b?page=2")
+    other = limiter.get_bucket("https://other.example.com/a")
+
+    assert first is second
+    assert first is not other
+
+def test_configure_host_with_crawl_delay():
+    """
+    Tests that a robots.txt crawl delay becomes the host rate with no bursts.
+    """
+    limiter = RateLimiter(default_rate=10.0, burst=5)
+    limiter.configure_host("https://www.example.com/", crawl_delay=4)
+
+    bucket = limiter.get_bucket("https://www.example.com/page")
+    assert bucket.rate == pytest.approx(0.25)
+    assert bucket.capacity == 1
+
+def test_reserve_is_thread_safe(clock):
+    """
+    Tests that concurrent reservations never hand out the same slot twice.
+    """
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+    delays = []
+    lock = threading.Lock()
+
+    def reserve():
+        delay = bucket.reserve()
+        with lock:
+            delays.append(delay)
+
+    threads = [threading.Thread(target=reserve) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(delays) == pytest.approx([float(i) for i in range(20)])
+
+def test_acquire_async_waits_for_bucket():
+    """
+    Tests that asyncio tasks are spaced out by the shared bucket.
+    """
+    limiter = RateLimiter(default_rate=50.0, burst=1)
+
+    async def run():
+        return await asyncio.gather(*[
+            limiter.acquire_async("https://www.example.com/") for _ in range(3)
+        ])
+
+    delays = asyncio.run(run())
+    assert delays[0] == 0.0
+    assert max(delays) == pytest.approx(0.04, abs=0.01)
+
+def test_robots_crawl_delay():
+    """
+    Tests that the robots parser exposes Crawl-delay and Request-rate.
+    """
+    robots_parser = RobotsParser()
+    parser = urllib.robotparser.RobotFileParser()
+    parser.parse([
+        "User-agent: slowbot",
+        "Request-rate: 1/5",
+        "",
+        "User-agent: *",
+        "Crawl-delay: 2",
+        "Disallow: /private/",
+    ])
+    robots_parser.parsers["https://www.example.com"] = parser
+    robots_parser.last_checked["https://www.example.com"] = float("inf")
+
+    assert robots_parser.crawl_delay("https://www.example.com/page") == 2.0
+    assert robots_parser.crawl_delay("https://www.example.com/page", "slowbot/1.0") == 5.0
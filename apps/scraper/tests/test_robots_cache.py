@@ -0,0 +1,81 @@
+import pytest
+from apps.scraper.utils.robots_parser import RobotsParser
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /private/\n"
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+class FakeSession:
+    """Session that answers robots.txt requests and records them"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        headers = headers or {}
+        self.requests.append((url, headers))
+        if headers.get('If-None-Match') == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, ROBOTS_TXT, {'ETag': '"v1"', 'Last-Modified': 'Mon, 17 Mar 2025 10:00:00 GMT'})
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Uses an isolated in-memory cache for the robots.txt entries"""
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'robots-tests'},
+    }
+    from django.core.cache import caches
+    caches['default'].clear()
+
+def test_robots_txt_shared_between_instances():
+    """
+    Tests that a second parser reuses the stored robots.txt without downloading it.
+    """
+    session = FakeSession()
+
+    first = RobotsParser(session=session)
+    assert first.can_fetch("https://www.example.com/page") is True
+    assert first.can_fetch("https://www.example.com/private/page") is False
+
+    second = RobotsParser(session=session)
+    assert second.can_fetch("https://www.example.com/private/page") is False
+
+    assert len(session.requests) == 1
+
+def test_expired_robots_txt_is_revalidated():
+    """
+    Tests that an expired entry is revalidated with a conditional request.
+    """
+    session = FakeSession()
+
+    first = RobotsParser(session=session)
+    first.can_fetch("https://www.example.com/page")
+
+    second = RobotsParser(session=session)
+    second.cache_expiry = -1
+    assert second.can_fetch("https://www.example.com/private/page") is False
+
+    assert len(session.requests) == 2
+    _, headers = session.requests[1]
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == 'Mon, 17 Mar 2025 10:00:00 GMT'
+
+@pytest.mark.parametrize("status_code, private_allowed", [(503, False), (404, True)])
+def test_failed_revalidation(status_code, private_allowed):
+    """
+    Tests that a server error keeps the stored rules while a missing robots.txt allows everything.
+    """
+    session = FakeSession()
+    RobotsParser(session=session).can_fetch("https://www.example.com/page")
+    session.get = lambda url, headers=None, timeout=None: FakeResponse(status_code)
+
+    parser = RobotsParser(session=session)
+    parser.cache_expiry = -1
+
+    assert parser.can_fetch("https://www.example.com/private/page") is private_allowed
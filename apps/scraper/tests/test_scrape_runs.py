@@ -0,0 +1,55 @@
+from datetime import timedelta
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from apps.scraper.models import ScrapeRun
+from apps.scraper.services import ScraperService
+from apps.scraper.utils.metrics import ScrapeMetrics
+
+@pytest.mark.django_db
+def test_run_is_saved_with_counters_and_throughput():
+    """
+    Tests that the service stores counts, throughput and counters of a run.
+    """
+    metrics = ScrapeMetrics()
+    metrics.incr('bytes_fetched', 2048)
+    metrics.incr('browser_fetches', 3)
+    metrics.incr('retries')
+    started_at = timezone.now() - timedelta(seconds=10)
+
+    run = ScraperService()._save_run('newtral', started_at, metrics, (20, 15, 3, 2))
+
+    run.refresh_from_db()
+    assert (run.total_articles, run.new_articles, run.updated_articles, run.failed_articles) == (20, 15, 3, 2)
+    assert run.articles_per_second == pytest.approx(2.0, rel=0.05)
+    assert run.bytes_fetched == 2048
+    assert run.browser_fetches == 3
+    assert run.retries == 1
+    assert run.http_fetches == 0
+    assert run.timings['counters']['bytes_fetched'] == 2048
+
+@pytest.mark.django_db
+def test_scrape_runs_api(client):
+    """
+    Tests the list and detail JSON endpoints of the scrape runs.
+    """
+    now = timezone.now()
+    old = ScrapeRun.objects.create(source='newtral', started_at=now - timedelta(days=1),
+                                   finished_at=now - timedelta(days=1) + timedelta(seconds=60),
+                                   total_articles=10, timings={'stages': {}})
+    recent = ScrapeRun.objects.create(source='newtral', started_at=now, total_articles=5,
+                                      http_cache_hits=4, http_cache_bytes_saved=81920)
+
+    response = client.get(reverse('scrape_runs_api'), {'limit': 1})
+    assert response.status_code == 200
+    runs = response.json()['runs']
+    assert [run['id'] for run in runs] == [recent.id]
+    assert (runs[0]['http_cache_hits'], runs[0]['http_cache_bytes_saved']) == (4, 81920)
+
+    detail = client.get(reverse('scrape_run_detail_api', args=[old.id])).json()
+    assert detail['total_articles'] == 10
+    assert detail['duration'] == 60
+    assert detail['timings'] == {'stages': {}}
+    assert detail['http_cache_hits'] == 0
+
+    assert client.get(reverse('scrape_runs_api'), {'limit': 'many'}).status_code == 400
@@ -0,0 +1,249 @@
+import gzip
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from django.utils import timezone as django_timezone
+from apps.scraper.models import ScrapeRun
+from apps.scraper.scrapers import NewtralScraper
+from apps.scraper.services import ScraperService
+from apps.scraper.utils.robots_parser import RobotsParser
+from apps.scraper.utils import sitemaps
+from apps.scraper.utils.sitemaps import iter_sitemap, parse_lastmod
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://www.newtral.es/post-sitemap1.xml</loc><lastmod>2025-03-20T10:00:00+00:00</lastmod></sitemap>
+  <sitemap><loc>https://www.newtral.es/post-sitemap2.xml.gz</loc><lastmod>2024-06-01T10:00:00+00:00</lastmod></sitemap>
+</sitemapindex>"""
+
+POSTS_1 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.newtral.es/antiguedad-coches-espana-factcheck/20250320/</loc><lastmod>2025-03-20T09:15:00+01:00</lastmod></url>
+  <url><loc>https://www.newtral.es/pensiones-minimas-subida-factcheck/20250212/</loc><lastmod>2025-03-01T08:00:00Z</lastmod></url>
+  <url><loc>https://www.newtral.es/entrevista-ministra/20250310/</loc><lastmod>2025-03-10</lastmod></url>
+</urlset>"""
+
+POSTS_2 = gzip.compress(b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.newtral.es/paro-juvenil-datos-epa-factcheck/20250128/</loc><lastmod>2024-05-30</lastmod></url>
+  <url><loc>https://www.newtral.es/bulo-dana-valencia-ayudas/20241107/</loc></url>
+</urlset>""")
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, content):
+        self.content = content
+
+def make_scraper(pages):
+    """Creates a scraper that serves the given sitemaps instead of fetching them."""
+    scraper = NewtralScraper(respect_robots=False)
+    scraper.fetched = []
+
+    def get_page(url, timeout=30):
+        scraper.fetched.append(url)
+        return FakeResponse(pages[url])
+
+    scraper.get_page = get_page
+    return scraper
+
+def test_sitemap_entries_are_parsed_incrementally():
+    """
+    Tests pages, child sitemaps, namespaces, gzip and lastmod parsing.
+    """
+    index = list(iter_sitemap(INDEX))
+    assert [(entry.kind, entry.loc) for entry in index] == [
+        ('sitemap', "https://www.newtral.es/post-sitemap1.xml"),
+        ('sitemap', "https://www.newtral.es/post-sitemap2.xml.gz"),
+    ]
+
+    pages = list(iter_sitemap(POSTS_2))
+    assert pages[0].lastmod == datetime(2024, 5, 30, tzinfo=timezone.utc)
+    assert pages[1].lastmod is None
+
+    assert parse_lastmod("2025-03-01T08:00:00Z") == datetime(2025, 3, 1, 8, tzinfo=timezone.utc)
+    assert parse_lastmod("ayer") is None
+
+def test_parsed_entries_are_released(monkeypatch):
+    """
+    Tests that yielded entries do not stay attached to the document root.
+    """
+    elements = []
+    iterparse = sitemaps.iterparse
+
+    def capture(source, events):
+        for event, element in iterparse(source, events):
+            elements.append(element)
+            yield event, element
+
+    monkeypatch.setattr(sitemaps, 'iterparse', capture)
+
+    assert len(list(iter_sitemap(POSTS_1))) == 3
+    # The root element is the last one to end
+    assert elements[-1].tag.endswith('urlset')
+    assert len(elements[-1]) == 0
+
+def test_discovery_follows_the_index_and_keeps_new_fact_checks():
+    """
+    Tests that only fact-check URLs are kept, newest first, without a browser.
+    """
+    scraper = make_scraper({
+        "https://www.newtral.es/sitemap_index.xml": INDEX,
+        "https://www.newtral.es/post-sitemap1.xml": POSTS_1,
+        "https://www.newtral.es/post-sitemap2.xml.gz": POSTS_2,
+    })
+
+    urls = scraper._get_sitemap_urls(limit=10)
+
+    assert urls == [
+        "https://www.newtral.es/antiguedad-coches-espana-factcheck/20250320/",
+        "https://www.newtral.es/pensiones-minimas-subida-factcheck/20250212/",
+        "https://www.newtral.es/paro-juvenil-datos-epa-factcheck/20250128/",
+        "https://www.newtral.es/bulo-dana-valencia-ayudas/20241107/",
+    ]
+    assert scraper.metrics.count('sitemaps_fetched') == 3
+    assert scraper._get_sitemap_urls(limit=1) == urls[:1]
+
+def test_discovery_skips_unchanged_articles():
+    """
+    Tests that known articles are kept only when their lastmod is after the last scrape.
+    """
+    scraper = make_scraper({
+        "https://www.newtral.es/sitemap_index.xml": INDEX,
+        "https://www.newtral.es/post-sitemap1.xml": POSTS_1,
+        "https://www.newtral.es/post-sitemap2.xml.gz": POSTS_2,
+    })
+    scraped_at = datetime(2025, 3, 5, tzinfo=timezone.utc)
+    known = {
+        "https://www.newtral.es/antiguedad-coches-espana-factcheck/20250320/": scraped_at,
+        "https://www.newtral.es/pensiones-minimas-subida-factcheck/20250212/": scraped_at,
+        "https://www.newtral.es/bulo-dana-valencia-ayudas/20241107/": scraped_at,
+    }
+
+    urls = scraper._get_sitemap_urls(limit=10, known=known)
+
+    assert urls == [
+        "https://www.newtral.es/antiguedad-coches-espana-factcheck/20250320/",
+        "https://www.newtral.es/paro-juvenil-datos-epa-factcheck/20250128/",
+    ]
+
+def test_since_skips_old_child_sitemaps():
+    """
+    Tests that child sitemaps last modified before `since` are not downloaded.
+    """
+    scraper = make_scraper({
+        "https://www.newtral.es/sitemap_index.xml": INDEX,
+        "https://www.newtral.es/post-sitemap1.xml": POSTS_1,
+    })
+
+    urls = scraper._get_sitemap_urls(limit=10, since=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert "https://www.newtral.es/post-sitemap2.xml.gz" not in scraper.fetched
+    assert len(urls) == 2
+
+def test_urls_left_by_the_limit_are_counted():
+    """
+    Tests that the fact-checks found but not returned because of the limit are counted.
+    """
+    scraper = make_scraper({
+        "https://www.newtral.es/sitemap_index.xml": INDEX,
+        "https://www.newtral.es/post-sitemap1.xml": POSTS_1,
+        "https://www.newtral.es/post-sitemap2.xml.gz": POSTS_2,
+    })
+
+    urls = scraper._get_sitemap_urls(limit=1)
+
+    assert len(urls) == 1
+    assert scraper.metrics.count('sitemap_urls_pending') == 3
+
+def create_run(minutes_ago, total=1, failed=0, **counters):
+    """Create a finished run of the Newtral scraper with the given counters."""
+    started_at = django_timezone.now() - timedelta(minutes=minutes_ago)
+    return ScrapeRun.objects.create(
+        source='newtral', started_at=started_at, finished_at=started_at + timedelta(minutes=1),
+        total_articles=total, failed_articles=failed, timings={'counters': counters}
+    )
+
+@pytest.mark.django_db
+def test_since_is_the_last_complete_sitemap_run():
+    """
+    Tests that `since` is the start of the last sitemap run that left nothing behind.
+    """
+    service = ScraperService()
+    assert service._get_sitemap_since() is None
+
+    complete = create_run(60, sitemaps_fetched=3)
+    create_run(40, total=0, sitemaps_fetched=3)
+    create_run(20, http_fetches=5)
+    assert service._get_sitemap_since() == complete.started_at
+
+    create_run(10, sitemaps_fetched=3, sitemap_urls_pending=4)
+    assert service._get_sitemap_since() is None
+
+    create_run(5, total=3, sitemaps_fetched=3, articles_skipped=1)
+    assert service._get_sitemap_since() is None
+
+@pytest.mark.django_db
+def test_service_passes_since_to_the_sitemap_discovery(settings, monkeypatch):
+    """
+    Tests that the sitemap discovery of the service only reads what changed after the last run.
+    """
+    settings.SCRAPER_HTTP_CACHE_ENABLED = False
+    settings.HTML_ARCHIVE_ENABLED = False
+    complete = create_run(60, sitemaps_fetched=3)
+    calls = []
+
+    def scrape(self, **kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(NewtralScraper, 'scrape', scrape)
+    service = ScraperService()
+
+    service.scrape_newtral(discovery='sitemap')
+    service.scrape_newtral(discovery='listing')
+
+    assert calls[0]['since'] == complete.started_at
+    assert calls[1]['since'] is None
+
+def test_discovery_over_thousands_of_urls_is_fast():
+    """
+    Tests that a sitemap with thousands of URLs is processed in well under a second.
+    """
+    entries = "".join(
+        f"<url><loc>https://www.newtral.es/bulo-{n}-factcheck/2024{n % 12 + 1:02d}01/</loc>"
+        f"<lastmod>2024-{n % 12 + 1:02d}-01</lastmod></url>"
+        for n in range(20000)
+    )
+    sitemap = f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'.encode()
+    scraper = make_scraper({"https://www.newtral.es/sitemap_index.xml": sitemap})
+
+    start = time.perf_counter()
+    urls = scraper._get_sitemap_urls(limit=100)
+    elapsed = time.perf_counter() - start
+
+    assert len(urls) == 100
+    assert all("/202412" in url for url in urls)
+    assert elapsed < 2
+
+def test_robots_sitemap_declarations(settings):
+    """
+    Tests that the sitemaps declared in robots.txt are returned.
+    """
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'sitemap-tests'},
+    }
+    parser = RobotsParser()
+    parser._get_robots_txt = lambda base_url: (
+        "User-agent: *\nDisallow: /wp-admin/\n"
+        "Sitemap: https://www.newtral.es/sitemap_index.xml\n"
+    )
+
+    assert parser.site_maps("https://www.newtral.es/") == ["https://www.newtral.es/sitemap_index.xml"]
+
+def test_unknown_discovery_backend_is_rejected():
+    """
+    Tests that scrape() refuses an unknown discovery backend.
+    """
+    with pytest.raises(ValueError):
+        NewtralScraper(respect_robots=False).scrape(limit=1, discovery='rss')
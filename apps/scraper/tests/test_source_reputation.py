@@ -0,0 +1,131 @@
+import pytest
+from apps.analyzer.services import ContentAnalysisService
+from apps.scraper import reputation
+from apps.scraper.entities import EntityResolver
+from apps.scraper.models import FactCheckArticle, SourceReputation, VerificationCategory
+from apps.scraper.reputation import SourceReputationIndex, get_source_reputation_index, refresh_source_reputation
+from apps.scraper.utils.names import canonical_source_name, normalize_name
+
+def create_articles(sources):
+    """Create one article per (claim_source, verdict) pair, linked to its canonical source."""
+    categories = {}
+    resolver = EntityResolver()
+    offset = FactCheckArticle.objects.count()
+    for i, (source, verdict) in enumerate(sources, start=offset):
+        if verdict not in categories:
+            categories[verdict], _ = VerificationCategory.objects.get_or_create(name=verdict)
+        FactCheckArticle.objects.create(
+            title=f"Artículo {i}", url=f"https://www.newtral.es/articulo-{i}/", claim="Afirmación",
+            claim_source=source, canonical_source_id=resolver.source_id(source), content="Contenido",
+            verification_category=categories[verdict]
+        )
+
+def test_names_are_normalized():
+    """
+    Tests that spelling variants and aliases of a source share one name.
+    """
+    assert normalize_name("PSOE") == normalize_name(" Psoe ") == "psoe"
+    assert normalize_name("El País") == "el pais"
+    assert normalize_name("Maldita.es") == "maldita es"
+    assert normalize_name(None) == ""
+    assert canonical_source_name("Partido Popular") == canonical_source_name("PP") == "pp"
+    assert canonical_source_name("Partido Socialista Obrero Español") == "psoe"
+
+@pytest.mark.django_db
+def test_reputation_is_aggregated_by_canonical_name(django_assert_max_num_queries):
+    """
+    Tests that the table counts the verdicts of each canonical source with one aggregate query.
+    """
+    create_articles([
+        ("PSOE", "Falso"), ("Psoe ", "Engañoso"), ("Partido Socialista", "Verdadero"),
+        ("PSOE", "Sin categoría"), ("Vox", "Verdad a medias"), ("", "Falso"),
+    ])
+
+    # Aggregate query, delete and insert, plus the transaction savepoints
+    with django_assert_max_num_queries(5):
+        assert refresh_source_reputation() == 2
+
+    psoe = SourceReputation.objects.select_related('source').get(source__name="psoe")
+    assert str(psoe) == "PSOE"
+    assert (psoe.total_articles, psoe.credible_articles, psoe.dubious_articles) == (4, 1, 2)
+    assert psoe.credibility == pytest.approx(2 / 5)
+    assert SourceReputation.objects.get(source__name="vox").credible_articles == 1
+
+    # Rebuilding replaces the previous rows
+    assert refresh_source_reputation() == 2
+
+@pytest.mark.django_db
+def test_index_lookup_folds_aliases():
+    """
+    Tests that the in-memory index finds a source by any of its spellings.
+    """
+    create_articles([("Partido Popular", "Falso")])
+    refresh_source_reputation()
+
+    index = SourceReputationIndex.load()
+
+    assert len(index) == 1
+    assert index.lookup("PP").dubious_articles == 1
+    assert index.lookup(" partido  popular ").source.name == "pp"
+    assert index.lookup("Vox") is None
+
+@pytest.fixture
+def fresh_index(monkeypatch):
+    """Forget the index loaded by previous tests."""
+    monkeypatch.setattr(reputation, '_index', None)
+
+@pytest.mark.django_db
+def test_index_reloads_after_the_table_is_rebuilt(fresh_index, monkeypatch, django_assert_num_queries):
+    """
+    Tests that the index is reused between checks and reloaded when another process rebuilds the table.
+    """
+    index = get_source_reputation_index()
+    with django_assert_num_queries(0):
+        assert get_source_reputation_index() is index
+
+    # A scrape in another process rebuilds the table without touching this process' caches
+    create_articles([("Vox", "Falso")])
+    refresh_source_reputation()
+    assert get_source_reputation_index() is index
+
+    monkeypatch.setattr(reputation, 'RELOAD_CHECK_INTERVAL', 0)
+    assert get_source_reputation_index().lookup("VOX").dubious_articles == 1
+
+    # Unchanged table: one aggregate query and no reload
+    index = get_source_reputation_index()
+    with django_assert_num_queries(1):
+        assert get_source_reputation_index() is index
+
+@pytest.mark.django_db
+def test_analyzer_scores_sources_with_their_record(fresh_index):
+    """
+    Tests that the analyzer scores fact-checked sources by their verdicts and others by the known lists.
+    """
+    create_articles([("Vox", "Falso"), ("Vox", "Falso"), ("Vox", "Engañoso"), ("PSOE", "Verdadero")])
+    refresh_source_reputation()
+    service = ContentAnalysisService()
+
+    vox = service._analyze_source("vox")
+    psoe = service._analyze_source("Partido Socialista")
+
+    assert vox['score'] == 20
+    assert '100% de afirmaciones falsas' in vox['feedback']
+    assert psoe['score'] == 67
+    assert service._analyze_source("Reuters") == {'score': 80, 'feedback': 'Fuente reconocida'}
+    assert service._analyze_source("TikTok")['score'] == 30
+    assert service._analyze_source("Diario local")['score'] == 60
+
+@pytest.mark.django_db
+def test_known_outlets_are_found_inside_compound_sources(fresh_index):
+    """
+    Tests that sources never fact-checked get the prior of the known outlets they mention.
+    """
+    service = ContentAnalysisService()
+
+    assert service._analyze_source("Reuters España")['score'] == 80
+    assert service._analyze_source("según El Pais")['feedback'] == 'Fuente reconocida'
+    assert service._analyze_source("Un vídeo de TikTok")['score'] == 30
+    # Mentions of both lists add up
+    assert service._analyze_source("Reuters en Twitter") == {
+        'score': 50, 'feedback': 'Fuente reconocida | Fuente con historial de desinformación'
+    }
@@ -0,0 +1,35 @@
+import gzip
+from django.core.files.storage import FileSystemStorage
+from core.storage import CompressedManifestStaticFilesStorage
+
+def test_collectstatic_writes_hashed_and_compressed_files(tmp_path):
+    """
+    Tests that text assets get a fingerprinted name and a smaller gzip sibling.
+    """
+    source_dir = tmp_path / 'src'
+    (source_dir / 'js').mkdir(parents=True)
+    (source_dir / 'img').mkdir()
+    script = ("console.log('The Critical Lens');\n" * 50).encode()
+    (source_dir / 'js' / 'app.js').write_bytes(script)
+    (source_dir / 'js' / 'tiny.js').write_bytes(b"let a = 1;")
+    (source_dir / 'img' / 'logo.png').write_bytes(b"\x89PNG" + bytes(1024))
+
+    source = FileSystemStorage(location=source_dir)
+    storage = CompressedManifestStaticFilesStorage(location=tmp_path / 'static', base_url='/static/')
+    paths = {}
+    for name in ('js/app.js', 'js/tiny.js', 'img/logo.png'):
+        with source.open(name) as f:
+            storage.save(name, f)
+        paths[name] = (source, name)
+
+    processed = list(storage.post_process(paths))
+
+    hashed = {name: hashed_name for name, hashed_name, _ in processed}
+    assert hashed['js/app.js'] != 'js/app.js'
+    with storage.open(hashed['js/app.js'] + '.gz') as f:
+        compressed = f.read()
+    assert gzip.decompress(compressed) == script
+    assert len(compressed) < len(script)
+    # Too small or not a text asset
+    assert not storage.exists(hashed['js/tiny.js'] + '.gz')
+    assert not storage.exists(hashed['img/logo.png'] + '.gz')
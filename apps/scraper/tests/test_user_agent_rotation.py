@@ -1,5 +1,6 @@
 import pytest
-from apps.scraper.utils.user_agents import UserAgentManager
+from apps.scraper.utils import user_agents
+from apps.scraper.utils.user_agents import UserAgentManager, _build_pool, get_user_agent_pool
 from apps.scraper.scrapers import BaseScraper
 
 @pytest.fixture
@@ -63,4 +64,49 @@ def test_user_agent_in_request(base_scraper):
         print(f"\nUserr-Agent recibido por el servidor: {current_ua}")
     except Exception as e:
         pytest.skip(f"Test omitido por error de conexión: {e}")
-    
\ No newline at end of file
+    
+def test_user_agent_pool_is_shared_and_split_by_device():
+    """
+    Tests that the pool is loaded once per process and split into desktop and mobile agents.
+    """
+    pool = get_user_agent_pool()
+
+    assert get_user_agent_pool() is pool
+    assert isinstance(pool.all, tuple)
+    assert pool.desktop and pool.mobile
+    assert len(pool.all) == len(pool.desktop) + len(pool.mobile)
+    assert UserAgentManager().get_desktop_user_agent() in pool.desktop
+    assert UserAgentManager().get_mobile_user_agent() in pool.mobile
+
+def test_pinned_user_agent_is_kept_for_the_session():
+    """
+    Tests that a pinned scraper keeps its user agent until the pin is reset.
+    """
+    scraper = BaseScraper("https://httpbin.org", name="PinnedScraper", pin_user_agent=True)
+    pinned_ua = scraper.session.headers['User-Agent']
+
+    for _ in range(5):
+        assert scraper.rotate_user_agent() == pinned_ua
+
+    scraper.user_agent_manager.reset_pin()
+    assert scraper.user_agent_manager.pinned_user_agent is None
+
+def test_user_agents_are_picked_by_popularity(monkeypatch):
+    """
+    Tests that user agents are drawn with their popularity weights and that repeated ones add up.
+    """
+    pool = _build_pool([
+        ("Desktop common", False, 0.6),
+        ("Desktop common", False, 0.4),
+        ("Desktop unused", False, 0.0),
+        ("Tablet", True, 0.5),
+        ("Phone unused", True, 0.0),
+    ])
+    monkeypatch.setattr(user_agents, '_pool', pool)
+    manager = UserAgentManager()
+
+    assert pool.desktop == ("Desktop common", "Desktop unused")
+    assert pool.all_cum_weights == (1.0, 1.0, 1.5, 1.5)
+    assert {manager.get_desktop_user_agent() for _ in range(50)} == {"Desktop common"}
+    assert {manager.get_mobile_user_agent() for _ in range(50)} == {"Tablet"}
+    assert {manager.get_random_user_agent() for _ in range(100)} == {"Desktop common", "Tablet"}
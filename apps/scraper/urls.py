@@ -3,4 +3,8 @@ from . import views
 
 urlpatterns = [
     path('statistics/', views.statistics, name='statistics'),
+    path('articles/', views.articles, name='articles'),
+    path('api/articles/', views.articles_api, name='articles_api'),
+    path('api/scrape-runs/', views.scrape_runs_api, name='scrape_runs_api'),
+    path('api/scrape-runs/<int:run_id>/', views.scrape_run_detail_api, name='scrape_run_detail_api'),
 ]
\ No newline at end of file
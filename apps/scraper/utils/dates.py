@@ -0,0 +1,155 @@
+import logging
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
+logger = logging.getLogger(__name__)
+
+SPANISH_MONTHS = {
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4,
+    "mayo": 5, "junio": 6, "julio": 7, "agosto": 8,
+    "septiembre": 9, "setiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12
+}
+
+# Patterns compiled once, in the order they are tried
+URL_DATE_PATTERN = re.compile(r'/(\d{4})(\d{2})(\d{2})/')  # Newtral URLs: /YYYYMMDD/
+SPANISH_DATE_PATTERN = re.compile(r'(\d{1,2})\s+de\s+(\w+)(?:\s+de\s+|\s+)(\d{4})', re.IGNORECASE)
+ISO_DATE_PATTERN = re.compile(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})')
+
+# Distinct strings remembered by the memo cache
+CACHE_SIZE = 4096
+
+def normalize_date(value):
+    """
+    Normalize a date found in a Newtral page or URL into a date.
+
+    Args:
+        value: date, datetime or string containing a date (a URL with /YYYYMMDD/,
+            "20 de marzo de 2025", "2025-03-20"...)
+
+    Returns:
+        datetime.date or None if no date is found
+    """
+    if not value:
+        return None
+
+    # Convert datetime to date
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    if not isinstance(value, str):
+        value = str(value)
+    return _parse_date_string(value.strip())
+
+def normalize_dates(values):
+    """
+    Normalize a whole column of dates at once.
+
+    Each distinct value is parsed a single time, which suits lists with many
+    repetitions such as the dates of a listing page or a database column.
+
+    Args:
+        values (iterable): Values accepted by normalize_date
+
+    Returns:
+        list: Dates (or None) in the same order as `values`
+    """
+    values = list(values)
+    parsed = {}
+    results = []
+    for value in values:
+        try:
+            result = parsed[value]
+        except KeyError:
+            result = parsed[value] = normalize_date(value)
+        except TypeError:
+            # Unhashable values are parsed on their own
+            result = normalize_date(value)
+        results.append(result)
+    return results
+
+def _parse_date_string(text):
+    """
+    Parse a date string with the known formats, then with dateutil.
+
+    Only the known formats are memoized. dateutil fills the parts missing
+    from the text (e.g. the year of "20 de marzo") with the current date, so
+    a cached result would go stale in long-running workers.
+
+    Args:
+        text (str): Stripped string containing a date
+
+    Returns:
+        datetime.date or None if parsing fails
+    """
+    return _parse_known_formats(text) or _parse_with_dateutil(text)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_known_formats(text):
+    """
+    Parse a date string with the known formats, most specific first.
+
+    Args:
+        text (str): Stripped string containing a date
+
+    Returns:
+        datetime.date or None if no known format matches
+    """
+    match = URL_DATE_PATTERN.search(text)
+    if match:
+        result = _build_date(*match.groups())
+        if result:
+            return result
+
+    match = SPANISH_DATE_PATTERN.search(text)
+    if match:
+        month = SPANISH_MONTHS.get(match.group(2).lower())
+        if month:
+            result = _build_date(match.group(3), month, match.group(1))
+            if result:
+                return result
+
+    match = ISO_DATE_PATTERN.search(text)
+    if match:
+        result = _build_date(*match.groups())
+        if result:
+            return result
+
+    return None
+
+def _parse_with_dateutil(text):
+    """
+    Parse a date string with dateutil as a last resort.
+
+    Args:
+        text (str): Stripped string containing a date
+
+    Returns:
+        datetime.date or None if parsing fails
+    """
+    if dateutil_parser is not None:
+        try:
+            return dateutil_parser.parse(text).date()
+        except (ValueError, OverflowError, TypeError):
+            pass
+
+    logger.debug(f"Could not parse date: {text[:100]}")
+    return None
+
+def _build_date(year, month, day):
+    """Build a date from its parts, or None if they are out of range."""
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+def clear_cache():
+    """Empty the memo cache (used by the benchmarks to measure cold parsing)."""
+    _parse_known_formats.cache_clear()
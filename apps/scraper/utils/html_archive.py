@@ -0,0 +1,207 @@
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# zstandard is optional: without it pages are compressed with gzip
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Page of the archive index
+ArchivedPage = namedtuple('ArchivedPage', ['url', 'fetched_at', 'digest', 'codec', 'size'])
+
+def compress(data, codec):
+    """
+    Compress bytes with a codec of the archive.
+
+    Args:
+        data (bytes): Data to compress
+        codec (str): 'zst' or 'gz'
+
+    Returns:
+        bytes: Compressed data
+    """
+    if codec == 'zst':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+def decompress(data, codec):
+    """
+    Decompress bytes written by compress().
+
+    Args:
+        data (bytes): Compressed data
+        codec (str): 'zst' or 'gz'
+
+    Returns:
+        bytes: Original data
+    """
+    if codec == 'zst':
+        if zstandard is None:
+            raise RuntimeError("The archive has zstd pages but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+def object_path(root, digest, codec):
+    """
+    Get the path of a compressed page body in an archive.
+
+    Args:
+        root (str): Directory of the archive
+        digest (str): SHA-256 of the page
+        codec (str): 'zst' or 'gz'
+
+    Returns:
+        str: Path of the object file
+    """
+    return os.path.join(root, 'objects', digest[:2], f"{digest[2:]}.html.{codec}")
+
+def load_page(root, page):
+    """
+    Read the HTML of an archived page without opening the index.
+
+    Used by the re-extraction worker processes, which only need the objects.
+
+    Args:
+        root (str): Directory of the archive
+        page (ArchivedPage): Entry of the index
+
+    Returns:
+        str: Page source
+    """
+    with open(object_path(root, page.digest, page.codec), 'rb') as f:
+        return decompress(f.read(), page.codec).decode('utf-8')
+
+class HtmlArchive:
+    """
+    Compressed, content-addressed archive of the raw HTML of fetched pages.
+
+    Each page body is stored once, compressed, in a file named after the
+    SHA-256 of its content (`objects/ab/cdef...html.zst`), so a page that has
+    not changed between runs costs no extra space. A SQLite index records
+    every fetch by URL and time and points to the body, which lets fields be
+    re-extracted offline after a selector is fixed.
+    """
+
+    def __init__(self, root=os.path.join("archive", "html"), codec=None):
+        """
+        Initialize the archive.
+
+        Args:
+            root (str): Directory of the archive (created if needed).
+            codec (str, optional): 'zst' or 'gz'. Defaults to zstd when zstandard is
+                installed, gzip otherwise.
+        """
+        self.root = root
+        self.codec = codec or ('zst' if zstandard is not None else 'gz')
+        if self.codec == 'zst' and zstandard is None:
+            raise ValueError("The 'zst' codec needs the zstandard package")
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(root, 'index.sqlite3'), check_same_thread=False, timeout=30)
+        with self.lock, self.connection:
+            # WAL lets the re-extraction read while a scrape writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    digest TEXT NOT NULL,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS pages_url_fetched_at ON pages (url, fetched_at)"
+            )
+
+    def store(self, url, html, fetched_at=None):
+        """
+        Archive the HTML of a fetched page.
+
+        Args:
+            url (str): URL of the page
+            html (str): Page source
+            fetched_at (float, optional): Fetch time as a Unix timestamp. Defaults to now.
+
+        Returns:
+            str: SHA-256 digest of the page
+        """
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = object_path(self.root, digest, self.codec)
+
+        # Identical pages share one object
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary_path, 'wb') as f:
+                f.write(compress(data, self.codec))
+            os.replace(temporary_path, path)
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO pages (url, fetched_at, digest, codec, size) VALUES (?, ?, ?, ?, ?)",
+                (url, fetched_at or time.time(), digest, self.codec, len(data))
+            )
+        return digest
+
+    def load(self, page):
+        """
+        Read the HTML of an archived page.
+
+        Args:
+            page (ArchivedPage): Entry of the index
+
+        Returns:
+            str: Page source
+        """
+        return load_page(self.root, page)
+
+    def latest(self, url):
+        """
+        Get the most recent fetch of a URL.
+
+        Args:
+            url (str): URL of the page
+
+        Returns:
+            ArchivedPage: Entry of the index, or None if the URL was never archived
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT url, fetched_at, digest, codec, size FROM pages "
+                "WHERE url = ? ORDER BY fetched_at DESC LIMIT 1", (url,)
+            ).fetchone()
+        return ArchivedPage(*row) if row else None
+
+    def latest_pages(self):
+        """
+        Get the most recent fetch of every archived URL.
+
+        Returns:
+            list: ArchivedPage entries ordered by URL
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT url, fetched_at, digest, codec, size FROM ("
+                "SELECT url, fetched_at, digest, codec, size, "
+                "ROW_NUMBER() OVER (PARTITION BY url ORDER BY fetched_at DESC) AS position FROM pages"
+                ") WHERE position = 1 ORDER BY url"
+            ).fetchall()
+        return [ArchivedPage(*row) for row in rows]
+
+    def close(self):
+        """Close the index connection."""
+        with self.lock:
+            self.connection.close()
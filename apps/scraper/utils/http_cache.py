@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+class HttpCache:
+    """
+    On-disk HTTP cache for pages fetched by the scrapers.
+
+    Responses that carry an `ETag` or `Last-Modified` header are stored in a
+    SQLite database. Later requests for the same URL are made conditional and,
+    when the server answers 304 Not Modified, the stored body is returned
+    instead of downloading the page again. The store has a size limit and
+    evicts the least recently used pages first. The total size of the bodies
+    is kept in a one-row table so writes do not have to add it up again.
+    """
+
+    def __init__(self, path=os.path.join("cache", "http_cache.sqlite3"), max_bytes=200 * 1024 * 1024):
+        """
+        Initialize the HTTP cache.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            max_bytes (int): Maximum total size of the stored bodies.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.stats = {
+            'hits': 0,         # 304 responses served from the cache
+            'misses': 0,       # Full responses downloaded
+            'stores': 0,       # Responses added or replaced
+            'evictions': 0,    # Responses removed to respect max_bytes
+            'bytes_saved': 0,  # Body bytes not downloaded thanks to 304s
+        }
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self.lock, self.connection:
+            # WAL lets several scraper processes read while one writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    headers TEXT NOT NULL,
+                    encoding TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    total_size INTEGER NOT NULL
+                )
+            """)
+            # The only full scan: resync the total in case an older version wrote the store
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache_meta (id, total_size) "
+                "SELECT 1, COALESCE(SUM(size), 0) FROM responses"
+            )
+
+    def conditional_headers(self, url):
+        """
+        Build the validation headers for a URL that is already cached.
+
+        Args:
+            url (str): URL that is about to be requested
+
+        Returns:
+            dict: `If-None-Match`/`If-Modified-Since` headers, empty if the URL is not cached
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, last_modified FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+
+        headers = {}
+        if row:
+            etag, last_modified = row
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get_response(self, url, not_modified=None):
+        """
+        Build a response from the stored copy of a URL.
+
+        Args:
+            url (str): Cached URL
+            not_modified (requests.Response, optional): The 304 response received from
+                the server, used to count the hit and refresh the stored validators.
+
+        Returns:
+            requests.Response: Response with status 200 and the cached body, or None
+                               if the URL is not cached
+        """
+        now = time.time()
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                "SELECT headers, encoding, body, size FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            if not_modified is not None:
+                etag = not_modified.headers.get('ETag')
+                if etag:
+                    self.connection.execute("UPDATE responses SET etag = ? WHERE url = ?", (etag, url))
+                self.stats['hits'] += 1
+                self.stats['bytes_saved'] += row[3]
+
+        headers, encoding, body, _ = row
+
+        response = Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = encoding
+        response._content = bytes(body)
+        response.from_cache = True
+        return response
+
+    def store(self, url, response):
+        """
+        Store a response if it can be revalidated later.
+
+        Args:
+            url (str): Requested URL
+            response (requests.Response): Successful response
+
+        Returns:
+            bool: True if the response was stored
+        """
+        with self.lock:
+            self.stats['misses'] += 1
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return False
+
+        # Bodies are stored decoded, so transfer headers no longer apply
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+        }
+
+        now = time.time()
+        with self.lock, self.connection:
+            # Updating the total first takes the write lock before the old size is read
+            self.connection.execute(
+                "UPDATE cache_meta SET total_size = total_size + ? - "
+                "COALESCE((SELECT size FROM responses WHERE url = ?), 0) WHERE id = 1",
+                (len(body), url)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, headers, encoding, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(headers), response.encoding,
+                 sqlite3.Binary(body), len(body), now, now)
+            )
+            self.stats['stores'] += 1
+            self._evict()
+
+        return True
+
+    def _evict(self):
+        """Remove least recently used responses until the store fits in max_bytes."""
+        total = self._total_size()
+        if total <= self.max_bytes:
+            return
+
+        rows = self.connection.execute("SELECT url, size FROM responses ORDER BY accessed_at ASC")
+        to_delete = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            to_delete.append((url,))
+            total -= size
+
+        self.connection.executemany("DELETE FROM responses WHERE url = ?", to_delete)
+        self.connection.execute("UPDATE cache_meta SET total_size = ? WHERE id = 1", (total,))
+        self.stats['evictions'] += len(to_delete)
+        logger.debug(f"Evicted {len(to_delete)} responses from the HTTP cache")
+
+    def size(self):
+        """Return the total size in bytes of the stored bodies."""
+        with self.lock:
+            return self._total_size()
+
+    def _total_size(self):
+        """Read the running total of the stored body sizes."""
+        return self.connection.execute("SELECT total_size FROM cache_meta WHERE id = 1").fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.connection.close()
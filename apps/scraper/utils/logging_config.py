@@ -1,84 +1,197 @@
 import os
+import json
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-def configure_logging(log_dir="logs", log_level=logging.INFO):
+# Listener that writes the queued records, one per process
+_listener = None
+_listener_lock = threading.Lock()
+
+class JsonFormatter(logging.Formatter):
     """
-    Configure logging system for the scraper.
-    
+    Formats log records as one JSON object per line.
+    """
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only one of every `every` records of a noisy message.
+
+    Records above `max_level` always pass. Records are grouped by the line of
+    code that logged them, so a debug line inside a loop is sampled without
+    hiding other messages.
+    """
+
+    def __init__(self, every=100, max_level=logging.DEBUG, name=''):
+        """
+        Initialize the filter.
+
+        Args:
+            every (int): Keep one record of every `every` with the same message.
+            max_level (int): Highest level that is sampled.
+            name (str): Logger name passed to logging.Filter.
+        """
+        super().__init__(name)
+        self.every = max(1, int(every))
+        self.max_level = max_level
+        self.counts = {}
+        # Handlers are called from every thread that logs
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > self.max_level or not super().filter(record):
+            return True
+        key = (record.pathname, record.lineno)
+        with self.lock:
+            count = self.counts.get(key, 0)
+            self.counts[key] = count + 1
+        return count % self.every == 0
+
+def build_handlers(log_dir="logs", log_level=logging.INFO, json_format=False):
+    """
+    Build the handlers that write the log records.
+
     Args:
         log_dir (str): Directory to store log files
         log_level: Minimum log level to capture
-        
+        json_format (bool): Whether files are written as JSON lines
+
     Returns:
-        logging.Logger: Configured logger for the scraper
+        list: File, error file and console handlers
     """
-    try:
-        # Create logs directory if it doesn't exist
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Configure the root logger
-        root_logger = logging.getLogger()
-        root_logger.setLevel(log_level)
-        
-        # Remove existing handlers to avoid duplicates
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-        
-        # Create formatters
+    # Create logs directory if it doesn't exist
+    os.makedirs(log_dir, exist_ok=True)
+
+    # Create formatters
+    if json_format:
+        file_formatter = JsonFormatter()
+    else:
         file_formatter = logging.Formatter(
           '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        console_formatter = logging.Formatter(
-          '%(asctime)s - %(levelname)s - %(message)s'
-        )
+    console_formatter = logging.Formatter(
+      '%(asctime)s - %(levelname)s - %(message)s'
+    )
 
-        # Configure file handler with rotation (10MB files, keep 5 backups)
-        file_handler = RotatingFileHandler(
-            os.path.join(log_dir, 'scraper.log'),
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(file_formatter)
-
-        # Configure error log separately
-        error_handler = RotatingFileHandler(
-            os.path.join(log_dir, 'scraper_error.log'),
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_formatter)
+    # Configure file handler with rotation (10MB files, keep 5 backups)
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, 'scraper.log'),
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setLevel(log_level)
+    file_handler.setFormatter(file_formatter)
+
+    # Configure error log separately
+    error_handler = RotatingFileHandler(
+        os.path.join(log_dir, 'scraper_error.log'),
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5
+    )
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(file_formatter)
+
+    # Configure console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(console_formatter)
+
+    return [file_handler, error_handler, console_handler]
+
+def build_queue_handler(log_dir="logs", log_level=logging.INFO, json_format=False):
+    """
+    Build a handler that hands records to a background thread.
+
+    Logging calls only put the record in a queue; the file and console I/O
+    happens in a QueueListener thread, so it does not add latency to the code
+    that logs. The listener is started once per process and stopped at exit.
+    It can be used as a handler factory ('()') in Django's LOGGING setting.
+
+    Args:
+        log_dir (str): Directory to store log files
+        log_level: Minimum log level to capture (a level name or number)
+        json_format (bool): Whether files are written as JSON lines
+
+    Returns:
+        logging.handlers.QueueHandler: Handler attached to the running listener
+    """
+    global _listener
+
+    with _listener_lock:
+        if _listener is None:
+            handlers = build_handlers(log_dir, log_level, json_format)
+            _listener = QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+            _listener.start()
+            atexit.register(stop_logging)
+        return QueueHandler(_listener.queue)
 
-        # Configure console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(console_formatter)
+def stop_logging():
+    """Stop the listener thread after writing the records still in the queue."""
+    global _listener
 
-        # Add handlers to root logger
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(error_handler)
-        root_logger.addHandler(console_handler)
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+def configure_logging(log_dir="logs", log_level=logging.INFO, json_format=False):
+    """
+    Configure logging system for the scraper.
+
+    Attaches a queue handler to the root logger. Calling it again does
+    nothing if the root logger already sends records to the listener (for
+    example, when Django configured it from the LOGGING setting).
+
+    Args:
+        log_dir (str): Directory to store log files
+        log_level: Minimum log level to capture
+        json_format (bool): Whether files are written as JSON lines
+
+    Returns:
+        logging.Logger: Configured logger for the scraper
+    """
+    root_logger = logging.getLogger()
+    scraper_logger = logging.getLogger('apps.scraper')
+
+    if any(isinstance(handler, QueueHandler) for handler in root_logger.handlers):
+        return scraper_logger
+
+    try:
+        root_logger.setLevel(log_level)
+        root_logger.addHandler(build_queue_handler(log_dir, log_level, json_format))
 
         # Configure specific logger for our package
-        scraper_logger = logging.getLogger('apps.scraper')
         scraper_logger.setLevel(log_level)
-        
+
         # Log a success message to verify configuration
         scraper_logger.info("Logging system initialized successfully")
-        
+
         return scraper_logger
-    
+
     except Exception as e:
         # Fallback to basic configuration if there's any error
         print(f"Error configuring logging system: {e}")
         print("Falling back to basic configuration")
-        
+
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[logging.StreamHandler()]
         )
-        
-        return logging.getLogger('apps.scraper')
\ No newline at end of file
+
+        return scraper_logger
@@ -0,0 +1,153 @@
+import logging
+import statistics
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (in milliseconds) of the histogram buckets of every stage
+HISTOGRAM_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+def percentile(samples, pct):
+    """
+    Get a percentile of a list of samples (nearest-rank method).
+
+    Args:
+        samples (list): Measured values
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: Value at the percentile
+    """
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+def _bucket_label(index):
+    """Get the label of a histogram bucket."""
+    if index < len(HISTOGRAM_BUCKETS_MS):
+        return f"<={HISTOGRAM_BUCKETS_MS[index]}ms"
+    return f">{HISTOGRAM_BUCKETS_MS[-1]}ms"
+
+class ScrapeMetrics:
+    """
+    Collects timing spans for the stages of a scrape run.
+
+    Each span records how long a stage (browser startup, page load, parsing,
+    database writes...) took and, optionally, the URL it belongs to. Spans are
+    aggregated into a report with totals, percentiles and histograms by stage
+    and the slowest URLs. Counters (bytes fetched, retries...) are kept next
+    to the spans. It can be shared between threads.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Initialize an empty set of measurements.
+
+        Args:
+            clock (callable): Function returning the current time in seconds.
+        """
+        self.clock = clock
+        self.started = clock()
+        self.durations = {}  # Stage -> list of durations in seconds
+        self.url_durations = {}  # URL -> {stage: accumulated seconds}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage, url=None):
+        """
+        Measure the duration of a block of code.
+
+        The span is recorded even if the block raises an exception.
+
+        Args:
+            stage (str): Name of the stage being measured.
+            url (str, optional): URL the work belongs to.
+        """
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(stage, self.clock() - start, url)
+
+    def record(self, stage, seconds, url=None):
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            stage (str): Name of the stage.
+            seconds (float): Duration in seconds.
+            url (str, optional): URL the work belongs to.
+        """
+        with self._lock:
+            self.durations.setdefault(stage, []).append(seconds)
+            if url:
+                stages = self.url_durations.setdefault(url, {})
+                stages[stage] = stages.get(stage, 0) + seconds
+
+    def incr(self, counter, amount=1):
+        """
+        Increase a counter.
+
+        Args:
+            counter (str): Name of the counter.
+            amount (int): Amount to add.
+        """
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def count(self, counter):
+        """Get the current value of a counter (0 if it was never increased)."""
+        with self._lock:
+            return self.counters.get(counter, 0)
+
+    def report(self, slowest=10):
+        """
+        Aggregate the recorded spans.
+
+        Args:
+            slowest (int): Number of slowest URLs to include.
+
+        Returns:
+            dict: Elapsed time, a summary and histogram by stage, the slowest URLs
+                and the counters
+        """
+        with self._lock:
+            durations = {stage: list(samples) for stage, samples in self.durations.items()}
+            url_durations = {url: dict(stages) for url, stages in self.url_durations.items()}
+            counters = dict(self.counters)
+
+        stages = {}
+        for stage, samples in durations.items():
+            histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+            for seconds in samples:
+                histogram[bisect_left(HISTOGRAM_BUCKETS_MS, seconds * 1000)] += 1
+
+            stages[stage] = {
+                'count': len(samples),
+                'total_s': round(sum(samples), 3),
+                'mean_ms': round(statistics.fmean(samples) * 1000, 1),
+                'p50_ms': round(percentile(samples, 50) * 1000, 1),
+                'p99_ms': round(percentile(samples, 99) * 1000, 1),
+                'max_ms': round(max(samples) * 1000, 1),
+                'histogram': {_bucket_label(i): count for i, count in enumerate(histogram) if count},
+            }
+
+        slowest_urls = sorted(url_durations.items(), key=lambda item: sum(item[1].values()), reverse=True)
+
+        return {
+            'elapsed_s': round(self.clock() - self.started, 3),
+            'stages': dict(sorted(stages.items(), key=lambda item: item[1]['total_s'], reverse=True)),
+            'slowest_urls': [
+                {
+                    'url': url,
+                    'total_s': round(sum(url_stages.values()), 3),
+                    'stages': {stage: round(seconds, 3) for stage, seconds in url_stages.items()},
+                }
+                for url, url_stages in slowest_urls[:slowest]
+            ],
+            'counters': counters,
+        }
@@ -0,0 +1,56 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+# Runs of characters that are not letters or digits
+SEPARATOR_PATTERN = re.compile(r'[\W_]+', re.UNICODE)
+
+# Common alternative names of the same source, by normalized name
+SOURCE_ALIASES = {
+    'partido popular': 'pp',
+    'partido socialista': 'psoe',
+    'partido socialista obrero espanol': 'psoe',
+    'unidas podemos': 'podemos',
+    'agencia efe': 'efe',
+    'associated press': 'ap',
+    'the associated press': 'ap',
+    'agence france presse': 'afp',
+    'radiotelevision espanola': 'rtve',
+    'x': 'twitter',
+    'x antes twitter': 'twitter',
+    'twitter x': 'twitter',
+}
+
+@lru_cache(maxsize=4096)
+def normalize_name(value):
+    """
+    Normalize the name of a source or author so spelling variants compare equal.
+
+    Case, accents, punctuation and repeated spaces are ignored:
+    "PSOE", "Psoe" and " psoe " all become "psoe", "El País" becomes "el pais".
+
+    Args:
+        value (str): Name as written in the article
+
+    Returns:
+        str: Normalized name ('' for empty values)
+    """
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', value.casefold())
+    without_accents = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return SEPARATOR_PATTERN.sub(' ', without_accents).strip()
+
+def canonical_source_name(value, aliases=SOURCE_ALIASES):
+    """
+    Get the normalized name of a source, folding its known aliases.
+
+    Args:
+        value (str): Source as written in the article
+        aliases (dict): Canonical name by normalized alias
+
+    Returns:
+        str: Canonical normalized name ("Partido Popular" -> "pp")
+    """
+    name = normalize_name(value)
+    return aliases.get(name, name)
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    Token bucket that controls the request rate for a single host.
+
+    Tokens are refilled continuously at `rate` tokens per second up to
+    `capacity`. Each request takes one token; when the bucket is empty the
+    caller is told how long to wait before its turn comes.
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (int): Maximum number of tokens (allowed burst size).
+            clock (callable): Monotonic clock, replaceable for testing.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take one token, borrowing from the future if the bucket is empty.
+
+        Reserving under the lock and sleeping outside of it lets threads and
+        asyncio tasks share the same bucket without holding the lock while
+        they wait.
+
+        Returns:
+            float: Seconds the caller must wait before making the request.
+        """
+        with self.lock:
+            now = self.clock()
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def set_rate(self, rate, capacity=None):
+        """
+        Change the refill rate of the bucket.
+
+        Args:
+            rate (float): New tokens added per second.
+            capacity (int, optional): New maximum number of tokens.
+        """
+        with self.lock:
+            self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+                self.tokens = min(self.tokens, capacity)
+
+
+class RateLimiter:
+    """
+    Per-host rate limiter built on token buckets.
+
+    A single instance is meant to be shared by every scraper in the process
+    (see `RateLimiter.shared()`), so that parallel scrapers hitting the same
+    host add up to the allowed rate instead of multiplying it.
+    """
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, default_rate=1.0, burst=1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            default_rate (float): Requests per second allowed for hosts
+                                  without a more specific configuration.
+            burst (int): Number of requests that can be made back to back.
+        """
+        self.default_rate = default_rate
+        self.burst = burst
+        self.buckets = {}  # Token buckets by host
+        self.lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        Return the process-wide rate limiter, creating it on first use.
+
+        Returns:
+            RateLimiter: The shared instance.
+        """
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+
+    def _get_host(self, url):
+        """
+        Extract the host used as bucket key from a URL.
+
+        Args:
+            url (str): URL or bare host name
+
+        Returns:
+            str: Host name (e.g., 'www.example.com')
+        """
+        return urlparse(url).netloc or url
+
+    def get_bucket(self, url):
+        """
+        Get the token bucket for the host of a URL, creating it if needed.
+
+        Args:
+            url (str): URL or bare host name
+
+        Returns:
+            TokenBucket: Bucket for the host.
+        """
+        host = self._get_host(url)
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            with self.lock:
+                bucket = self.buckets.get(host)
+                if bucket is None:
+                    bucket = TokenBucket(self.default_rate, self.burst)
+                    self.buckets[host] = bucket
+        return bucket
+
+    def has_bucket(self, url):
+        """Check whether the host of a URL has already been configured."""
+        return self._get_host(url) in self.buckets
+
+    def configure_host(self, url, rate=None, crawl_delay=None):
+        """
+        Set the allowed request rate for a host.
+
+        Args:
+            url (str): URL or bare host name
+            rate (float, optional): Requests per second.
+            crawl_delay (float, optional): Seconds between requests, as given
+                                           by robots.txt `Crawl-delay`. Takes
+                                           precedence over `rate`.
+        """
+        bucket = self.get_bucket(url)
+        if crawl_delay:
+            rate = 1.0 / float(crawl_delay)
+            # A crawl delay asks for spaced requests, so bursts are not allowed
+            bucket.set_rate(rate, capacity=1)
+        elif rate:
+            bucket.set_rate(rate)
+        else:
+            return
+
+        logger.info(f"Rate limit for {self._get_host(url)} set to {rate:.3f} requests/s")
+
+    def acquire(self, url):
+        """
+        Block the current thread until a request to the URL's host is allowed.
+
+        Args:
+            url (str): URL that is about to be requested
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        delay = self.get_bucket(url).reserve()
+        if delay > 0:
+            logger.debug(f"Rate limit reached for {self._get_host(url)}. Waiting {delay:.2f}s")
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url):
+        """
+        Wait without blocking the event loop until a request is allowed.
+
+        Args:
+            url (str): URL that is about to be requested
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        delay = self.get_bucket(url).reserve()
+        if delay > 0:
+            logger.debug(f"Rate limit reached for {self._get_host(url)}. Waiting {delay:.2f}s")
+            await asyncio.sleep(delay)
+        return delay
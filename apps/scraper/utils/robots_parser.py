@@ -13,19 +13,34 @@ class RobotsParser:
     
     This class manages downloading and parsing robots.txt files,
     and implements caching to avoid repeated downloads.
+    
+    Downloaded robots.txt files are stored in the Django cache (the 'scraper'
+    alias when configured), so they are shared by every scraper, process and
+    run. Expired entries are revalidated with ETag/If-Modified-Since instead
+    of being downloaded again.
     """
     
-    def __init__(self, default_user_agent="*"):
+    # Fallback store used when Django settings are not available
+    _local_cache = {}
+    
+    def __init__(self, default_user_agent="*", session=None, cache_alias="scraper"):
         """
         Initialize the robots.txt parser.
         
         Args:
             default_user_agent (str): Default user-agent to use when none is specified.
+            session (requests.Session, optional): Session used to download robots.txt.
+                                                 Scrapers pass their own pooled session.
+            cache_alias (str): Django cache alias where robots.txt files are stored.
+                              Falls back to the default cache if it does not exist.
         """
         self.parsers = {}  # Cache of parsers by domain
         self.default_user_agent = default_user_agent
         self.cache_expiry = 3600  # Cache expiration time in seconds (1 hour)
         self.last_checked = {}  # Record of last check by domain
+        self.session = session or requests.Session()
+        self.cache_alias = cache_alias
+        self.cache_timeout = 7 * 24 * 3600  # Keep entries for revalidation (1 week)
     
     def _get_base_url(self, url):
         """
@@ -40,29 +55,140 @@ class RobotsParser:
         parsed_url = urlparse(url)
         return f"{parsed_url.scheme}://{parsed_url.netloc}"
     
-    def _fetch_robots_txt(self, base_url):
+    def _get_cache(self):
+        """
+        Get the Django cache used to share robots.txt files.
+        
+        Returns:
+            BaseCache: Django cache, or None if Django is not configured
+        """
+        try:
+            from django.core.cache import caches
+            from django.core.cache.backends.base import InvalidCacheBackendError
+            try:
+                return caches[self.cache_alias]
+            except InvalidCacheBackendError:
+                return caches['default']
+        except Exception as e:
+            logger.debug(f"Django cache not available for robots.txt, using process cache: {e}")
+            return None
+    
+    def _get_cache_key(self, base_url):
+        """Build the cache key for the robots.txt of a domain."""
+        return f"robots_txt:{base_url}"
+    
+    def _load_entry(self, base_url):
+        """
+        Load the stored robots.txt entry for a domain.
+        
+        Args:
+            base_url (str): Base URL of the site
+            
+        Returns:
+            dict: Stored entry or None if there is none
+        """
+        key = self._get_cache_key(base_url)
+        cache = self._get_cache()
+        if cache is None:
+            return self._local_cache.get(key)
+        
+        try:
+            return cache.get(key)
+        except Exception as e:
+            logger.warning(f"Error reading robots.txt cache for {base_url}: {e}")
+            return None
+    
+    def _store_entry(self, base_url, entry):
+        """
+        Store the robots.txt entry for a domain.
+        
+        Args:
+            base_url (str): Base URL of the site
+            entry (dict): Entry to store
+        """
+        key = self._get_cache_key(base_url)
+        cache = self._get_cache()
+        if cache is None:
+            self._local_cache[key] = entry
+            return
+        
+        try:
+            cache.set(key, entry, self.cache_timeout)
+        except Exception as e:
+            logger.warning(f"Error writing robots.txt cache for {base_url}: {e}")
+    
+    def _fetch_robots_txt(self, base_url, cached_entry=None):
         """
         Download the robots.txt file for a domain.
         
+        If a previous entry is given, the request is made conditional so the
+        server can answer 304 Not Modified and the stored content is reused.
+        The stored content is also kept when the server fails (5xx or network
+        error); only a 4xx answer means there are no rules.
+        
         Args:
             base_url (str): Base URL of the site (e.g., 'https://www.example.com')
+            cached_entry (dict, optional): Previously stored entry to revalidate
             
         Returns:
-            str: Content of the robots.txt file or None if it could not be obtained
+            dict: Entry with the robots.txt 'content' (None if it could not be obtained),
+                  'etag', 'last_modified' and 'checked_at'
         """
         robots_url = f"{base_url}/robots.txt"
+        headers = {}
+        if cached_entry:
+            if cached_entry.get('etag'):
+                headers['If-None-Match'] = cached_entry['etag']
+            if cached_entry.get('last_modified'):
+                headers['If-Modified-Since'] = cached_entry['last_modified']
+        
         try:
             logger.info(f"Downloading robots.txt from {robots_url}")
-            response = requests.get(robots_url, timeout=10)
+            response = self.session.get(robots_url, headers=headers, timeout=10)
+            
+            if response.status_code == 304 and cached_entry:
+                logger.info(f"robots.txt from {robots_url} not modified, reusing cached copy")
+                return dict(cached_entry, checked_at=time.time())
             
             if response.status_code == 200:
-                return response.text
+                return {
+                    'content': response.text,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'checked_at': time.time(),
+                }
             else:
                 logger.warning(f"Could not get robots.txt from {robots_url}. Status code: {response.status_code}")
-                return None
+                if response.status_code >= 500 and cached_entry:
+                    # A server error does not mean the rules are gone (RFC 9309): only 4xx allows everything
+                    return cached_entry
         except RequestException as e:
             logger.warning(f"Error downloading robots.txt from {robots_url}: {e}")
-            return None
+            if cached_entry:
+                # Keep using the stale copy rather than assuming everything is allowed
+                return cached_entry
+        
+        return {'content': None, 'etag': None, 'last_modified': None, 'checked_at': time.time()}
+    
+    def _get_robots_txt(self, base_url):
+        """
+        Get the robots.txt content for a domain, from the shared cache when possible.
+        
+        Args:
+            base_url (str): Base URL of the site
+            
+        Returns:
+            str: Content of the robots.txt file or None if it could not be obtained
+        """
+        entry = self._load_entry(base_url)
+        
+        if entry is None or time.time() - entry.get('checked_at', 0) > self.cache_expiry:
+            entry = self._fetch_robots_txt(base_url, entry)
+            self._store_entry(base_url, entry)
+        else:
+            logger.debug(f"Using cached robots.txt for {base_url}")
+        
+        return entry.get('content')
     
     def _create_parser(self, base_url):
         """
@@ -77,8 +203,8 @@ class RobotsParser:
         parser = urllib.robotparser.RobotFileParser()
         parser.set_url(f"{base_url}/robots.txt")
         
-        # Try to get the robots.txt content directly
-        robots_content = self._fetch_robots_txt(base_url)
+        # Try to get the robots.txt content from the cache or the site
+        robots_content = self._get_robots_txt(base_url)
         
         if robots_content:
             # If we get the content, parse it directly
@@ -91,21 +217,16 @@ class RobotsParser:
             empty_parser.allow_all = True
             return empty_parser
     
-    def can_fetch(self, url, user_agent=None):
+    def _get_parser(self, url):
         """
-        Check if accessing a URL is allowed according to robots.txt.
+        Get the parser for the domain of a URL, downloading robots.txt if needed.
         
         Args:
-            url (str): Complete URL to verify
-            user_agent (str, optional): User-agent for verification.
-                                      If None, the default_user_agent is used.
+            url (str): Complete URL
             
         Returns:
-            bool: True if access is allowed, False otherwise
+            urllib.robotparser.RobotFileParser: Parser for the domain
         """
-        if user_agent is None:
-            user_agent = self.default_user_agent
-            
         base_url = self._get_base_url(url)
         
         # Check if we need to create or update the parser for this domain
@@ -118,12 +239,76 @@ class RobotsParser:
             self.parsers[base_url] = self._create_parser(base_url)
             self.last_checked[base_url] = current_time
         
+        return self.parsers[base_url]
+    
+    def can_fetch(self, url, user_agent=None):
+        """
+        Check if accessing a URL is allowed according to robots.txt.
+        
+        Args:
+            url (str): Complete URL to verify
+            user_agent (str, optional): User-agent for verification.
+                                      If None, the default_user_agent is used.
+            
+        Returns:
+            bool: True if access is allowed, False otherwise
+        """
+        if user_agent is None:
+            user_agent = self.default_user_agent
+        
         # Check if access is allowed
-        parser = self.parsers[base_url]
+        parser = self._get_parser(url)
         if parser.allow_all:
             return True
             
         can_access = parser.can_fetch(user_agent, url)
         logger.debug(f"Robots.txt verification for {url} with user-agent '{user_agent}': {'allowed' if can_access else 'not allowed'}")
         
-        return can_access
\ No newline at end of file
+        return can_access
+    
+    def crawl_delay(self, url, user_agent=None):
+        """
+        Get the delay between requests requested by robots.txt for a domain.
+        
+        Uses `Crawl-delay` when present, otherwise derives it from `Request-rate`.
+        
+        Args:
+            url (str): Complete URL of the domain
+            user_agent (str, optional): User-agent to look up.
+                                      If None, the default_user_agent is used.
+            
+        Returns:
+            float: Seconds between requests, or None if robots.txt sets no limit
+        """
+        if user_agent is None:
+            user_agent = self.default_user_agent
+        
+        parser = self._get_parser(url)
+        if parser.allow_all:
+            return None
+        
+        delay = parser.crawl_delay(user_agent)
+        if delay:
+            return float(delay)
+        
+        request_rate = parser.request_rate(user_agent)
+        if request_rate and request_rate.requests:
+            return request_rate.seconds / request_rate.requests
+        
+        return None
+    
+    def site_maps(self, url):
+        """
+        Get the sitemaps declared in robots.txt for a domain.
+        
+        Args:
+            url (str): Complete URL of the domain
+            
+        Returns:
+            list: Sitemap URLs from the `Sitemap` directives, empty if there are none
+        """
+        parser = self._get_parser(url)
+        if parser.allow_all:
+            return []
+        
+        return list(parser.site_maps() or [])
@@ -0,0 +1,100 @@
+import gzip
+import io
+import logging
+from collections import namedtuple
+from datetime import datetime, timezone
+from xml.etree.ElementTree import iterparse
+
+logger = logging.getLogger(__name__)
+
+# Entry of a sitemap: a page ('url') or a child sitemap of an index ('sitemap')
+SitemapEntry = namedtuple('SitemapEntry', ['kind', 'loc', 'lastmod'])
+
+# First bytes of a gzip stream (sitemap.xml.gz)
+GZIP_MAGIC = b'\x1f\x8b'
+
+def parse_lastmod(value):
+    """
+    Parse a sitemap <lastmod> value (W3C datetime) into an aware datetime.
+
+    Args:
+        value (str): "2025-03-20", "2025-03-20T09:15:00+01:00", "2025-03-20T08:15:00Z"...
+
+    Returns:
+        datetime or None if the value is missing or malformed. Values without a
+            time zone are taken as UTC.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.endswith(('Z', 'z')):
+        value = value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        logger.debug(f"Invalid sitemap lastmod: {value[:50]}")
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def iter_sitemap(content):
+    """
+    Parse a sitemap or sitemap index incrementally.
+
+    Elements are read one <url>/<sitemap> at a time with iterparse and
+    removed from the root as soon as they are yielded, so the document tree
+    is never built: besides the downloaded body (which the HTTP cache needs
+    whole, and which the protocol caps at 50 MB uncompressed), parsing
+    memory does not grow with the number of URLs.
+
+    Args:
+        content (bytes): Sitemap XML, optionally gzip-compressed
+
+    Yields:
+        SitemapEntry: Pages and child sitemaps in document order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not valid XML.
+    """
+    stream = io.BytesIO(content)
+    if content[:2] == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+
+    root = None
+    loc = lastmod = None
+    for event, element in iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            continue
+        # Ignore the namespace: {http://www.sitemaps.org/schemas/sitemap/0.9}loc
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag == 'loc':
+            loc = (element.text or '').strip()
+        elif tag == 'lastmod':
+            lastmod = parse_lastmod(element.text)
+        elif tag in ('url', 'sitemap'):
+            if loc:
+                yield SitemapEntry(tag, loc, lastmod)
+            loc = lastmod = None
+            # Cleared elements would otherwise stay attached to the root
+            root.clear()
+
+def is_newer(entry, known):
+    """
+    Check whether a sitemap page is new or changed since it was last scraped.
+
+    Args:
+        entry (SitemapEntry): Page of the sitemap
+        known (dict): Datetime of the last scrape by URL
+
+    Returns:
+        bool: True if the URL is unknown or its lastmod is after the last scrape
+    """
+    scraped_at = known.get(entry.loc)
+    if scraped_at is None:
+        return True
+    return entry.lastmod is not None and entry.lastmod > scraped_at
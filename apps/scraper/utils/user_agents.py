@@ -1,57 +1,141 @@
 # apps/scraper/utils/user_agents.py
+import itertools
 import logging
 import random
-from fake_useragent import UserAgent
+import threading
+from collections import namedtuple
 
 logger = logging.getLogger(__name__)
 
+# Fallback user agents in case the fake_useragent data cannot be loaded
+FALLBACK_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
+)
+
+# Immutable user agent strings split by device type, with their cumulative popularity weights
+UserAgentPool = namedtuple('UserAgentPool', [
+    'desktop', 'mobile', 'all', 'desktop_cum_weights', 'mobile_cum_weights', 'all_cum_weights',
+])
+
+# Pool shared by every UserAgentManager of the process, loaded on first use
+_pool = None
+_pool_lock = threading.Lock()
+
+def _build_pool(user_agents):
+    """
+    Build a pool from (user agent, is mobile, weight) triples, merging duplicates.
+
+    Args:
+        user_agents (iterable): (user agent string, is mobile, popularity weight) triples.
+            The weights of repeated user agents are added up.
+
+    Returns:
+        UserAgentPool: The pool
+    """
+    desktop, mobile = {}, {}
+    for user_agent, is_mobile, weight in user_agents:
+        group = mobile if is_mobile else desktop
+        group[user_agent] = group.get(user_agent, 0) + weight
+
+    desktop_cum_weights = tuple(itertools.accumulate(desktop.values()))
+    mobile_cum_weights = tuple(itertools.accumulate(mobile.values()))
+    desktop_total = desktop_cum_weights[-1] if desktop_cum_weights else 0
+    return UserAgentPool(
+        desktop=tuple(desktop),
+        mobile=tuple(mobile),
+        all=tuple(desktop) + tuple(mobile),
+        desktop_cum_weights=desktop_cum_weights,
+        mobile_cum_weights=mobile_cum_weights,
+        all_cum_weights=desktop_cum_weights + tuple(desktop_total + weight for weight in mobile_cum_weights),
+    )
+
+def _load_pool():
+    """
+    Load the user agents bundled with fake_useragent, or the fallback ones.
+
+    Each user agent is weighted by its `percent` share in the fake_useragent
+    data, so common browsers are picked more often. Tablets count as mobile.
+
+    Returns:
+        UserAgentPool: The pool
+    """
+    try:
+        from fake_useragent.utils import load
+        pool = _build_pool(
+            (entry['useragent'], entry['type'] != 'desktop', entry.get('percent') or 0.0)
+            for entry in load()
+            if entry.get('useragent')
+        )
+        # random.choices needs a positive total weight in each group
+        if pool.desktop and pool.mobile and pool.desktop_cum_weights[-1] > 0 and pool.mobile_cum_weights[-1] > 0:
+            logger.info(f"UserAgent pool loaded: {len(pool.desktop)} desktop, {len(pool.mobile)} mobile")
+            return pool
+        logger.warning("UserAgent data has no desktop or mobile user agents. Using fallback user agents.")
+    except Exception as e:
+        logger.warning(f"Failed to load UserAgent data: {e}. Using fallback user agents.")
+
+    return _build_pool((user_agent, 'Mobile' in user_agent, 1.0) for user_agent in FALLBACK_USER_AGENTS)
+
+def get_user_agent_pool():
+    """
+    Get the user agent pool of the process, loading it the first time.
+
+    Returns:
+        UserAgentPool: Tuples of desktop, mobile and all user agents, with their weights
+    """
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _load_pool()
+    return _pool
+
 class UserAgentManager:
     """
     Manages a collection of user agents for web scraping to help avoid detection.
-    
+
     This class provides methods to get random user agents and rotate between them.
+    All managers share one pool that is loaded the first time a user agent is
+    requested, so creating a manager is free.
     """
-    
-    def __init__(self):
-        """Initialize the user agent manager with a UserAgent instance and fallbacks."""
-        # Fallback user agents in case UserAgent() fails
-        self.fallback_user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36',
-            'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
-        ]
-        
-        # Try to initialize fake_useragent, with graceful fallback
-        try:
-            self.ua = UserAgent()
-            self.use_library = True
-            logger.info("UserAgent library initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to initialize UserAgent library: {e}. Using fallback user agents.")
-            self.use_library = False
-    
+
+    def __init__(self, pin=False):
+        """
+        Initialize the user agent manager.
+
+        Args:
+            pin (bool): Whether to keep returning the first random user agent, so a
+                whole browser session presents a single identity.
+        """
+        self.pin = pin
+        self.pinned_user_agent = None
+
     def get_random_user_agent(self):
-        """Get a random user agent string."""
-        if self.use_library:
-            try:
-                return self.ua.random
-            except Exception as e:
-                logger.warning(f"Error getting random user agent from library: {e}. Using fallback.")
-                
-        # Use fallback if library fails or isn't available
-        return random.choice(self.fallback_user_agents)
-    
+        """Get a random user agent string (the pinned one if pinning is enabled)."""
+        if self.pinned_user_agent:
+            return self.pinned_user_agent
+
+        pool = get_user_agent_pool()
+        user_agent = random.choices(pool.all, cum_weights=pool.all_cum_weights)[0]
+        if self.pin:
+            self.pinned_user_agent = user_agent
+        return user_agent
+
     def get_desktop_user_agent(self):
         """Get a user agent for desktop browsers."""
-        if self.use_library:
-            try:
-                agents = [self.ua.chrome, self.ua.firefox, self.ua.edge, self.ua.safari]
-                return random.choice([agent for agent in agents if callable(agent)])()
-            except Exception as e:
-                logger.warning(f"Error getting desktop user agent: {e}. Using fallback.")
-        
-        # Use desktop-specific fallback agents
-        desktop_agents = [ua for ua in self.fallback_user_agents if 'Mobile' not in ua]
-        return random.choice(desktop_agents or self.fallback_user_agents)
\ No newline at end of file
+        pool = get_user_agent_pool()
+        return random.choices(pool.desktop, cum_weights=pool.desktop_cum_weights)[0]
+
+    def get_mobile_user_agent(self):
+        """Get a user agent for mobile browsers (phones and tablets)."""
+        pool = get_user_agent_pool()
+        return random.choices(pool.mobile, cum_weights=pool.mobile_cum_weights)[0]
+
+    def reset_pin(self):
+        """Forget the pinned user agent, so the next session gets a new one."""
+        self.pinned_user_agent = None
@@ -1,8 +1,12 @@
-from django.shortcuts import render
+from django.shortcuts import render, get_object_or_404
+from django.http import JsonResponse
+from django.core.cache import cache
 from django.db.models import Count
 import ast
 import json
-from apps.scraper.models import FactCheckArticle
+from apps.scraper.models import ClaimSource, FactCheckArticle, ScrapeRun
+from apps.scraper.cache import get_statistics_version, get_statistics_timeout
+from apps.scraper.pagination import KeysetPaginator, InvalidCursor
 from django.utils import timezone
 
 def get_verification_stats(total_articles):
@@ -37,18 +41,25 @@ def get_source_stats(total_articles):
     Returns:
         List of dictionaries with source stats (limited to top 10)
     """
-    # Get top 10 sources directly
-    distribution = list(FactCheckArticle.objects.values(
-        'claim_source'
+    # Get top 10 sources, grouped by the integer key of the canonical source
+    top_sources = list(FactCheckArticle.objects.filter(
+        canonical_source__isnull=False
+    ).values(
+        'canonical_source'
     ).annotate(
         count=Count('id')
     ).order_by('-count')[:10])
+    names = ClaimSource.objects.in_bulk([item['canonical_source'] for item in top_sources])
     
     # Calculate percentages directly
-    for item in distribution:
-        item['percentage'] = round((item['count'] / total_articles) * 100, 1)
-    
-    return distribution
+    return [
+        {
+            'claim_source': names[item['canonical_source']].display_name,
+            'count': item['count'],
+            'percentage': round((item['count'] / total_articles) * 100, 1)
+        }
+        for item in top_sources
+    ]
 
 def get_tag_stats(total_articles):
     """
@@ -79,10 +90,12 @@ def get_tag_stats(total_articles):
     distribution.sort(key=lambda x: x['count'], reverse=True)
     return distribution[:15]  # Top 15 tags
 
-def statistics(request):
+def get_statistics_context():
     """
-    View for displaying statistics about fact-checked articles.
-    Renders the statistics template with data for visualization.
+    Build the template context of the statistics page.
+    
+    Returns:
+        Dictionary with the article count, the distributions and the chart data as JSON
     """
     # We assume there are always articles available
     total_articles = FactCheckArticle.objects.count()
@@ -112,12 +125,133 @@ def statistics(request):
         }
     }
     
-    context = {
+    return {
         'total_articles': total_articles,
         'verification_distribution': verification_distribution,
         'source_distribution': source_distribution,
         'tags_distribution': tags_distribution,
         'chart_data_json': json.dumps(chart_data)
     }
+
+def statistics(request):
+    """
+    View for displaying statistics about fact-checked articles.
+    Renders the statistics template with data for visualization.
+    
+    The statistics are cached under the current statistics version, which
+    changes when a scrape saves new articles, so the queries only run again
+    after new data arrives (or when the cache expires).
+    """
+    version = get_statistics_version()
+    cache_key = f"statistics:context:{version}"
     
-    return render(request, 'statistics.html', context)
\ No newline at end of file
+    context = cache.get(cache_key)
+    if context is None:
+        context = get_statistics_context()
+        cache.set(cache_key, context, get_statistics_timeout())
+    
+    context = dict(context, stats_version=version, stats_cache_timeout=get_statistics_timeout())
+    return render(request, 'statistics.html', context)
+
+# Fields of a scrape run exposed by the JSON API
+SCRAPE_RUN_FIELDS = (
+    'id', 'source', 'started_at', 'finished_at', 'total_articles', 'new_articles',
+    'updated_articles', 'failed_articles', 'articles_per_second', 'bytes_fetched',
+    'retries', 'robots_denials', 'browser_fetches', 'http_fetches', 'http_cache_hits',
+    'http_cache_bytes_saved',
+)
+
+def scrape_runs_api(request):
+    """
+    JSON list of the latest scrape runs, most recent first.
+
+    Accepts the optional `source` and `limit` (1-500, default 50) query parameters.
+    Timing reports are only included in the detail endpoint.
+    """
+    try:
+        limit = min(max(int(request.GET.get('limit', 50)), 1), 500)
+    except ValueError:
+        return JsonResponse({'error': 'limit must be an integer'}, status=400)
+
+    runs = ScrapeRun.objects.order_by('-started_at')
+    if request.GET.get('source'):
+        runs = runs.filter(source=request.GET['source'])
+
+    return JsonResponse({'runs': list(runs.values(*SCRAPE_RUN_FIELDS)[:limit])})
+
+def scrape_run_detail_api(request, run_id):
+    """
+    JSON detail of a scrape run, including its timing report.
+    """
+    run = get_object_or_404(ScrapeRun, pk=run_id)
+    data = {field: getattr(run, field) for field in SCRAPE_RUN_FIELDS}
+    data['duration'] = run.duration
+    data['timings'] = run.timings
+    return JsonResponse(data)
+
+# Columns loaded for the article lists (content and claim are large text fields)
+ARTICLE_LIST_FIELDS = (
+    'id', 'title', 'url', 'publish_date', 'claim_source', 'author', 'verification_category__name',
+)
+
+def get_article_page(request):
+    """
+    Get a page of articles from the `cursor`, `per_page` (1-100) and `category` query parameters.
+    
+    Raises:
+        InvalidCursor: If the cursor or the page size are not valid.
+    """
+    try:
+        per_page = min(max(int(request.GET.get('per_page', 20)), 1), 100)
+    except ValueError:
+        raise InvalidCursor("per_page must be an integer")
+    
+    articles = FactCheckArticle.objects.select_related('verification_category').only(*ARTICLE_LIST_FIELDS)
+    category = request.GET.get('category')
+    if category:
+        articles = articles.filter(verification_category__name=category)
+    
+    return KeysetPaginator(articles, per_page=per_page).get_page(request.GET.get('cursor'))
+
+def articles(request):
+    """
+    View for browsing the fact-checked articles, most recent first.
+    """
+    try:
+        page = get_article_page(request)
+    except InvalidCursor:
+        return render(request, 'articles.html', {'articles': [], 'invalid_cursor': True}, status=400)
+    
+    context = {
+        'articles': page['articles'],
+        'next_cursor': page['next_cursor'],
+        'category': request.GET.get('category', ''),
+        'is_first_page': not request.GET.get('cursor'),
+    }
+    return render(request, 'articles.html', context)
+
+def articles_api(request):
+    """
+    JSON list of fact-checked articles, most recent first.
+    
+    The response includes `next_cursor`, which is passed as the `cursor`
+    parameter to get the next page (null on the last page).
+    """
+    try:
+        page = get_article_page(request)
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    results = [
+        {
+            'id': article.id,
+            'title': article.title,
+            'url': article.url,
+            'publish_date': article.publish_date,
+            'claim_source': article.claim_source,
+            'author': article.author,
+            'verification_category': article.verification_category.name if article.verification_category else None,
+        }
+        for article in page['articles']
+    ]
+    return JsonResponse({'results': results, 'next_cursor': page['next_cursor']})
@@ -0,0 +1,72 @@
+"""
+Configuración de producción.
+
+Parte de la configuración general y desactiva DEBUG, reutiliza las conexiones
+a PostgreSQL entre peticiones y configura una caché compartida por todos los
+workers. Se activa con DJANGO_SETTINGS_MODULE=core.production_settings.
+"""
+import os
+from .settings import *  # noqa: F401,F403
+
+SECRET_KEY = os.getenv('SECRET_KEY', SECRET_KEY)
+
+# DEBUG guarda en memoria cada consulta SQL y desactiva la caché de plantillas
+DEBUG = os.getenv('DEBUG', 'False') == 'True'
+
+# Database
+# Conexiones persistentes: cada worker reutiliza su conexión durante
+# DB_CONN_MAX_AGE segundos en lugar de abrir una nueva por petición, y se
+# comprueba que sigue viva antes de usarla tras un reinicio de PostgreSQL.
+DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Cache
+# CACHE_BACKEND elige el backend de la caché por defecto:
+#   - 'file' (por defecto): compartida por los workers de una misma máquina
+#   - 'locmem': memoria de cada proceso, sin dependencias
+#   - 'redis': compartida entre máquinas (necesita `pip install redis` y REDIS_URL)
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'file')
+CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', '300'))
+
+if CACHE_BACKEND == 'redis':
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL', 'redis://redis:6379/1'),
+        'TIMEOUT': CACHE_TIMEOUT,
+    }
+elif CACHE_BACKEND == 'locmem':
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'critical-lens',
+        'TIMEOUT': CACHE_TIMEOUT,
+    }
+elif CACHE_BACKEND == 'file':
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_DIR', os.path.join(BASE_DIR, 'cache', 'default')),
+        'TIMEOUT': CACHE_TIMEOUT,
+    }
+else:
+    raise ValueError(f"CACHE_BACKEND desconocido: {CACHE_BACKEND} (usa 'file', 'locmem' o 'redis')")
+
+# Las sesiones se leen de la caché y solo se escriben en la base de datos al cambiar
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# django-browser-reload solo tiene sentido en desarrollo
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != 'django_browser_reload']
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE
+    if middleware != 'django_browser_reload.middleware.BrowserReloadMiddleware'
+]
+
+# Static files
+# collectstatic genera nombres con hash del contenido y copias .gz/.br de los
+# archivos de texto; nginx los sirve comprimidos y con caché de larga duración.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'core.storage.CompressedManifestStaticFilesStorage',
+    },
+}
@@ -42,6 +42,8 @@ TAILWIND_APP_NAME = 'theme'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Answers 304 Not Modified when the page has not changed (ETag/Last-Modified)
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -130,6 +132,74 @@ STATICFILES_DIRS = [
 # La configuración de STATIC_ROOT es fundamental para collectstatic
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Shared by every scraper process and run (robots.txt rules, etc.)
+    'scraper': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('SCRAPER_CACHE_DIR', os.path.join(BASE_DIR, 'cache', 'scraper')),
+    },
+}
+
+# Logging
+# https://docs.djangoproject.com/en/5.1/topics/logging/
+# Los registros se encolan y un hilo en segundo plano los escribe en disco,
+# para que el logging no añada latencia a los bucles de descarga.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        # Solo se conserva uno de cada LOG_DEBUG_SAMPLING mensajes DEBUG de cada línea
+        'sample_debug': {
+            '()': 'apps.scraper.utils.logging_config.SamplingFilter',
+            'every': int(os.getenv('LOG_DEBUG_SAMPLING', '100')),
+        },
+    },
+    'handlers': {
+        'queue': {
+            '()': 'apps.scraper.utils.logging_config.build_queue_handler',
+            'log_dir': os.getenv('LOG_DIR', os.path.join(BASE_DIR, 'logs')),
+            'log_level': os.getenv('LOG_LEVEL', 'INFO'),
+            'json_format': os.getenv('LOG_JSON', 'False') == 'True',
+            'filters': ['sample_debug'],
+        },
+    },
+    'root': {
+        'handlers': ['queue'],
+        'level': os.getenv('LOG_LEVEL', 'INFO'),
+    },
+}
+
+# Segundos que se guardan en caché los datos de la página de estadísticas.
+# Además se invalidan cada vez que una extracción guarda artículos.
+STATISTICS_CACHE_TIMEOUT = int(os.getenv('STATISTICS_CACHE_TIMEOUT', '3600'))
+
+# Caché HTTP de las páginas descargadas: las peticiones siguientes son condicionales
+# (If-None-Match / If-Modified-Since) y las respuestas 304 se sirven desde la copia guardada.
+SCRAPER_HTTP_CACHE_ENABLED = os.getenv('SCRAPER_HTTP_CACHE_ENABLED', 'True') == 'True'
+SCRAPER_HTTP_CACHE_PATH = os.getenv('SCRAPER_HTTP_CACHE_PATH', os.path.join(BASE_DIR, 'cache', 'http_cache.sqlite3'))
+SCRAPER_HTTP_CACHE_MAX_BYTES = int(os.getenv('SCRAPER_HTTP_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+
+# Descarga asíncrona de artículos (scrape_newtral --async-fetch): peticiones por
+# segundo y ráfaga del limitador por host, y peticiones simultáneas como máximo.
+# Un Crawl-delay de robots.txt sigue teniendo prioridad sobre esta tasa.
+SCRAPER_ASYNC_RATE = float(os.getenv('SCRAPER_ASYNC_RATE', '4'))
+SCRAPER_ASYNC_BURST = int(os.getenv('SCRAPER_ASYNC_BURST', '4'))
+SCRAPER_ASYNC_CONCURRENCY = int(os.getenv('SCRAPER_ASYNC_CONCURRENCY', '8'))
+
+# Archivo del HTML de los artículos descargados, comprimido y direccionado por
+# contenido, para volver a extraer los campos sin conexión (manage.py reextract).
+HTML_ARCHIVE_ENABLED = os.getenv('HTML_ARCHIVE_ENABLED', 'True') == 'True'
+HTML_ARCHIVE_DIR = os.getenv('HTML_ARCHIVE_DIR', os.path.join(BASE_DIR, 'archive', 'html'))
+
+# Modelo de credibilidad entrenado con los veredictos guardados
+# (manage.py train_credibility_model). Si no existe, el analizador usa sus heurísticas.
+CREDIBILITY_MODEL_PATH = os.getenv('CREDIBILITY_MODEL_PATH', os.path.join(BASE_DIR, 'models', 'credibility.npy'))
+
 # Cargar configuración adicional para Docker si existe
 try:
     from .docker_settings import *
@@ -0,0 +1,78 @@
+import gzip
+import logging
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+logger = logging.getLogger(__name__)
+
+# brotli is optional: without it only gzip siblings are generated
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Static files storage with content-hashed names and precompressed copies.
+
+    On top of the fingerprinted files of ManifestStaticFilesStorage (e.g.
+    `analyzer.3f2a1b9c8d7e.js`), collectstatic writes a `.gz` sibling (and a
+    `.br` one when brotli is installed) of every text asset, so the web server
+    can send them without compressing on each request. Hashed names never
+    change their content, so they can be cached by browsers forever.
+    """
+
+    # Extensions of the files worth compressing (images and fonts already are)
+    compressible_extensions = ('.css', '.js', '.svg', '.json', '.map', '.txt', '.html', '.xml')
+
+    # Smaller files do not gain anything from compression
+    min_compress_size = 256
+
+    def post_process(self, paths, dry_run=False, **options):
+        hashed_files = {}
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed_files[name] = hashed_name
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+
+        for hashed_name in hashed_files.values():
+            if hashed_name.endswith(self.compressible_extensions):
+                self.compress(hashed_name)
+
+    def compress(self, name):
+        """
+        Write the compressed siblings of a stored file.
+
+        Args:
+            name (str): Name of the file in the storage
+
+        Returns:
+            list: Names of the compressed files written
+        """
+        with self.open(name) as f:
+            content = f.read()
+        if len(content) < self.min_compress_size:
+            return []
+
+        # mtime=0 keeps the output identical between runs
+        compressors = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            compressors.append(('.br', lambda data: brotli.compress(data, quality=11)))
+
+        written = []
+        for suffix, compress in compressors:
+            compressed = compress(content)
+            # Only keep the copy if it is smaller than the original
+            if len(compressed) >= len(content):
+                continue
+            compressed_name = name + suffix
+            if self.exists(compressed_name):
+                self.delete(compressed_name)
+            self._save(compressed_name, ContentFile(compressed))
+            written.append(compressed_name)
+
+        logger.debug(f"Compressed {name}: {', '.join(written) or 'no gain'}")
+        return written